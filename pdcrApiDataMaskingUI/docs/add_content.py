@@ -1,62 +1,56 @@
+import sys
+
 from docx import Document
-from docx.shared import Pt, RGBColor
+from docx.shared import RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
-# Open the existing document
-doc = Document(r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\Technical_Architecture.docx")
+from docx_helpers import DocHelpers
+from docx_validate import PARTIAL_CHECKS, check
+from output_paths import output_file, save_document
 
-def add_section(title, level=1):
-    """Add a heading section"""
-    doc.add_heading(title, level)
+output_filename = 'Technical_Architecture.docx'
 
-def add_paragraph_text(text):
-    """Add a normal paragraph"""
-    p = doc.add_paragraph(text)
-    return p
 
-def add_diagram(diagram_text):
-    """Add ASCII diagram in monospace font"""
-    p = doc.add_paragraph()
-    run = p.add_run(diagram_text)
-    run.font.name = 'Courier New'
-    run.font.size = Pt(9)
-    return p
+def build(doc):
+    """Append Sections 1-3 (Executive Summary, System Overview, High-Level Architecture)"""
+    helpers = DocHelpers(doc, diagram_font_size=9)
+    add_section, add_paragraph_text, add_diagram = helpers.add_heading, helpers.add_text, helpers.add_diagram
 
-# Add all content sections
-print("Adding Section 1: Executive Summary...")
-add_section('1. EXECUTIVE SUMMARY', 1)
+    # Add all content sections
+    print("Adding Section 1: Executive Summary...")
+    add_section('1. EXECUTIVE SUMMARY', 1)
 
-add_section('1.1 Project Overview', 2)
-add_paragraph_text('The PII Masking Tool is an enterprise web application designed to protect Personally Identifiable Information (PII) by masking sensitive data when copying from production databases to non-production environments (UAT, Development, Testing).')
+    add_section('1.1 Project Overview', 2)
+    add_paragraph_text('The PII Masking Tool is an enterprise web application designed to protect Personally Identifiable Information (PII) by masking sensitive data when copying from production databases to non-production environments (UAT, Development, Testing).')
 
-add_section('1.2 Purpose', 2)
-add_paragraph_text('This document provides a comprehensive technical architecture overview of the PII Masking Tool, including system architecture and component relationships, data flow through the application, technology choices and their justification, and security measures and deployment strategy.')
+    add_section('1.2 Purpose', 2)
+    add_paragraph_text('This document provides a comprehensive technical architecture overview of the PII Masking Tool, including system architecture and component relationships, data flow through the application, technology choices and their justification, and security measures and deployment strategy.')
 
-add_section('1.3 Key Features', 2)
-features = """• Database Connection Management: Configure and test connections to multiple SQL Server databases
+    add_section('1.3 Key Features', 2)
+    features = """• Database Connection Management: Configure and test connections to multiple SQL Server databases
 • Schema Discovery: Browse database schemas, tables, and column metadata
 • Intelligent Workflow Creation: Map source columns to appropriate PII masking techniques based on data types
 • Automated PII Masking: Execute data transformation with constraint validation
 • Execution Monitoring: Track workflow execution history with success/failure metrics
 • Role-Based Access Control: Admin and User roles with different permission levels
 • Audit Trail: Complete history of who executed what and when"""
-add_paragraph_text(features)
+    add_paragraph_text(features)
 
-add_section('1.4 Target Users', 2)
-users = """• Database Administrators: Manage database connections and schema exploration
+    add_section('1.4 Target Users', 2)
+    users = """• Database Administrators: Manage database connections and schema exploration
 • Data Privacy Officers: Configure PII masking workflows
 • QA Engineers: Execute workflows to create test datasets
 • Development Teams: Access masked data for development purposes"""
-add_paragraph_text(users)
+    add_paragraph_text(users)
 
-print("Adding Section 2: System Overview...")
-add_section('2. SYSTEM OVERVIEW', 1)
+    print("Adding Section 2: System Overview...")
+    add_section('2. SYSTEM OVERVIEW', 1)
 
-add_section('2.1 Business Context', 2)
-add_paragraph_text('Organizations need to comply with data privacy regulations (GDPR, CCPA, HIPAA) while providing realistic test data to non-production environments. The PII Masking Tool automates the process of connecting to production and non-production databases, identifying columns containing PII, applying appropriate masking transformations, writing masked data to target databases, and maintaining data integrity and referential constraints.')
+    add_section('2.1 Business Context', 2)
+    add_paragraph_text('Organizations need to comply with data privacy regulations (GDPR, CCPA, HIPAA) while providing realistic test data to non-production environments. The PII Masking Tool automates the process of connecting to production and non-production databases, identifying columns containing PII, applying appropriate masking transformations, writing masked data to target databases, and maintaining data integrity and referential constraints.')
 
-add_section('2.2 System Capabilities', 2)
-capabilities = """CONNECTION MANAGEMENT:
+    add_section('2.2 System Capabilities', 2)
+    capabilities = """CONNECTION MANAGEMENT:
 • Register source and target database connections
 • Test connection validity before saving
 • Secure credential storage with encryption
@@ -98,15 +92,15 @@ SECURITY & COMPLIANCE:
 • Encrypted database credentials
 • Audit trail of all operations
 • Secure password storage (hashed)"""
-add_paragraph_text(capabilities)
+    add_paragraph_text(capabilities)
 
-doc.add_page_break()
+    doc.add_page_break()
 
-print("Adding Section 3: High-Level Architecture...")
-add_section('3. HIGH-LEVEL ARCHITECTURE', 1)
+    print("Adding Section 3: High-Level Architecture...")
+    add_section('3. HIGH-LEVEL ARCHITECTURE', 1)
 
-add_section('3.1 System Architecture Diagram', 2)
-arch_diagram = """
+    add_section('3.1 System Architecture Diagram', 2)
+    arch_diagram = """
                          CLIENT TIER
                       (Presentation Layer)
 
@@ -148,30 +142,40 @@ arch_diagram = """
         • mappings            |        • Test DB
         • executions          |
 """
-add_diagram(arch_diagram)
+    add_diagram(arch_diagram)
+
+    add_section('3.2 Architecture Pattern', 2)
+    add_paragraph_text('Pattern Type: 3-Tier Layered Architecture')
+    add_paragraph_text('Why This Pattern: Separation of concerns ensures each tier has a distinct responsibility, independent scaling allows scaling presentation, logic, and data layers independently, technology flexibility enables replacing or upgrading individual tiers without affecting others, multiple security checkpoints exist at each layer, and changes to one layer minimally impact other layers.')
+
+    add_section('3.3 Tier Responsibilities', 2)
+
+    add_section('Client Tier (Presentation)', 3)
+    add_paragraph_text('Responsibility: User interface and user experience. Key Functions: Render user interfaces with Material-UI components, handle user interactions, client-side routing between pages, display data fetched from backend, form validation and error messages, JWT token storage in browser localStorage. Technology: React JavaScript framework running in web browser. Communication: Makes HTTPS REST API calls to application tier.')
 
-add_section('3.2 Architecture Pattern', 2)
-add_paragraph_text('Pattern Type: 3-Tier Layered Architecture')
-add_paragraph_text('Why This Pattern: Separation of concerns ensures each tier has a distinct responsibility, independent scaling allows scaling presentation, logic, and data layers independently, technology flexibility enables replacing or upgrading individual tiers without affecting others, multiple security checkpoints exist at each layer, and changes to one layer minimally impact other layers.')
+    add_section('Application Tier (Business Logic)', 3)
+    add_paragraph_text('Responsibility: Business rules, authentication, and workflow orchestration. Key Functions: Authenticate users and issue JWT tokens, validate API requests and authorize access, implement PII masking algorithms, orchestrate ETL process (Extract, Transform, Load), enforce business rules and constraints, manage database connections to user databases, log operations for audit trail. Technology: Python FastAPI framework running on application server. Communication: Receives HTTPS requests from client tier and makes SQL queries to data tier.')
 
-add_section('3.3 Tier Responsibilities', 2)
+    add_section('Data Tier (Persistence)', 3)
+    add_paragraph_text('Responsibility: Data storage, integrity, and retrieval. Key Functions: Store application metadata (users, workflows, connections), store execution history and audit logs, connect to user databases (source/target), enforce database constraints (NOT NULL, UNIQUE, FK), transaction management (ACID compliance), query optimization and indexing. Technology: Microsoft SQL Server database. Communication: Receives SQL queries from application tier.')
 
-add_section('Client Tier (Presentation)', 3)
-add_paragraph_text('Responsibility: User interface and user experience. Key Functions: Render user interfaces with Material-UI components, handle user interactions, client-side routing between pages, display data fetched from backend, form validation and error messages, JWT token storage in browser localStorage. Technology: React JavaScript framework running in web browser. Communication: Makes HTTPS REST API calls to application tier.')
+    doc.add_page_break()
 
-add_section('Application Tier (Business Logic)', 3)
-add_paragraph_text('Responsibility: Business rules, authentication, and workflow orchestration. Key Functions: Authenticate users and issue JWT tokens, validate API requests and authorize access, implement PII masking algorithms, orchestrate ETL process (Extract, Transform, Load), enforce business rules and constraints, manage database connections to user databases, log operations for audit trail. Technology: Python FastAPI framework running on application server. Communication: Receives HTTPS requests from client tier and makes SQL queries to data tier.')
+    print("Adding remaining sections...")
 
-add_section('Data Tier (Persistence)', 3)
-add_paragraph_text('Responsibility: Data storage, integrity, and retrieval. Key Functions: Store application metadata (users, workflows, connections), store execution history and audit logs, connect to user databases (source/target), enforce database constraints (NOT NULL, UNIQUE, FK), transaction management (ACID compliance), query optimization and indexing. Technology: Microsoft SQL Server database. Communication: Receives SQL queries from application tier.')
 
-doc.add_page_break()
+if __name__ == "__main__":
+    output_path = output_file(output_filename)
 
-print("Adding remaining sections...")
+    # Open the existing document
+    doc = Document(output_path)
+    build(doc)
 
-# Save the updated document
-output_path = r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\Technical_Architecture.docx"
-doc.save(output_path)
+    # Save only if the result validates, leaving the previous file otherwise
+    # Running a section script twice appends its sections twice; the TOC
+    # is checked once Section 10 is in
+    if not save_document(doc, output_path, check=lambda path: check(path, PARTIAL_CHECKS, name=output_path)):
+        sys.exit(1)
 
-print("Document updated with content sections")
-print(f"File saved: {output_path}")
+    print("Document updated with content sections")
+    print(f"File saved: {output_path}")
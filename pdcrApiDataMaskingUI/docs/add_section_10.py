@@ -1,36 +1,34 @@
+import sys
+
 from docx import Document
-from docx.shared import Pt, Inches
+from docx.shared import Inches
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 
-# Open existing document
-doc = Document(r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\Technical_Architecture.docx")
+from docx_helpers import DocHelpers
+from docx_validate import check
+from output_paths import output_file, save_document
 
-def add_heading(text, level=1):
-    doc.add_heading(text, level)
+output_filename = 'Technical_Architecture.docx'
 
-def add_text(text):
-    return doc.add_paragraph(text)
 
-def add_diagram(text):
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = 'Courier New'
-    run.font.size = Pt(8)
-    return p
+def build(doc):
+    """Append Section 10 (Integration Architecture) and the document conclusion"""
+    helpers = DocHelpers(doc)
+    add_heading, add_text, add_diagram = helpers.add_heading, helpers.add_text, helpers.add_diagram
 
-print("Adding Section 10: Integration Architecture...")
+    print("Adding Section 10: Integration Architecture...")
 
-doc.add_page_break()
+    doc.add_page_break()
 
-# ==============================================================================
-# SECTION 10: INTEGRATION ARCHITECTURE
-# ==============================================================================
+    # ==============================================================================
+    # SECTION 10: INTEGRATION ARCHITECTURE
+    # ==============================================================================
 
-add_heading('10. INTEGRATION ARCHITECTURE', 1)
+    add_heading('10. INTEGRATION ARCHITECTURE', 1)
 
-add_heading('10.1 API Integration Pattern', 2)
+    add_heading('10.1 API Integration Pattern', 2)
 
-integration_diagram = """
+    integration_diagram = """
 API INTEGRATION ARCHITECTURE
 
             ┌────────────────┐
@@ -97,12 +95,12 @@ API INTEGRATION ARCHITECTURE
 │                                                    │
 └────────────────────────────────────────────────────┘
 """
-add_diagram(integration_diagram)
+    add_diagram(integration_diagram)
 
-add_heading('10.2 API Request/Response Format', 2)
+    add_heading('10.2 API Request/Response Format', 2)
 
-add_text('Standard Request Format:')
-req_format = """
+    add_text('Standard Request Format:')
+    req_format = """
 Method: POST
 URL: https://api.company.com/api/workflows
 Headers:
@@ -134,10 +132,10 @@ Body (JSON):
   ]
 }
 """
-add_diagram(req_format)
+    add_diagram(req_format)
 
-add_text('Standard Response Format (Success):')
-success_format = """
+    add_text('Standard Response Format (Success):')
+    success_format = """
 Status: 201 Created
 Headers:
   Content-Type: application/json
@@ -155,10 +153,10 @@ Body (JSON):
   "message": "Workflow created successfully"
 }
 """
-add_diagram(success_format)
+    add_diagram(success_format)
 
-add_text('Standard Response Format (Error):')
-error_format = """
+    add_text('Standard Response Format (Error):')
+    error_format = """
 Status: 400 Bad Request
 Headers:
   Content-Type: application/json
@@ -178,35 +176,35 @@ Body (JSON):
   }
 }
 """
-add_diagram(error_format)
-
-add_heading('10.3 Integration with External Systems (Future)', 2)
-
-add_text('Potential Integrations:')
-add_text('')
-add_text('CI/CD Pipelines:')
-add_text('- Trigger workflow execution as part of deployment')
-add_text('- Mask test data before running integration tests')
-add_text('- API endpoint: POST /api/workflows/{id}/execute')
-add_text('')
-add_text('Data Warehouse ETL:')
-add_text('- Mask PII before loading into data warehouse')
-add_text('- Schedule recurring executions via API')
-add_text('- Monitor execution status programmatically')
-add_text('')
-add_text('Compliance Tools:')
-add_text('- Export audit logs for compliance reporting')
-add_text('- Provide API for security information and event management (SIEM)')
-add_text('- Data lineage tracking')
-add_text('')
-add_text('Monitoring Systems:')
-add_text('- Health check endpoints for uptime monitoring')
-add_text('- Metrics API for dashboard integration')
-add_text('- Alert webhook for execution failures')
-
-add_heading('10.4 API Endpoint Reference', 2)
-
-api_ref = """
+    add_diagram(error_format)
+
+    add_heading('10.3 Integration with External Systems (Future)', 2)
+
+    add_text('Potential Integrations:')
+    add_text('')
+    add_text('CI/CD Pipelines:')
+    add_text('- Trigger workflow execution as part of deployment')
+    add_text('- Mask test data before running integration tests')
+    add_text('- API endpoint: POST /api/workflows/{id}/execute')
+    add_text('')
+    add_text('Data Warehouse ETL:')
+    add_text('- Mask PII before loading into data warehouse')
+    add_text('- Schedule recurring executions via API')
+    add_text('- Monitor execution status programmatically')
+    add_text('')
+    add_text('Compliance Tools:')
+    add_text('- Export audit logs for compliance reporting')
+    add_text('- Provide API for security information and event management (SIEM)')
+    add_text('- Data lineage tracking')
+    add_text('')
+    add_text('Monitoring Systems:')
+    add_text('- Health check endpoints for uptime monitoring')
+    add_text('- Metrics API for dashboard integration')
+    add_text('- Alert webhook for execution failures')
+
+    add_heading('10.4 API Endpoint Reference', 2)
+
+    api_ref = """
 COMPLETE API ENDPOINT REFERENCE
 
 ┌─────────────────────────────────────────────────────────┐
@@ -326,61 +324,70 @@ COMPLETE API ENDPOINT REFERENCE
 │        Response: {status: "connected"}                  │
 └─────────────────────────────────────────────────────────┘
 """
-add_diagram(api_ref)
-
-# ==============================================================================
-# DOCUMENT CONCLUSION
-# ==============================================================================
-
-doc.add_page_break()
-
-add_heading('DOCUMENT END', 1)
-
-conclusion = doc.add_paragraph()
-conclusion_run = conclusion.add_run('This technical architecture document provides a comprehensive overview of the PII Masking Tool system design, focusing on:')
-conclusion.add_run('\n\n• 3-tier architecture with clear separation of concerns')
-conclusion.add_run('\n• JWT-based authentication for stateless security')
-conclusion.add_run('\n• Smart PII filtering based on SQL data types')
-conclusion.add_run('\n• ETL-style masking execution with transaction safety')
-conclusion.add_run('\n• Role-based access control for authorization')
-conclusion.add_run('\n• Production-ready deployment patterns')
-conclusion.add_run('\n\n')
-conclusion.add_run('The architecture prioritizes:')
-conclusion.add_run('\n\n• Data Integrity: Constraint validation before insertion')
-conclusion.add_run('\n• Security: Multiple layers of protection (network, application, data)')
-conclusion.add_run('\n• Maintainability: Clear component boundaries and documentation')
-conclusion.add_run('\n• Scalability: Horizontal scaling support for frontend and backend')
-conclusion.add_run('\n• User Experience: Intelligent UI that prevents configuration errors')
-conclusion.add_run('\n\n')
-conclusion.add_run('All components work together to provide a robust, secure, and user-friendly solution for PII data masking across databases.')
-
-doc.add_paragraph()
-doc.add_paragraph()
-
-footer_info = doc.add_paragraph()
-footer_info.add_run('Document Version: 1.0\n').bold = True
-footer_info.add_run('Last Updated: January 2025\n').bold = True
-footer_info.add_run('Author: Technical Architecture Team\n').bold = True
-footer_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Save final document
-output_path = r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\Technical_Architecture.docx"
-doc.save(output_path)
-
-print(f"\nSection 10 added successfully!")
-print(f"="*60)
-print(f"DOCUMENT COMPLETED!")
-print(f"="*60)
-print(f"File saved: {output_path}")
-print(f"\nAll 10 sections have been added to the document:")
-print(f"  1. Executive Summary")
-print(f"  2. System Overview")
-print(f"  3. High-Level Architecture")
-print(f"  4. Component Architecture")
-print(f"  5. Data Flow Diagrams")
-print(f"  6. Technology Stack")
-print(f"  7. Database Design")
-print(f"  8. Security Architecture")
-print(f"  9. Deployment Architecture")
-print(f"  10. Integration Architecture")
-print(f"\nYou can now open the document in Microsoft Word!")
+    add_diagram(api_ref)
+
+    # ==============================================================================
+    # DOCUMENT CONCLUSION
+    # ==============================================================================
+
+    doc.add_page_break()
+
+    add_heading('DOCUMENT END', 1)
+
+    conclusion = doc.add_paragraph()
+    conclusion_run = conclusion.add_run('This technical architecture document provides a comprehensive overview of the PII Masking Tool system design, focusing on:')
+    conclusion.add_run('\n\n• 3-tier architecture with clear separation of concerns')
+    conclusion.add_run('\n• JWT-based authentication for stateless security')
+    conclusion.add_run('\n• Smart PII filtering based on SQL data types')
+    conclusion.add_run('\n• ETL-style masking execution with transaction safety')
+    conclusion.add_run('\n• Role-based access control for authorization')
+    conclusion.add_run('\n• Production-ready deployment patterns')
+    conclusion.add_run('\n\n')
+    conclusion.add_run('The architecture prioritizes:')
+    conclusion.add_run('\n\n• Data Integrity: Constraint validation before insertion')
+    conclusion.add_run('\n• Security: Multiple layers of protection (network, application, data)')
+    conclusion.add_run('\n• Maintainability: Clear component boundaries and documentation')
+    conclusion.add_run('\n• Scalability: Horizontal scaling support for frontend and backend')
+    conclusion.add_run('\n• User Experience: Intelligent UI that prevents configuration errors')
+    conclusion.add_run('\n\n')
+    conclusion.add_run('All components work together to provide a robust, secure, and user-friendly solution for PII data masking across databases.')
+
+    doc.add_paragraph()
+    doc.add_paragraph()
+
+    footer_info = doc.add_paragraph()
+    footer_info.add_run('Document Version: 1.0\n').bold = True
+    footer_info.add_run('Last Updated: January 2025\n').bold = True
+    footer_info.add_run('Author: Technical Architecture Team\n').bold = True
+    footer_info.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+
+if __name__ == "__main__":
+    output_path = output_file(output_filename)
+
+    # Open existing document
+    doc = Document(output_path)
+    build(doc)
+
+    # Save only if the result validates, leaving the previous file otherwise
+    # Running a section script twice appends its sections twice
+    if not save_document(doc, output_path, check=lambda path: check(path, name=output_path)):
+        sys.exit(1)
+
+    print(f"\nSection 10 added successfully!")
+    print(f"="*60)
+    print(f"DOCUMENT COMPLETED!")
+    print(f"="*60)
+    print(f"File saved: {output_path}")
+    print(f"\nAll 10 sections have been added to the document:")
+    print(f"  1. Executive Summary")
+    print(f"  2. System Overview")
+    print(f"  3. High-Level Architecture")
+    print(f"  4. Component Architecture")
+    print(f"  5. Data Flow Diagrams")
+    print(f"  6. Technology Stack")
+    print(f"  7. Database Design")
+    print(f"  8. Security Architecture")
+    print(f"  9. Deployment Architecture")
+    print(f"  10. Integration Architecture")
+    print(f"\nYou can now open the document in Microsoft Word!")
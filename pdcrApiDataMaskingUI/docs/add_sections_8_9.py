@@ -1,35 +1,32 @@
+import sys
+
 from docx import Document
-from docx.shared import Pt
 
-# Open existing document
-doc = Document(r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\Technical_Architecture.docx")
+from docx_helpers import DocHelpers
+from docx_validate import PARTIAL_CHECKS, check
+from output_paths import output_file, save_document
 
-def add_heading(text, level=1):
-    doc.add_heading(text, level)
+output_filename = 'Technical_Architecture.docx'
 
-def add_text(text):
-    return doc.add_paragraph(text)
 
-def add_diagram(text):
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = 'Courier New'
-    run.font.size = Pt(8)
-    return p
+def build(doc):
+    """Append Section 8 (Security Architecture) and Section 9 (Deployment Architecture)"""
+    helpers = DocHelpers(doc)
+    add_heading, add_text, add_diagram = helpers.add_heading, helpers.add_text, helpers.add_diagram
 
-print("Adding Section 8: Security Architecture...")
+    print("Adding Section 8: Security Architecture...")
 
-doc.add_page_break()
+    doc.add_page_break()
 
-# ==============================================================================
-# SECTION 8: SECURITY ARCHITECTURE
-# ==============================================================================
+    # ==============================================================================
+    # SECTION 8: SECURITY ARCHITECTURE
+    # ==============================================================================
 
-add_heading('8. SECURITY ARCHITECTURE', 1)
+    add_heading('8. SECURITY ARCHITECTURE', 1)
 
-add_heading('8.1 Security Layers Overview', 2)
+    add_heading('8.1 Security Layers Overview', 2)
 
-security_diagram = """
+    security_diagram = """
 SECURITY ARCHITECTURE (Defense in Depth)
 
 Layer 7: Physical Security
@@ -83,11 +80,11 @@ Layer 0: Audit & Monitoring
 ├─ Alerting on suspicious activity
 └─ Compliance reporting
 """
-add_diagram(security_diagram)
+    add_diagram(security_diagram)
 
-add_heading('8.2 Authentication Architecture', 2)
+    add_heading('8.2 Authentication Architecture', 2)
 
-jwt_diagram = """
+    jwt_diagram = """
 JWT TOKEN AUTHENTICATION FLOW
 
 User Credentials
@@ -138,35 +135,35 @@ Backend JWT Middleware:
       ├─ VALID ──> Process Request
       └─ INVALID ─> Return 401
 """
-add_diagram(jwt_diagram)
-
-add_heading('8.3 Authentication Security Features', 2)
-
-add_text('Password Security:')
-add_text('- Passwords hashed using bcrypt with salt (cost factor: 12 rounds)')
-add_text('- Never stored in plaintext')
-add_text('- Never transmitted except during initial login (over HTTPS)')
-add_text('- Password requirements: Minimum 8 characters (configurable)')
-add_text('')
-
-add_text('Token Security:')
-add_text('- JWT signed with HMAC-SHA256 algorithm')
-add_text('- Secret key stored in environment variables (never in code)')
-add_text('- Different secret keys for dev/staging/production')
-add_text('- Token expiration enforced (24-hour default)')
-add_text('- Automatic logout on token expiration')
-add_text('- Token includes user role for authorization')
-add_text('')
-
-add_text('Session Management:')
-add_text('- Stateless authentication (no server-side sessions)')
-add_text('- Token revocation via expiration (no refresh tokens in current version)')
-add_text('- Frontend clears token on logout')
-add_text('- Expired tokens automatically rejected by backend')
-
-add_heading('8.4 Authorization (RBAC) Architecture', 2)
-
-rbac_diagram = """
+    add_diagram(jwt_diagram)
+
+    add_heading('8.3 Authentication Security Features', 2)
+
+    add_text('Password Security:')
+    add_text('- Passwords hashed using bcrypt with salt (cost factor: 12 rounds)')
+    add_text('- Never stored in plaintext')
+    add_text('- Never transmitted except during initial login (over HTTPS)')
+    add_text('- Password requirements: Minimum 8 characters (configurable)')
+    add_text('')
+
+    add_text('Token Security:')
+    add_text('- JWT signed with HMAC-SHA256 algorithm')
+    add_text('- Secret key stored in environment variables (never in code)')
+    add_text('- Different secret keys for dev/staging/production')
+    add_text('- Token expiration enforced (24-hour default)')
+    add_text('- Automatic logout on token expiration')
+    add_text('- Token includes user role for authorization')
+    add_text('')
+
+    add_text('Session Management:')
+    add_text('- Stateless authentication (no server-side sessions)')
+    add_text('- Token revocation via expiration (no refresh tokens in current version)')
+    add_text('- Frontend clears token on logout')
+    add_text('- Expired tokens automatically rejected by backend')
+
+    add_heading('8.4 Authorization (RBAC) Architecture', 2)
+
+    rbac_diagram = """
 ROLE-BASED ACCESS CONTROL (RBAC) MODEL
 
                 ┌──────────────┐
@@ -220,18 +217,18 @@ Manage users              │   ✓   │  ✗   │   ✗
 Change system settings    │   ✓   │  ✗   │   ✗
 View audit trail          │   ✓   │  ✗   │   ✗
 """
-add_diagram(rbac_diagram)
+    add_diagram(rbac_diagram)
 
-add_text('Benefits of RBAC:')
-add_text('- Simplified permission management')
-add_text('- Clear separation of admin and user capabilities')
-add_text('- Principle of least privilege')
-add_text('- Easy to add new roles in future')
-add_text('- Audit trail shows who had what permissions')
+    add_text('Benefits of RBAC:')
+    add_text('- Simplified permission management')
+    add_text('- Clear separation of admin and user capabilities')
+    add_text('- Principle of least privilege')
+    add_text('- Easy to add new roles in future')
+    add_text('- Audit trail shows who had what permissions')
 
-add_heading('8.5 Data Encryption Architecture', 2)
+    add_heading('8.5 Data Encryption Architecture', 2)
 
-encryption_diagram = """
+    encryption_diagram = """
 ENCRYPTION AT REST
 
 Database Connection Passwords (connections.password)
@@ -313,27 +310,27 @@ Client                          Server
   │  ALL SUBSEQUENT DATA ENCRYPTED│
   │<─────────────────────────────>│
 """
-add_diagram(encryption_diagram)
+    add_diagram(encryption_diagram)
 
-add_heading('8.6 Application Security Measures', 2)
+    add_heading('8.6 Application Security Measures', 2)
 
-add_text('SQL Injection Prevention: All database queries use parameterized statements. User input never concatenated into SQL strings. ORM/query builder enforces parameterization. Database permissions follow least privilege principle.')
-add_text('')
+    add_text('SQL Injection Prevention: All database queries use parameterized statements. User input never concatenated into SQL strings. ORM/query builder enforces parameterization. Database permissions follow least privilege principle.')
+    add_text('')
 
-add_text('Cross-Site Scripting (XSS) Prevention: React automatically escapes output (prevents XSS by default). User input sanitized before storage. Content Security Policy (CSP) headers. No use of dangerous functions (dangerouslySetInnerHTML).')
-add_text('')
+    add_text('Cross-Site Scripting (XSS) Prevention: React automatically escapes output (prevents XSS by default). User input sanitized before storage. Content Security Policy (CSP) headers. No use of dangerous functions (dangerouslySetInnerHTML).')
+    add_text('')
 
-add_text('Cross-Site Request Forgery (CSRF) Prevention: SameSite cookie attribute set to Strict. JWT tokens in Authorization header (not cookies). State-changing operations require valid JWT. No GET requests for state changes.')
-add_text('')
+    add_text('Cross-Site Request Forgery (CSRF) Prevention: SameSite cookie attribute set to Strict. JWT tokens in Authorization header (not cookies). State-changing operations require valid JWT. No GET requests for state changes.')
+    add_text('')
 
-add_text('Input Validation: Frontend validation for user experience. Backend validation for security (never trust client). Type checking with Pydantic models. Length limits on all text fields. Whitelist validation for enums.')
-add_text('')
+    add_text('Input Validation: Frontend validation for user experience. Backend validation for security (never trust client). Type checking with Pydantic models. Length limits on all text fields. Whitelist validation for enums.')
+    add_text('')
 
-add_text('Security Headers: X-Content-Type-Options: nosniff, X-Frame-Options: DENY, X-XSS-Protection: 1; mode=block, Strict-Transport-Security: max-age=31536000, Content-Security-Policy: default-src "self".')
+    add_text('Security Headers: X-Content-Type-Options: nosniff, X-Frame-Options: DENY, X-XSS-Protection: 1; mode=block, Strict-Transport-Security: max-age=31536000, Content-Security-Policy: default-src "self".')
 
-add_heading('8.7 Audit Trail', 2)
+    add_heading('8.7 Audit Trail', 2)
 
-audit_diagram = """
+    audit_diagram = """
 AUDIT TRAIL SYSTEM
 
 Every User Action Logged:
@@ -380,21 +377,21 @@ Retention Policy:
 • Compliance logs: 7 years (if required)
 • Regular archival to cold storage
 """
-add_diagram(audit_diagram)
+    add_diagram(audit_diagram)
 
-doc.add_page_break()
+    doc.add_page_break()
 
-# ==============================================================================
-# SECTION 9: DEPLOYMENT ARCHITECTURE
-# ==============================================================================
+    # ==============================================================================
+    # SECTION 9: DEPLOYMENT ARCHITECTURE
+    # ==============================================================================
 
-print("Adding Section 9: Deployment Architecture...")
+    print("Adding Section 9: Deployment Architecture...")
 
-add_heading('9. DEPLOYMENT ARCHITECTURE', 1)
+    add_heading('9. DEPLOYMENT ARCHITECTURE', 1)
 
-add_heading('9.1 Development Environment', 2)
+    add_heading('9.1 Development Environment', 2)
 
-dev_diagram = """
+    dev_diagram = """
 DEVELOPMENT ENVIRONMENT
 
 Developer Workstation (Windows/Mac/Linux)
@@ -457,11 +454,11 @@ Development Tools:
 • Chrome DevTools for frontend debugging
 • Python debugger (pdb) for backend debugging
 """
-add_diagram(dev_diagram)
+    add_diagram(dev_diagram)
 
-add_heading('9.2 Production Environment', 2)
+    add_heading('9.2 Production Environment', 2)
 
-prod_diagram = """
+    prod_diagram = """
 PRODUCTION ENVIRONMENT (High Availability)
 
                     Internet
@@ -575,11 +572,11 @@ MONITORING & LOGGING INFRASTRUCTURE
 │ └─ SLA target: 99.9% uptime                       │
 └──────────────────────────────────────────────────┘
 """
-add_diagram(prod_diagram)
+    add_diagram(prod_diagram)
 
-add_heading('9.3 Deployment Process', 2)
+    add_heading('9.3 Deployment Process', 2)
 
-cicd_diagram = """
+    cicd_diagram = """
 CI/CD PIPELINE (Continuous Deployment)
 
 Developer                                  Production
@@ -682,17 +679,17 @@ Verification  │                                │
                                   Production Running
                                   New Version
 """
-add_diagram(cicd_diagram)
+    add_diagram(cicd_diagram)
 
-add_text('Deployment Strategy:')
-add_text('- Blue-Green Deployment: Zero-downtime deployments')
-add_text('- Rollback Plan: Previous version kept running for quick rollback')
-add_text('- Database Migrations: Run before application deployment with backward compatibility')
-add_text('- Feature Flags: Enable/disable features without redeployment')
+    add_text('Deployment Strategy:')
+    add_text('- Blue-Green Deployment: Zero-downtime deployments')
+    add_text('- Rollback Plan: Previous version kept running for quick rollback')
+    add_text('- Database Migrations: Run before application deployment with backward compatibility')
+    add_text('- Feature Flags: Enable/disable features without redeployment')
 
-add_heading('9.4 Environment Configuration Matrix', 2)
+    add_heading('9.4 Environment Configuration Matrix', 2)
 
-config_table = """
+    config_table = """
 ENVIRONMENT CONFIGURATION MATRIX
 
 Configuration       | Development      | Staging               | Production
@@ -710,11 +707,21 @@ Backups             | Manual           | Daily                 | Hourly + daily
 Monitoring          | Local only       | Basic monitoring      | Full monitoring + alerts
 Workers             | 1                | 2                     | 4-8 (auto-scale)
 """
-add_diagram(config_table)
+    add_diagram(config_table)
+
+
+if __name__ == "__main__":
+    output_path = output_file(output_filename)
+
+    # Open existing document
+    doc = Document(output_path)
+    build(doc)
 
-# Save progress
-output_path = r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\Technical_Architecture.docx"
-doc.save(output_path)
+    # Save only if the result validates, leaving the previous file otherwise
+    # Running a section script twice appends its sections twice; the TOC
+    # is checked once Section 10 is in
+    if not save_document(doc, output_path, check=lambda path: check(path, PARTIAL_CHECKS, name=output_path)):
+        sys.exit(1)
 
-print(f"Sections 8-9 added successfully!")
-print(f"Document saved: {output_path}")
+    print(f"Sections 8-9 added successfully!")
+    print(f"Document saved: {output_path}")
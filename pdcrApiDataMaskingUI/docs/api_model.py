@@ -0,0 +1,156 @@
+"""Endpoint model extracted from the frontend API client (src/services/api.js).
+
+api.js defines axios instances (api, piiApi) and exported objects of client
+functions such as
+
+    export const serverWorkflowsAPI = {
+      getAll: () => piiApi.get('/datamasking/workflows'),
+      ...
+    };
+
+extract_endpoints() finds every exported object member that calls an
+instance's get/post/put/patch/delete and records the HTTP method and the
+full path, with the instance's baseURL path prefix ('/api' for piiApi)
+applied. A member that returns a URL template on a baseURL constant
+(`${POC_API_BASE_URL}/datamasking/workflows/executions/stream?...`, for
+requests made with fetch() elsewhere) is recorded as a GET of that path.
+Members without an HTTP call or URL (authAPI.logout) are skipped.
+
+The model is cached as JSON under .cache/api_model/, keyed by a hash of
+api.js and this module, and in memory per api.js size and mtime, so it is
+parsed once per change to the client.
+"""
+import hashlib
+import json
+import os
+import re
+from collections import namedtuple
+
+from output_paths import atomic_write
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+API_JS = os.path.join(DOCS_DIR, '..', 'src', 'services', 'api.js')
+CACHE_DIR = os.path.join(DOCS_DIR, '.cache', 'api_model')
+
+# group is the exported object ('serverWorkflowsAPI'), name the member ('getAll')
+Endpoint = namedtuple('Endpoint', 'group name method path')
+
+STRING = r"""(?:'[^']*'|"[^"]*"|`[^`]*`)"""
+CONST_RE = re.compile(r'^(?:export )?const (\w+) = (.+?);\s*$', re.M)
+INSTANCE_RE = re.compile(r'^const (\w+) = axios\.create\(\{(.*?)^\}\);', re.M | re.S)
+BASE_URL_RE = re.compile(r'\bbaseURL:\s*([^,\n]+)')
+EXPORT_RE = re.compile(r'^export const (\w+) = \{(.*?)^\};', re.M | re.S)
+MEMBER_RE = re.compile(r'^  (\w+)\s*:', re.M)
+CALL_RE = re.compile(rf'\b(\w+)\s*\.\s*(get|post|put|patch|delete)\(\s*({STRING})')
+URL_RE = re.compile(r'`\$\{(\w+)\}(/[^`?$]*)')
+# Strings are matched too, so '//' inside 'http://...' is not taken as a comment
+COMMENT_RE = re.compile(rf'({STRING})|//[^\n]*|/\*.*?\*/', re.S)
+
+# api.js path -> ((size, mtime), endpoints)
+_loaded = {}
+
+
+def _path_prefix(expression, constants):
+    """The path a baseURL expression appends to the host, e.g. "(... ) + '/api'" -> '/api'"""
+    expression = constants.get(expression.strip(), expression)
+    literal = re.search(rf"\+\s*({STRING})\s*$", expression.strip())
+    return literal.group(1)[1:-1] if literal else ''
+
+
+def extract_endpoints(source):
+    """List the Endpoints of api.js source, in file order"""
+    source = COMMENT_RE.sub(lambda m: m.group(1) or '', source)
+    constants = {name: value for name, value in CONST_RE.findall(source)}
+    prefixes = {}
+    base_urls = set()
+    for name, body in INSTANCE_RE.findall(source):
+        base_url = BASE_URL_RE.search(body)
+        prefixes[name] = _path_prefix(base_url.group(1), constants) if base_url else ''
+        if base_url:
+            base_urls.add(base_url.group(1).strip())
+
+    endpoints = []
+    for group, body in EXPORT_RE.findall(source):
+        members = list(MEMBER_RE.finditer(body))
+        for member, following in zip(members, members[1:] + [None]):
+            code = body[member.end():following.start() if following else len(body)]
+            call = CALL_RE.search(code)
+            url = URL_RE.search(code)
+            if call and call.group(1) in prefixes:
+                instance, method, path = call.groups()
+                endpoints.append(Endpoint(group, member.group(1), method.upper(),
+                                          prefixes[instance] + path[1:-1]))
+            elif url and url.group(1) in base_urls:
+                endpoints.append(Endpoint(group, member.group(1), 'GET',
+                                          _path_prefix(url.group(1), constants) + url.group(2)))
+    return endpoints
+
+
+def _source_key(source):
+    digest = hashlib.sha256(source.encode('utf-8'))
+    with open(__file__, 'rb') as f:
+        digest.update(f.read())
+    return digest.hexdigest()
+
+
+def load_endpoints(api_js=API_JS, cache_dir=CACHE_DIR):
+    """The Endpoints of api_js, from the caches when api.js is unchanged"""
+    stat = os.stat(api_js)
+    version = (stat.st_size, stat.st_mtime)
+    if api_js in _loaded and _loaded[api_js][0] == version:
+        return _loaded[api_js][1]
+
+    with open(api_js, encoding='utf-8') as f:
+        source = f.read()
+    path = os.path.join(cache_dir, _source_key(source) + '.json')
+    try:
+        with open(path, encoding='utf-8') as f:
+            endpoints = [Endpoint(*endpoint) for endpoint in json.load(f)]
+    except FileNotFoundError:
+        endpoints = extract_endpoints(source)
+        with atomic_write(path, 'w', encoding='utf-8') as f:
+            json.dump(endpoints, f, indent=1)
+    _loaded[api_js] = (version, endpoints)
+    return endpoints
+
+
+def describe(endpoint):
+    """Default description from the member name: getTablesBySchema -> 'Get tables by schema'"""
+    words = re.sub(r'(?<=[a-z0-9])(?=[A-Z])', ' ', endpoint.name).lower()
+    return words[:1].upper() + words[1:]
+
+
+def endpoint_tables(layout, descriptions=None, other_heading='Other APIs', api_js=API_JS):
+    """[(heading, [[method, path, description], ...])] for a table layout
+
+    layout is a list of (heading, selectors). A selector is a group
+    ('serverWorkflowsAPI') or a single member ('serverConnectionsAPI.getSchemas');
+    a member selected on its own is left out of its group's table. Rows
+    follow the order of the selectors, then file order within a group.
+    Endpoints no selector covers are listed under other_heading, so new
+    client groups still show up. descriptions maps 'group.name' to a
+    description and falls back to describe().
+    """
+    descriptions = descriptions or {}
+    endpoints = load_endpoints(api_js)
+    singled_out = {selector for _, selectors in layout for selector in selectors if '.' in selector}
+    covered = set()
+    tables = []
+
+    def row(endpoint):
+        covered.add(endpoint)
+        key = f'{endpoint.group}.{endpoint.name}'
+        return [endpoint.method, endpoint.path, descriptions.get(key) or describe(endpoint)]
+
+    for heading, selectors in layout:
+        rows = []
+        for selector in selectors:
+            group, _, name = selector.partition('.')
+            rows.extend(row(endpoint) for endpoint in endpoints if endpoint.group == group and (
+                endpoint.name == name if name else f'{group}.{endpoint.name}' not in singled_out))
+        tables.append((heading, rows))
+
+    others = [endpoint for endpoint in endpoints if endpoint not in covered]
+    if others:
+        tables.append((other_heading, [row(endpoint) for endpoint in others]))
+    return tables
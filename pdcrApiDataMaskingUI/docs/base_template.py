@@ -0,0 +1,74 @@
+"""Pre-styled base document shared by all docs/ generators.
+
+The page margins and the Title / Heading 1-3 fonts from generate_doc.py are
+baked into a base .docx package once and cached under .cache/templates/,
+keyed by a hash of the style spec and the python-docx version. Each process
+loads that package once and new_document() hands out deep copies of it, so
+generators never re-apply styles and every document looks the same.
+Building several documents in one process (docs_cli.py) therefore pays the
+template load only once.
+"""
+import copy
+import hashlib
+import json
+import os
+
+import docx
+from docx import Document
+from docx.shared import Inches, Pt, RGBColor
+
+from output_paths import save_document
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'templates')
+
+MARGIN = Inches(1)
+
+# style name -> font settings, as configured in generate_doc.py
+STYLE_SPEC = {
+    'Title': {'name': 'Calibri', 'size': Pt(28), 'bold': True, 'color': RGBColor(0, 51, 102)},
+    'Heading 1': {'name': 'Calibri', 'size': Pt(18), 'bold': True, 'color': RGBColor(0, 51, 102)},
+    'Heading 2': {'name': 'Calibri', 'size': Pt(14), 'bold': True, 'color': RGBColor(0, 102, 204)},
+    'Heading 3': {'name': 'Calibri', 'size': Pt(12), 'bold': True},
+}
+
+_template = None
+
+
+def apply_style_spec(doc, margin=MARGIN, style_spec=STYLE_SPEC):
+    """Set the page margins and style fonts on doc"""
+    for section in doc.sections:
+        section.top_margin = margin
+        section.bottom_margin = margin
+        section.left_margin = margin
+        section.right_margin = margin
+
+    for style_name, settings in style_spec.items():
+        font = doc.styles[style_name].font
+        font.name = settings['name']
+        font.size = settings['size']
+        font.bold = settings['bold']
+        if 'color' in settings:
+            font.color.rgb = settings['color']
+    return doc
+
+
+def spec_key(margin=MARGIN, style_spec=STYLE_SPEC):
+    """Hash of the style spec and python-docx version, used as the cache key"""
+    spec = {'margin': margin, 'styles': style_spec, 'python-docx': docx.__version__}
+    return hashlib.sha256(json.dumps(spec, sort_keys=True, default=str).encode()).hexdigest()[:16]
+
+
+def template_path(cache_dir=CACHE_DIR):
+    """Path of the cached base package, building it first if needed"""
+    path = os.path.join(cache_dir, f'base_{spec_key()}.docx')
+    if not os.path.exists(path):
+        save_document(apply_style_spec(Document()), path)
+    return path
+
+
+def new_document():
+    """Return a new, already styled Document"""
+    global _template
+    if _template is None:
+        _template = Document(template_path())
+    return copy.deepcopy(_template)
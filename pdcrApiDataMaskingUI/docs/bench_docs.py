@@ -0,0 +1,248 @@
+"""Benchmarks for the docs/ generators.
+
+Times each generator end to end and per phase, runs synthetic table scaling
+tests, and writes the results as JSON so runs can be compared between
+commits.
+
+Phases:
+    setup     Document() load, margins/styles and anything before the first
+              DocHelpers is created (the title page and TOC for the
+              Technical_Architecture builds)
+    sections  everything else in the build except tables (for the chain,
+              this includes the save and reload between scripts)
+    tables    time inside DocHelpers.create_table
+    save      doc.save() to an in-memory zip
+
+The scaling tests replay every table the generators create with its rows
+repeated 1x, 10x and 100x, through DocHelpers.create_table and through
+streaming_writer.StreamingDocument.
+
+Usage:
+    python bench_docs.py [--repeat N] [--output results.json]
+                         [--compare baseline.json] [--threshold 0.2]
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import docx
+
+from docx_helpers import DocHelpers
+from streaming_writer import StreamingDocument
+
+SCALES = (1, 10, 100)
+
+# Phases shorter than this are too noisy to flag as regressions
+MIN_COMPARE_SECONDS = 0.005
+
+
+def _chain_document():
+    """Technical_Architecture.docx the way the script chain builds it:
+    generate_doc.py, add_content.py, add_sections_*.py and add_section_10.py
+    each reopen the previous script's saved .docx (in memory here)"""
+    import base_template
+    import build_technical_architecture
+
+    doc = base_template.new_document()
+    for index, (_, build) in enumerate(build_technical_architecture.SECTIONS):
+        if index:
+            saved = io.BytesIO()
+            doc.save(saved)
+            saved.seek(0)
+            doc = docx.Document(saved)
+        build(doc)
+    return doc
+
+
+def _generators():
+    """(name, build function returning a Document) for every generator"""
+    import build_technical_architecture
+    import generate_rbac_v2
+    import generate_tech_arch_v2
+    import generate_updated_doc
+
+    return [
+        ('generate_tech_arch_v2', lambda: generate_tech_arch_v2.build_document(use_cache=False)[0]),
+        ('generate_rbac_v2', generate_rbac_v2.build_document),
+        ('generate_updated_doc', generate_updated_doc.build_document),
+        ('build_technical_architecture', lambda: build_technical_architecture.build_document()[0]),
+        ('add_sections_chain', _chain_document),
+    ]
+
+
+class PhaseRecorder:
+    """Patches DocHelpers to record setup and table time during one build"""
+
+    def __init__(self):
+        self.first_helpers = None
+        self.table_seconds = 0.0
+        self.tables = []
+
+    @contextlib.contextmanager
+    def installed(self):
+        original_init = DocHelpers.__init__
+        original_create_table = DocHelpers.create_table
+        recorder = self
+
+        def __init__(helpers, *args, **kwargs):
+            if recorder.first_helpers is None:
+                recorder.first_helpers = time.perf_counter()
+            original_init(helpers, *args, **kwargs)
+
+        def create_table(helpers, headers, rows, *args, **kwargs):
+            rows = [list(row) for row in rows]
+            recorder.tables.append((list(headers), rows))
+            start = time.perf_counter()
+            try:
+                return original_create_table(helpers, headers, rows, *args, **kwargs)
+            finally:
+                recorder.table_seconds += time.perf_counter() - start
+
+        DocHelpers.__init__, DocHelpers.create_table = __init__, create_table
+        try:
+            yield self
+        finally:
+            DocHelpers.__init__, DocHelpers.create_table = original_init, original_create_table
+
+
+def time_generator(build):
+    """Run one build; return its phase timings and the tables it created"""
+    recorder = PhaseRecorder()
+    with recorder.installed(), contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        doc = build()
+        built = time.perf_counter()
+        doc.save(io.BytesIO())
+        saved = time.perf_counter()
+
+    setup = (recorder.first_helpers or built) - start
+    phases = {
+        'setup': setup,
+        'sections': built - start - setup - recorder.table_seconds,
+        'tables': recorder.table_seconds,
+        'save': saved - built,
+        'total': saved - start,
+    }
+    return phases, recorder.tables
+
+
+def best_of(runs):
+    """Per-phase minimum over repeated runs"""
+    return {phase: min(run[phase] for run in runs) for phase in runs[0]}
+
+
+def scaling_tests(tables, repeat=1):
+    """Replay the recorded tables with their rows repeated SCALES times"""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in SCALES:
+            rows = sum(len(table_rows) for _, table_rows in tables) * scale
+            in_memory, streamed = [], []
+            for _ in range(repeat):
+                start = time.perf_counter()
+                doc = docx.Document()
+                helpers = DocHelpers(doc)
+                for headers, table_rows in tables:
+                    helpers.create_table(headers, table_rows * scale)
+                doc.save(io.BytesIO())
+                in_memory.append(time.perf_counter() - start)
+
+                start = time.perf_counter()
+                with StreamingDocument(os.path.join(tmp, f'scale_{scale}.docx')) as stream:
+                    for headers, table_rows in tables:
+                        stream.create_table(headers, (row for _ in range(scale) for row in table_rows))
+                streamed.append(time.perf_counter() - start)
+
+            results[f'x{scale}'] = {'rows': rows, 'docx': min(in_memory), 'streaming': min(streamed)}
+    return results
+
+
+def run(repeat=1):
+    results = {
+        'timestamp': datetime.datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'python_docx': getattr(docx, '__version__', 'unknown'),
+        'repeat': repeat,
+        'generators': {},
+    }
+    all_tables = []
+    for name, build in _generators():
+        runs = []
+        for _ in range(repeat):
+            phases, tables = time_generator(build)
+            runs.append(phases)
+        all_tables.extend(tables)
+        results['generators'][name] = best_of(runs)
+    results['scaling'] = scaling_tests(all_tables, repeat)
+    return results
+
+
+def flatten(results):
+    """{'generators.generate_rbac_v2.total': seconds, ...} for every timing"""
+    flat = {}
+    for name, phases in results.get('generators', {}).items():
+        for phase, seconds in phases.items():
+            flat[f'generators.{name}.{phase}'] = seconds
+    for scale, timings in results.get('scaling', {}).items():
+        for writer in ('docx', 'streaming'):
+            flat[f'scaling.{scale}.{writer}'] = timings[writer]
+    return flat
+
+
+def compare(baseline, current, threshold):
+    """Return [(metric, old, new)] for timings slower than baseline by more than threshold"""
+    old, new = flatten(baseline), flatten(current)
+    return [(metric, old[metric], new[metric]) for metric in sorted(new)
+            if metric in old and max(old[metric], new[metric]) >= MIN_COMPARE_SECONDS
+            and new[metric] > old[metric] * (1 + threshold)]
+
+
+def print_report(results):
+    print(f"{'Generator':<30}" + ''.join(f'{p:>10}' for p in ('setup', 'sections', 'tables', 'save', 'total')))
+    for name, phases in results['generators'].items():
+        print(f'{name:<30}' + ''.join(f'{phases[p] * 1000:8.1f}ms' for p in
+                                      ('setup', 'sections', 'tables', 'save', 'total')))
+    print(f"\n{'Table scale':<12}{'rows':>10}{'docx':>12}{'streaming':>12}")
+    for scale, timings in results['scaling'].items():
+        print(f"{scale:<12}{timings['rows']:>10}{timings['docx']:>11.3f}s{timings['streaming']:>11.3f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=3, help='runs per benchmark, best time is kept')
+    parser.add_argument('--output', help='write results JSON to this path')
+    parser.add_argument('--compare', help='baseline results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown before a timing counts as a regression (0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    results = run(args.repeat)
+    print_report(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, results, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for metric, old, new in regressions:
+                print(f"  {metric}: {old * 1000:.1f}ms -> {new * 1000:.1f}ms (+{(new / old - 1):.0%})")
+            return 1
+        print(f"\nNo regressions over {args.threshold:.0%} against {args.compare}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""Build every document in docs/ in parallel.
+
+A document target is any script in this directory that defines a top-level
+main() function and an output_filename. Targets are discovered by parsing the
+scripts (nothing is imported in the driver process) and each one is built
+in a fresh worker process, so targets never share module state.
+
+create_full_document and generate_updated_doc are alternative builders of
+Technical_Architecture.docx (as in docs_cli.py's `all`): discovery skips them
+and they are only built when named. Two targets never write the same file in
+one run; naming targets that share an output_filename is an error.
+
+--profile FILE records the DocHelpers calls of every target (build_profile.py),
+writes them to FILE as collapsed stacks for a flame graph and prints a summary.
+
+Every document is validated once all targets are built (docx_validate.py):
+duplicated sections, broken heading numbering, a TOC out of step with the
+headings or an empty table fail the build. --no-validate skips this.
+
+--pack [LEVEL] packs every document once all targets are built and validated
+(docx_pack.py).
+
+Usage:
+    python build_all.py [--output-dir DIR] [--diagrams image|text] [--profile FILE]
+                        [--pack [LEVEL]] [--no-validate] [target ...]
+"""
+import argparse
+import ast
+import contextlib
+import glob
+import importlib
+import io
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from build_profile import HelperProfile, profile_path, set_profile_path
+from diagram_renderer import set_diagram_mode
+from docx_pack import DEFAULT_LEVEL, describe, pack
+from docx_validate import check_all
+from output_paths import set_output_dir
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Also write Technical_Architecture.docx, which build_technical_architecture owns
+ALTERNATIVE_BUILDERS = {'create_full_document', 'generate_updated_doc'}
+
+
+def discover_targets(docs_dir=DOCS_DIR):
+    """Return the names of scripts that define main() and output_filename,
+    except the alternative builders"""
+    targets = []
+    for path in sorted(glob.glob(os.path.join(docs_dir, '*.py'))):
+        with open(path, encoding='utf-8') as f:
+            tree = ast.parse(f.read(), filename=path)
+        functions = {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+        assigned = {target.id for node in tree.body if isinstance(node, ast.Assign)
+                    for target in node.targets if isinstance(target, ast.Name)}
+        name = os.path.splitext(os.path.basename(path))[0]
+        if 'main' in functions and 'output_filename' in assigned and name not in ALTERNATIVE_BUILDERS:
+            targets.append(name)
+    return targets
+
+
+def build_target(name):
+    """Import and build one target; runs inside a worker process"""
+    output = io.StringIO()
+    profile = HelperProfile() if profile_path() else None
+    start = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(output):
+            module = importlib.import_module(name)
+            with profile.installed(name) if profile else contextlib.nullcontext():
+                path = module.main()
+        error = None
+    except Exception:
+        path, error = None, traceback.format_exc()
+    return {
+        'target': name,
+        'output_path': path,
+        'seconds': time.perf_counter() - start,
+        'error': error,
+        'log': output.getvalue(),
+        'profile': profile.to_dict() if profile else None,
+    }
+
+
+def declared_output(name):
+    """The output_filename a target assigns, following `output_filename = module.output_filename`"""
+    with open(os.path.join(DOCS_DIR, name + '.py'), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == 'output_filename'
+                                                for t in node.targets):
+            value = node.value
+            if isinstance(value, ast.Attribute) and isinstance(value.value, ast.Name):
+                return declared_output(value.value.id)
+            return ast.unparse(value)
+    return name
+
+
+def check_outputs(names):
+    """Raise SystemExit if two targets declare the same output_filename"""
+    writers = {}
+    for name in names:
+        writers.setdefault(declared_output(name), []).append(name)
+    clashes = [f"{output} ({', '.join(group)})" for output, group in writers.items() if len(group) > 1]
+    if clashes:
+        raise SystemExit(f"Targets would overwrite each other's output: {'; '.join(clashes)}")
+
+
+def build_all(names=None, workers=None):
+    """Build targets in a process pool sized to the available cores"""
+    names = names or discover_targets()
+    check_outputs(names)
+    workers = workers or min(len(names), os.cpu_count() or 1)
+    if DOCS_DIR not in sys.path:
+        sys.path.insert(0, DOCS_DIR)
+
+    # max_tasks_per_child=1 gives every job a fresh interpreter
+    with ProcessPoolExecutor(max_workers=workers, max_tasks_per_child=1) as pool:
+        return list(pool.map(build_target, names))
+
+
+def print_summary(results, wall_seconds):
+    width = max(len(r['target']) for r in results)
+    print(f"\n{'Target':<{width}}  {'Status':<6}  {'Time':>9}  Output")
+    for r in results:
+        status = 'FAILED' if r['error'] else 'OK'
+        print(f"{r['target']:<{width}}  {status:<6}  {r['seconds']:8.2f}s  {r['output_path'] or '-'}")
+    failures = [r for r in results if r['error']]
+    for r in failures:
+        print(f"\n--- {r['target']} failed ---\n{r['log']}{r['error']}")
+    print(f"\n{len(results) - len(failures)} of {len(results)} documents built in {wall_seconds:.2f}s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('targets', nargs='*', help='targets to build (default: all discovered)')
+    parser.add_argument('--output-dir', help='directory for the generated documents')
+    parser.add_argument('--diagrams', choices=('image', 'text'),
+                        help='render ASCII diagrams as SVG pictures (default) or monospace text')
+    parser.add_argument('--profile', metavar='FILE', help='profile the helper calls, writing collapsed stacks to FILE')
+    parser.add_argument('--pack', nargs='?', type=int, const=DEFAULT_LEVEL, choices=range(10), metavar='LEVEL',
+                        help=f'pack the documents, zipped at this deflate level (default {DEFAULT_LEVEL})')
+    parser.add_argument('--no-validate', action='store_true', help='do not check the built documents')
+    args = parser.parse_args(argv)
+    set_output_dir(args.output_dir)
+    set_diagram_mode(args.diagrams)
+    set_profile_path(args.profile)
+
+    start = time.perf_counter()
+    results = build_all(args.targets or None)
+    print_summary(results, time.perf_counter() - start)
+    paths = list(dict.fromkeys(r['output_path'] for r in results if r['output_path']))
+    valid = True
+    if not args.no_validate:
+        print()
+        valid = check_all(paths)
+    if args.pack is not None:
+        print()
+        for path in paths:
+            print(describe(path, pack(path, compresslevel=args.pack)))
+    if profile_path():
+        profile = HelperProfile()
+        for r in results:
+            if r['profile']:
+                profile.merge(r['profile'])
+        profile.write_collapsed(profile_path())
+        profile.print_summary()
+        print(f"\nCollapsed stacks written to {profile_path()}")
+    return 1 if any(r['error'] for r in results) or not valid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+"""Opt-in profiling of the DocHelpers calls made while building documents.
+
+While a HelperProfile is installed, DocHelpers.add_heading, add_text,
+add_bullet, add_diagram, create_table and set_cell_shading are wrapped to
+record per helper the number of calls, the cumulative time and the number
+of XML elements the call produced. Every call is also attributed to the
+generator call stack it came from (only frames in docs/ are kept), so the
+profile can be written in the collapsed-stack format flamegraph.pl and
+speedscope read:
+
+    generate_tech_arch_v2;generate_tech_arch_v2.main;...;docx_helpers.create_table 1834
+
+Values are microseconds of self time. The root frame of each target also
+gets the build time spent outside the helpers, so the graph adds up to the
+whole build. Sections spliced from section_cache.py make no helper calls;
+pass --no-cache to render every section of a cached generator.
+
+Profiling is enabled with --profile FILE on build_all.py and docs_cli.py
+(which sets DOCS_PROFILE for worker processes), or directly:
+
+    python build_profile.py generate_tech_arch_v2 [--no-cache] [--output profile.folded] [--top 20]
+"""
+import argparse
+import contextlib
+import functools
+import importlib
+import inspect
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+from docx_helpers import DocHelpers
+from output_paths import atomic_write
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+PROFILE_ENV = 'DOCS_PROFILE'
+HELPERS = ('add_heading', 'add_text', 'add_bullet', 'add_diagram', 'create_table', 'set_cell_shading')
+TOP_N = 15
+
+
+def profile_path():
+    """The collapsed-stack output path, or None when profiling is off"""
+    return os.environ.get(PROFILE_ENV) or None
+
+
+def set_profile_path(path):
+    """Turn profiling on for this process and the worker processes it starts"""
+    if path:
+        os.environ[PROFILE_ENV] = os.path.abspath(path)
+
+
+def element_count(result):
+    """Number of XML elements under the paragraph, table or element a helper returned"""
+    element = getattr(result, '_element', result)
+    return sum(1 for _ in element.iter()) if hasattr(element, 'iter') else 0
+
+
+@functools.lru_cache(maxsize=None)
+def _frame_name(code):
+    """'module.function' for frames in docs/, None for anything else"""
+    directory, filename = os.path.split(code.co_filename)
+    if directory != DOCS_DIR or code.co_filename == __file__:
+        return None
+    return f'{os.path.splitext(filename)[0]}.{code.co_name}'
+
+
+class HelperProfile:
+    """Call counts, cumulative time, XML element counts and stacks of the DocHelpers calls"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.seconds = defaultdict(float)
+        self.elements = Counter()
+        self.stacks = defaultdict(float)    # 'root;frame;...;helper' -> self seconds
+        self.build_seconds = 0.0
+        self._root = None
+        self._base = None                   # frame of the installed() caller; stacks stop there
+        self._open = []                     # child time of the helper calls in progress
+        self._outermost_seconds = 0.0       # time in helper calls not nested in another
+
+    def _stack(self, frame):
+        """Frame names from the outermost docs/ frame below installed() to frame"""
+        names = []
+        while frame is not None and frame is not self._base:
+            name = _frame_name(frame.f_code)
+            if name:
+                names.append(name)
+            frame = frame.f_back
+        names.reverse()
+        return names
+
+    def _call(self, helper, method, args, kwargs):
+        stack = self._stack(sys._getframe(2))
+        self._open.append(0.0)
+        start = time.perf_counter()
+        try:
+            result = method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = self._open.pop()
+            if self._open:
+                self._open[-1] += elapsed
+            else:
+                self._outermost_seconds += elapsed
+        self.calls[helper] += 1
+        self.seconds[helper] += elapsed
+        self.elements[helper] += element_count(result)
+        self.stacks[';'.join((self._root, *stack, f'docx_helpers.{helper}'))] += elapsed - children
+        return result
+
+    @contextlib.contextmanager
+    def installed(self, root):
+        """Wrap the DocHelpers methods for one build; root names it in the stacks"""
+        originals = {name: getattr(DocHelpers, name) for name in HELPERS}
+        profile = self
+
+        def wrap(name, method):
+            @functools.wraps(method)
+            def wrapper(*args, **kwargs):
+                return profile._call(name, method, args, kwargs)
+            return wrapper
+
+        for name, method in originals.items():
+            setattr(DocHelpers, name, wrap(name, method))
+        self._root = root
+        self._base = sys._getframe(2)
+        in_helpers = self._outermost_seconds
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            for name, method in originals.items():
+                setattr(DocHelpers, name, method)
+            self._base = None
+            self.build_seconds += elapsed
+            self.stacks[root] += elapsed - (self._outermost_seconds - in_helpers)
+
+    def to_dict(self):
+        """Plain data, to send a worker's profile back to build_all.py"""
+        return {'calls': dict(self.calls), 'seconds': dict(self.seconds), 'elements': dict(self.elements),
+                'stacks': dict(self.stacks), 'build_seconds': self.build_seconds}
+
+    def merge(self, data):
+        self.calls.update(data['calls'])
+        self.elements.update(data['elements'])
+        for name, seconds in data['seconds'].items():
+            self.seconds[name] += seconds
+        for stack, seconds in data['stacks'].items():
+            self.stacks[stack] += seconds
+        self.build_seconds += data['build_seconds']
+        return self
+
+    def write_collapsed(self, path):
+        """Write the stacks in collapsed format, one 'frame;frame;... microseconds' per line"""
+        with atomic_write(path, 'w', encoding='utf-8') as f:
+            for stack, seconds in sorted(self.stacks.items()):
+                microseconds = round(seconds * 1e6)
+                if microseconds:
+                    f.write(f'{stack} {microseconds}\n')
+        return path
+
+    def print_summary(self, top=TOP_N):
+        total = self.build_seconds or 1.0
+        print(f"\n{'Helper':<18}{'calls':>9}{'total':>11}{'mean':>11}{'build':>8}{'elements':>11}")
+        for name in sorted(self.calls, key=self.seconds.get, reverse=True):
+            calls, seconds = self.calls[name], self.seconds[name]
+            print(f"{name:<18}{calls:>9}{seconds * 1000:>9.1f}ms{seconds / calls * 1e6:>9.1f}us"
+                  f"{seconds / total:>8.1%}{self.elements[name]:>11}")
+        print(f"\nTop {top} call stacks by self time (build total {self.build_seconds:.2f}s):")
+        for stack, seconds in sorted(self.stacks.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"{seconds * 1000:9.1f}ms {seconds / total:6.1%}  {stack}")
+
+
+def run_targets(names, path=None, top=TOP_N, use_cache=True):
+    """Build the named generator modules in this process under one profile"""
+    profile = HelperProfile()
+    for name in names:
+        module = importlib.import_module(name)
+        kwargs = {} if use_cache or 'use_cache' not in inspect.signature(module.main).parameters else {
+            'use_cache': False}
+        with profile.installed(name):
+            module.main(**kwargs)
+    if path:
+        profile.write_collapsed(path)
+        print(f"\nCollapsed stacks written to {path}")
+    profile.print_summary(top)
+    return profile
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('targets', nargs='+', help='generator modules to build, e.g. generate_rbac_v2')
+    parser.add_argument('--output', default=profile_path(), help='collapsed-stack output file')
+    parser.add_argument('--top', type=int, default=TOP_N, help='call stacks to list in the summary')
+    parser.add_argument('--no-cache', action='store_true', help='render cached sections instead of splicing them')
+    args = parser.parse_args(argv)
+    run_targets(args.targets, args.output, args.top, use_cache=not args.no_cache)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""Build Technical_Architecture.docx in a single pass.
+
+The title page script (generate_doc.py) and the section scripts
+(add_content.py, add_sections_4_5.py, add_sections_6_7.py,
+add_sections_8_9.py, add_section_10.py) each expose a build(doc) function.
+This engine runs all of them against one in-memory Document and saves it
+once, instead of reopening and re-saving the .docx after every script.
+"""
+import time
+
+from base_template import new_document
+from output_paths import output_file, save_document
+import generate_doc
+import add_content
+import add_sections_4_5
+import add_sections_6_7
+import add_sections_8_9
+import add_section_10
+
+output_filename = generate_doc.output_filename
+
+# (section name, build function) in document order
+SECTIONS = [
+    ('Title Page & Table of Contents', generate_doc.build),
+    ('Sections 1-3', add_content.build),
+    ('Sections 4-5', add_sections_4_5.build),
+    ('Sections 6-7', add_sections_6_7.build),
+    ('Sections 8-9', add_sections_8_9.build),
+    ('Section 10 & Conclusion', add_section_10.build),
+]
+
+
+def build_document(sections=SECTIONS):
+    """Assemble all sections into one Document.
+
+    Returns the document and a list of (section name, seconds) timings.
+    """
+    doc = new_document()
+    timings = []
+    for name, build in sections:
+        start = time.perf_counter()
+        build(doc)
+        timings.append((name, time.perf_counter() - start))
+    return doc, timings
+
+
+def print_timings(timings):
+    """Print the per-section build time report"""
+    width = max(len(name) for name, _ in timings)
+    print("\nBuild time per section:")
+    for name, seconds in timings:
+        print(f"  {name:<{width}}  {seconds * 1000:8.1f} ms")
+    total = sum(seconds for _, seconds in timings)
+    print(f"  {'Total':<{width}}  {total * 1000:8.1f} ms")
+
+
+def main(path=None):
+    path = path or output_file(output_filename)
+    doc, timings = build_document()
+
+    start = time.perf_counter()
+    save_document(doc, path)
+    timings.append(('Save', time.perf_counter() - start))
+
+    print_timings(timings)
+    print(f"\nDocument saved successfully: {path}")
+    return path
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+"""Render add_diagram() ASCII art as embedded SVG pictures.
+
+add_diagram() used to put each diagram into one 8pt Courier New run with a
+<w:br/> per line. Large diagrams made document.xml big and slow to lay out
+in Word. Here the box-drawing characters (and ASCII -, |, + used as lines)
+become merged SVG line segments and the remaining characters become one
+<text> element per run of text, so a diagram is a small vector image part
+and document.xml only holds a picture reference.
+
+Rendered SVGs are cached under .cache/diagrams/, keyed by a hash of the
+diagram text, the font size and this module, so unchanged diagrams are
+never re-rendered. The picture is named after its cache key, which lets
+section_cache.py re-link cached sections to fresh image parts; the first
+line of the diagram becomes its alt text.
+
+The monospace-text rendering is kept as the fallback:
+    - for blocks with no line art (code samples, plain lists)
+    - when DOCS_DIAGRAMS=text is set, e.g. for consumers without SVG support
+
+The picture sits in an mc:AlternateContent whose Choice requires the SVG
+namespace; its Fallback is the monospace-text rendering, so consumers that
+cannot draw SVG show the diagram as text instead of an empty box. (The
+picture's PNG blip, which only SVG-aware consumers ever see, is a 1x1
+transparent pixel.) Pictures are scaled down to fit the section's text
+width and page height, keeping their aspect ratio.
+"""
+import hashlib
+import io
+import os
+import struct
+import zlib
+from xml.sax.saxutils import escape
+
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.opc.packuri import PackURI
+from docx.opc.part import Part
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.shared import Pt
+
+from output_paths import atomic_write
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'diagrams')
+
+DIAGRAM_MODE_ENV = 'DOCS_DIAGRAMS'
+SVG_CONTENT_TYPE = 'image/svg+xml'
+SVG_NS = 'http://schemas.microsoft.com/office/drawing/2016/SVG/main'
+SVG_BLIP_EXT = '{96DAC541-7B7A-43D3-8B79-37D633B846F1}'
+MC_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+NAME_PREFIX = 'Diagram '
+
+# SVG user units per character cell; a cell is 0.6em wide like Courier New
+CELL_WIDTH = 12
+CELL_HEIGHT = 22
+FONT_UNITS = 20
+
+# character -> arms (N, E, S, W) it draws from the cell centre
+BOX_ARMS = {
+    '─': 'EW', '━': 'EW', '═': 'EW', '│': 'NS', '┃': 'NS', '║': 'NS',
+    '┌': 'ES', '╔': 'ES', '┐': 'SW', '╗': 'SW', '└': 'NE', '╚': 'NE', '┘': 'NW', '╝': 'NW',
+    '├': 'NES', '╠': 'NES', '┤': 'NSW', '╣': 'NSW', '┬': 'ESW', '╦': 'ESW',
+    '┴': 'NEW', '╩': 'NEW', '┼': 'NESW', '╬': 'NESW',
+}
+HORIZONTAL = {ch for ch, arms in BOX_ARMS.items() if 'E' in arms or 'W' in arms} | {'-', '+'}
+VERTICAL = {ch for ch, arms in BOX_ARMS.items() if 'N' in arms or 'S' in arms} | {'|', '+'}
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# Changes whenever this module changes, invalidating every cached SVG
+RENDERER_VERSION = _file_hash(__file__)
+
+
+def diagram_mode():
+    """'image' (default) or 'text'"""
+    return os.environ.get(DIAGRAM_MODE_ENV, 'image')
+
+
+def set_diagram_mode(mode):
+    """Use mode for add_diagram() in this process and its children"""
+    if mode:
+        os.environ[DIAGRAM_MODE_ENV] = mode
+
+
+def _grid(text):
+    lines = text.replace('\r\n', '\n').replace('\t', '    ').split('\n')
+    while lines and not lines[0].strip():
+        lines.pop(0)
+    while lines and not lines[-1].strip():
+        lines.pop()
+    width = max((len(line) for line in lines), default=0)
+    return [line.ljust(width) for line in lines]
+
+
+def normalize(text):
+    """The diagram text without surrounding blank lines or trailing spaces"""
+    return '\n'.join(line.rstrip() for line in _grid(text))
+
+
+def _arms(grid, r, c):
+    """The line arms drawn by grid[r][c], or '' if it is text"""
+    ch = grid[r][c]
+    if ch in BOX_ARMS:
+        return BOX_ARMS[ch]
+    left = grid[r][c - 1] if c else ' '
+    right = grid[r][c + 1] if c + 1 < len(grid[r]) else ' '
+    if ch == '-':
+        # hyphens inside words ("Multi-Step") stay text
+        return 'EW' if left in HORIZONTAL or right in HORIZONTAL else ''
+    if ch == '|':
+        return 'NS'
+    if ch == '+':
+        up = grid[r - 1][c] if r else ' '
+        down = grid[r + 1][c] if r + 1 < len(grid) else ' '
+        arms = ''.join(arm for arm, near, chars in (('N', up, VERTICAL), ('E', right, HORIZONTAL),
+                                                    ('S', down, VERTICAL), ('W', left, HORIZONTAL))
+                       if near in chars)
+        return arms if len(arms) > 1 else ''
+    return ''
+
+
+def _merge(intervals):
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return merged
+
+
+def render_svg(text, font_size=8):
+    """SVG markup for an ASCII diagram, or None if it has no line art"""
+    grid = _grid(text)
+    if not grid or not grid[0]:
+        return None
+    rows, cols = len(grid), len(grid[0])
+    horizontal, vertical = {}, {}
+    texts = []
+    for r, line in enumerate(grid):
+        run_start = None
+        for c, ch in enumerate(line):
+            arms = _arms(grid, r, c)
+            if arms:
+                x, y = c * CELL_WIDTH + CELL_WIDTH // 2, r * CELL_HEIGHT + CELL_HEIGHT // 2
+                for arm in arms:
+                    if arm in 'EW':
+                        span = (x, x + CELL_WIDTH // 2) if arm == 'E' else (x - CELL_WIDTH // 2, x)
+                        horizontal.setdefault(y, []).append(span)
+                    else:
+                        span = (y - CELL_HEIGHT // 2, y) if arm == 'N' else (y, y + CELL_HEIGHT // 2)
+                        vertical.setdefault(x, []).append(span)
+            if arms or ch == ' ':
+                if run_start is not None and (arms or line[c + 1:c + 2] in ('', ' ')):
+                    texts.append((r, run_start, line[run_start:c].rstrip()))
+                    run_start = None
+            elif run_start is None:
+                run_start = c
+        if run_start is not None:
+            texts.append((r, run_start, line[run_start:].rstrip()))
+    if not horizontal and not vertical:
+        return None
+
+    path = ''.join(f'M{x0} {y}H{x1}' for y, spans in horizontal.items() for x0, x1 in _merge(spans))
+    path += ''.join(f'M{x} {y0}V{y1}' for x, spans in vertical.items() for y0, y1 in _merge(spans))
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {cols * CELL_WIDTH} {rows * CELL_HEIGHT}"'
+        f' width="{cols * CELL_WIDTH * font_size / FONT_UNITS}pt"'
+        f' height="{rows * CELL_HEIGHT * font_size / FONT_UNITS}pt">',
+        f'<path d="{path}" stroke="#000" stroke-width="1.5" fill="none"/>',
+        f'<g font-family="Courier New,monospace" font-size="{FONT_UNITS}" xml:space="preserve">',
+    ]
+    baseline = CELL_HEIGHT // 2 + FONT_UNITS * 0.35
+    for r, c, run in texts:
+        parts.append(f'<text x="{c * CELL_WIDTH}" y="{r * CELL_HEIGHT + baseline:g}"'
+                     f' textLength="{len(run) * CELL_WIDTH}">{escape(run)}</text>')
+    parts.append('</g></svg>')
+    return ''.join(parts)
+
+
+def diagram_key(text, font_size=8):
+    """Cache key for a diagram: its text, font size and this module's source"""
+    digest = hashlib.sha256(RENDERER_VERSION.encode())
+    digest.update(f'\0{font_size}\0{normalize(text)}'.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def cached_svg(text, font_size=8, cache_dir=CACHE_DIR):
+    """(key, SVG bytes or None), rendering only when the cache has no entry"""
+    key = diagram_key(text, font_size)
+    path = os.path.join(cache_dir, key + '.svg')
+    try:
+        with open(path, 'rb') as f:
+            return key, f.read() or None
+    except FileNotFoundError:
+        pass
+    svg = render_svg(text, font_size)
+    blob = svg.encode('utf-8') if svg else b''
+    with atomic_write(path) as f:
+        f.write(blob)  # an empty entry records "no line art, use text"
+    return key, blob or None
+
+
+def _blank_png():
+    def chunk(kind, data):
+        return struct.pack('>I', len(data)) + kind + data + struct.pack('>I', zlib.crc32(kind + data))
+    return (b'\x89PNG\r\n\x1a\n' + chunk(b'IHDR', struct.pack('>IIBBBBB', 1, 1, 8, 6, 0, 0, 0))
+            + chunk(b'IDAT', zlib.compress(b'\0\0\0\0\0')) + chunk(b'IEND', b''))
+
+
+BLANK_PNG = _blank_png()
+
+
+def _svg_size(svg):
+    """(width, height) in EMU from the root width/height attributes"""
+    root = parse_xml(svg)
+    return tuple(Pt(float(root.get(dim)[:-2])) for dim in ('width', 'height'))
+
+
+def fit_size(width, height, max_width, max_height):
+    """(width, height) scaled down, aspect ratio kept, to fit max_width x max_height"""
+    scale = min(1, max_width / width, max_height / height)
+    return int(width * scale), int(height * scale)
+
+
+def _block_height(doc):
+    """Space between the top and bottom margins of the last section, in EMU"""
+    section = doc.sections[-1]
+    return section.page_height - section.top_margin - section.bottom_margin
+
+
+def fallback_xml(text):
+    """Run content for text as the monospace fallback: one <w:t> per line"""
+    lines = text.replace('\r\n', '\n').replace('\t', '    ').split('\n')
+    return '<w:br/>'.join(f'<w:t xml:space="preserve">{escape(line)}</w:t>' for line in lines)
+
+
+def _svg_rid(part, svg):
+    """rId of an SVG image part holding svg, adding the part if needed"""
+    for rel in part.rels.values():
+        if rel.reltype == RT.IMAGE and not rel.is_external and rel.target_part.blob == svg:
+            return rel.rId
+    partname = part.package.next_partname('/word/media/image%d.svg')
+    return part.relate_to(Part(PackURI(partname), SVG_CONTENT_TYPE, svg, part.package), RT.IMAGE)
+
+
+def picture_xml(key, text, svg_rid, png_rid, doc_pr_id, width, height, rpr=''):
+    """<w:p> markup for an inline SVG picture with text in rpr as the fallback;
+    alt text is the diagram's first line"""
+    descr = escape(normalize(text).split('\n', 1)[0].strip(), {'"': '&quot;'})
+    return (
+        f'<w:p {nsdecls("w", "wp", "a", "pic", "r")}><w:r>{rpr}'
+        f'<mc:AlternateContent xmlns:mc="{MC_NS}" xmlns:asvg="{SVG_NS}">'
+        '<mc:Choice Requires="asvg"><w:drawing>'
+        f'<wp:inline distT="0" distB="0" distL="0" distR="0"><wp:extent cx="{width}" cy="{height}"/>'
+        f'<wp:docPr id="{doc_pr_id}" name="{NAME_PREFIX}{key}" descr="{descr}"/>'
+        '<wp:cNvGraphicFramePr><a:graphicFrameLocks noChangeAspect="1"/></wp:cNvGraphicFramePr>'
+        '<a:graphic><a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
+        f'<pic:pic><pic:nvPicPr><pic:cNvPr id="0" name="diagram_{key[:16]}.svg"/><pic:cNvPicPr/></pic:nvPicPr>'
+        f'<pic:blipFill><a:blip r:embed="{png_rid}"><a:extLst><a:ext uri="{SVG_BLIP_EXT}">'
+        f'<asvg:svgBlip r:embed="{svg_rid}"/></a:ext></a:extLst></a:blip>'
+        '<a:stretch><a:fillRect/></a:stretch></pic:blipFill>'
+        f'<pic:spPr><a:xfrm><a:off x="0" y="0"/><a:ext cx="{width}" cy="{height}"/></a:xfrm>'
+        '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></pic:spPr></pic:pic>'
+        '</a:graphicData></a:graphic></wp:inline></w:drawing></mc:Choice>'
+        f'<mc:Fallback>{fallback_xml(text)}</mc:Fallback></mc:AlternateContent></w:r></w:p>'
+    )
+
+
+def embed_diagram(doc, text, font_size=8, cache_dir=CACHE_DIR, rpr=''):
+    """Build a <w:p> element holding text as an SVG picture, or None for the text fallback
+
+    rpr is the <w:rPr> markup the text is shown with where SVG is not supported.
+    """
+    key, svg = cached_svg(text, font_size, cache_dir)
+    if svg is None:
+        return None
+    width, height = fit_size(*_svg_size(svg), doc._block_width, _block_height(doc))
+    part = doc.part
+    png_rid, _ = part.get_or_add_image(io.BytesIO(BLANK_PNG))
+    return parse_xml(picture_xml(key, text, _svg_rid(part, svg), png_rid, part.next_id, width, height, rpr))
+
+
+def relink_diagrams(doc, element, cache_dir=CACHE_DIR):
+    """Point diagram pictures in element (spliced from another document) at doc's parts
+
+    Raises FileNotFoundError, before changing doc, if a diagram's SVG is no
+    longer in the cache.
+    """
+    pictures = []
+    for doc_pr in element.iter(qn('wp:docPr')):
+        name = doc_pr.get('name', '')
+        if name.startswith(NAME_PREFIX):
+            with open(os.path.join(cache_dir, name[len(NAME_PREFIX):] + '.svg'), 'rb') as f:
+                pictures.append((doc_pr, f.read()))
+
+    part = doc.part
+    next_id = part.next_id
+    for doc_pr, svg in pictures:
+        blip = next(doc_pr.getparent().iter(qn('a:blip')))
+        blip.set(qn('r:embed'), part.get_or_add_image(io.BytesIO(BLANK_PNG))[0])
+        next(blip.iter(f'{{{SVG_NS}}}svgBlip')).set(qn('r:embed'), _svg_rid(part, svg))
+        doc_pr.set('id', str(next_id))
+        next_id += 1
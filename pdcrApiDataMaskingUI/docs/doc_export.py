@@ -0,0 +1,266 @@
+"""Write one document model to .docx, .html and .md from a single build.
+
+The model is the list of block events md_to_docx.parse_blocks() produces
+(headings, paragraphs, bullets, numbered items, tables, code/diagrams and
+page breaks). md_to_docx builds it from a Markdown file and
+generate_rbac_v2 builds it from rbac.js, and export() hands the same list
+to every writer in turn, so the content work is done once per build
+whatever the number of formats. The writers run one after another: they
+are pure Python, so threads would only take turns on the GIL, and the
+.docx save (most of the time) needs the caller's build_docx, which does
+not pickle for a process pool.
+
+The HTML is a single static page for the internal portal. Its print
+stylesheet turns page_break events into page breaks and repeats table
+headers on every page, so printing it (or running it through a
+headless browser) gives a PDF laid out like the .docx. Diagrams are
+inlined as the same SVG the .docx embeds (diagram_renderer's cache), or
+as <pre> text when they have no line art or DOCS_DIAGRAMS=text is set.
+
+The Markdown writer is the inverse of parse_blocks(): parsing its output
+gives the same events back.
+
+Usage (Markdown sources, like md_to_docx.py but to several formats):
+    python doc_export.py [--formats docx,html] [--output-dir DIR] [file.md ...]
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from html import escape
+
+import diagram_renderer
+from base_template import new_document
+from docx_helpers import DIAGRAM_FONT_SIZE
+from md_to_docx import DOCS_DIR, INLINE_RE, LINK_RE, parse_blocks, render_blocks
+from output_paths import atomic_write, output_file, save_document, set_output_dir
+
+FORMATS = ('docx', 'html', 'md')
+
+STYLESHEET = '''
+body { font-family: Calibri, Arial, sans-serif; font-size: 11pt; line-height: 1.4;
+       max-width: 60em; margin: 2em auto; padding: 0 1em; color: #222; }
+h1, h2, h3, h4, h5, h6 { color: #003366; }
+h1.title { font-size: 24pt; text-align: center; }
+table { border-collapse: collapse; margin: 0.5em 0 1em; width: 100%; }
+th, td { border: 1px solid #999; padding: 0.25em 0.5em; text-align: left; vertical-align: top; }
+th { background: #003366; color: #fff; }
+pre, code { font-family: "Courier New", monospace; }
+pre { font-size: 8pt; overflow-x: auto; }
+figure.diagram { margin: 1em 0; overflow-x: auto; }
+.page-break { border-top: 1px dashed #ccc; margin: 2em 0; }
+@media print {
+  body { max-width: none; margin: 0; }
+  .page-break { border: 0; margin: 0; break-after: page; }
+  thead { display: table-header-group; }
+  tr, figure, pre { break-inside: avoid; }
+  h1, h2, h3, h4 { break-after: avoid; }
+}
+@page { size: A4; margin: 2cm; }
+'''
+
+
+def _table_row(cells):
+    return '| ' + ' | '.join(str(cell).replace('|', '\\|') for cell in cells) + ' |'
+
+
+def format_markdown(blocks):
+    """Yield Markdown lines for parse_blocks() events, the inverse of parse_blocks()
+
+    Empty paragraphs (spacing in a .docx) are skipped.
+    """
+    previous = None
+    number = 0
+    for block in blocks:
+        kind = block[0]
+        if kind == 'paragraph' and not block[1]:
+            continue
+        # Items of one list stay on consecutive lines
+        if previous is not None and not (kind == previous and kind in ('bullet', 'number')):
+            yield ''
+        number = number + 1 if kind == previous == 'number' else 1
+        if kind == 'heading':
+            yield '#' * (block[1] + 1) + ' ' + block[2]
+        elif kind == 'paragraph':
+            yield from block[1].split('\n')
+        elif kind == 'bullet':
+            yield '  ' * (block[1] - 1) + '- ' + block[2]
+        elif kind == 'number':
+            yield f'{number}. {block[1]}'
+        elif kind == 'table':
+            yield _table_row(block[1])
+            yield '|' + '|'.join('-' * (len(str(header)) + 2) for header in block[1]) + '|'
+            yield from (_table_row(row) for row in block[2])
+        elif kind == 'code':
+            yield '```'
+            yield from block[1].split('\n')
+            yield '```'
+        elif kind == 'page_break':
+            yield '---'
+        previous = kind
+
+
+def slug(text):
+    return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-') or 'section'
+
+
+def inline_html(text):
+    """HTML for inline Markdown: **bold**, `code` and [text](link)"""
+    parts = []
+    for part in INLINE_RE.split(text):
+        if part.startswith('**') and part.endswith('**') and len(part) > 4:
+            parts.append(f'<strong>{inline_html(part[2:-2])}</strong>')
+        elif part.startswith('`') and part.endswith('`') and len(part) > 2:
+            parts.append(f'<code>{escape(part[1:-1])}</code>')
+        else:
+            position = 0
+            for link in LINK_RE.finditer(part):
+                parts.append(escape(part[position:link.start()]))
+                parts.append(f'<a href="{escape(link.group(2))}">{escape(link.group(1))}</a>')
+                position = link.end()
+            parts.append(escape(part[position:]))
+    return ''.join(parts)
+
+
+def diagram_html(text, font_size=DIAGRAM_FONT_SIZE):
+    if diagram_renderer.diagram_mode() == 'image':
+        _, svg = diagram_renderer.cached_svg(text, font_size)
+        if svg:
+            label = escape(text.strip().splitlines()[0]) if text.strip() else 'Diagram'
+            return f'<figure class="diagram" role="img" aria-label="{label}">{svg.decode("utf-8")}</figure>'
+    return f'<pre>{escape(text)}</pre>'
+
+
+def format_html(blocks, title):
+    """Yield the lines of a standalone HTML page for block events"""
+    yield '<!DOCTYPE html>'
+    yield '<html lang="en">'
+    yield '<head>'
+    yield '<meta charset="utf-8">'
+    yield f'<title>{escape(title)}</title>'
+    yield f'<style>{STYLESHEET}</style>'
+    yield '</head>'
+    yield '<body>'
+
+    lists = []          # [tag, item open] of the open lists, innermost last
+    ids = set()
+
+    def close_list():
+        tag, item_open = lists.pop()
+        return ('</li>' if item_open else '') + f'</{tag}>'
+
+    for block in blocks:
+        kind = block[0]
+        if kind == 'bullet':
+            depth, tag = block[1], 'ul'
+        elif kind == 'number':
+            depth, tag = 1, 'ol'
+        else:
+            depth, tag = 0, None
+        while len(lists) > depth or (lists and len(lists) == depth and lists[-1][0] != tag):
+            yield close_list()
+
+        if kind in ('bullet', 'number'):
+            # Nested lists go inside the open item of their parent list
+            if len(lists) == depth and lists[-1][1]:
+                yield '</li>'
+            while len(lists) < depth:
+                lists.append([tag, False])
+                yield f'<{tag}>'
+            lists[-1][1] = True
+            yield f'<li>{inline_html(block[-1])}'
+        elif kind == 'heading':
+            level, text = block[1], block[2]
+            anchor = slug(text)
+            while anchor in ids:
+                anchor += '-'
+            ids.add(anchor)
+            if level == 0:
+                yield f'<h1 class="title" id="{anchor}">{inline_html(text)}</h1>'
+            else:
+                tag = f'h{min(level + 1, 6)}'
+                yield f'<{tag} id="{anchor}">{inline_html(text)}</{tag}>'
+        elif kind == 'paragraph':
+            if block[1]:
+                yield '<p>' + '<br>'.join(inline_html(line) for line in block[1].split('\n')) + '</p>'
+        elif kind == 'table':
+            yield '<table>'
+            yield '<thead><tr>' + ''.join(f'<th>{escape(str(cell))}</th>' for cell in block[1]) + '</tr></thead>'
+            yield '<tbody>'
+            for row in block[2]:
+                yield '<tr>' + ''.join(f'<td>{escape(str(cell))}</td>' for cell in row) + '</tr>'
+            yield '</tbody>'
+            yield '</table>'
+        elif kind == 'code':
+            yield diagram_html(block[1])
+        elif kind == 'page_break':
+            yield '<div class="page-break"></div>'
+    while lists:
+        yield close_list()
+    yield '</body>'
+    yield '</html>'
+
+
+def _write_lines(lines, path):
+    with atomic_write(path, 'w', encoding='utf-8') as f:
+        for line in lines:
+            f.write(line + '\n')
+    return path
+
+
+def export(blocks, paths, build_docx=None, title=None, markdown_blocks=None):
+    """Write blocks to every format in paths ({'docx': path, 'html': path, 'md': path})
+
+    build_docx(blocks) returns the python-docx Document to save (for
+    documents with a title page or other content outside the model); it
+    defaults to rendering the blocks into a new document. markdown_blocks
+    replaces blocks for the .md and .html, e.g. with a text title instead
+    of the .docx title page. Returns paths.
+    """
+    build_docx = build_docx or (lambda blocks: render_blocks(new_document(), blocks))
+    text_blocks = markdown_blocks if markdown_blocks is not None else blocks
+    title = title or next((block[2] for block in text_blocks if block[0] == 'heading'), 'Document')
+    writers = {
+        'docx': lambda path: save_document(build_docx(blocks), path),
+        'html': lambda path: _write_lines(format_html(text_blocks, title), path),
+        'md': lambda path: _write_lines(format_markdown(text_blocks), path),
+    }
+    unknown = set(paths) - set(writers)
+    if unknown:
+        raise ValueError(f"Unknown export format(s): {', '.join(sorted(unknown))}")
+    for fmt, path in paths.items():
+        writers[fmt](path)
+    return paths
+
+
+def export_paths(docx_path, formats=FORMATS):
+    """{format: path} for the formats, named like docx_path with each format's extension"""
+    base = os.path.splitext(docx_path)[0]
+    return {fmt: f'{base}.{fmt}' for fmt in formats}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sources', nargs='*', help='Markdown files (default: every .md in docs/)')
+    parser.add_argument('--formats', default='docx,html',
+                        help=f"comma-separated formats out of {', '.join(FORMATS)} (default docx,html)")
+    parser.add_argument('--output-dir', help='directory for the generated documents')
+    args = parser.parse_args(argv)
+    set_output_dir(args.output_dir)
+    formats = [fmt.strip() for fmt in args.formats.split(',') if fmt.strip()]
+
+    sources = args.sources or sorted(glob.glob(os.path.join(DOCS_DIR, '*.md')))
+    for md_path in sources:
+        start = time.perf_counter()
+        with open(md_path, encoding='utf-8') as f:
+            blocks = list(parse_blocks(f))
+        base = os.path.splitext(os.path.basename(md_path))[0]
+        paths = export(blocks, export_paths(output_file(base + '.docx'), formats))
+        print(f"{os.path.basename(md_path)} -> {', '.join(paths.values())} ({time.perf_counter() - start:.2f}s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+"""Build any number of docs/ documents from one process.
+
+Each generator is a subcommand. python-docx is imported and the styled base
+template (base_template.py) is loaded once, then every document starts from
+a deep copy of it, so building N documents pays the startup cost once.
+Generator modules are only imported when their subcommand runs.
+
+Usage:
+    python docs_cli.py tech-arch-v2 rbac-v2     build the listed documents
+    python docs_cli.py all                      build every generated document
+                                                (run `markdown` on its own)
+    python docs_cli.py --stdin                  read subcommands line by line
+                                                (keeps one process alive)
+    python docs_cli.py --list                   show the subcommands
+    python docs_cli.py --check                  build every subcommand into a temporary
+                                                directory; exit 1 if any is invalid
+
+--output-dir DIR writes the documents to DIR instead of docs/.
+--diagrams text keeps ASCII diagrams as monospace text instead of SVG pictures.
+--profile FILE records the DocHelpers calls of every subcommand (build_profile.py)
+and writes them to FILE as collapsed stacks when the process ends.
+--pack [LEVEL] packs each document after it is built (docx_pack.py).
+Each document is validated after it is built (docx_validate.py) and the exit
+status is 1 if any has violations; --no-validate skips this.
+"""
+import argparse
+import contextlib
+import importlib
+import tempfile
+import sys
+import time
+
+from build_profile import HelperProfile, set_profile_path
+from diagram_renderer import set_diagram_mode
+from docx_pack import DEFAULT_LEVEL, describe, pack
+from docx_validate import check
+from output_paths import set_output_dir
+
+# subcommand -> (module, main() arguments, description)
+COMMANDS = {
+    'technical-architecture': ('build_technical_architecture', (), 'Technical_Architecture.docx, single pass'),
+    'tech-arch-v2': ('generate_tech_arch_v2', (), 'Technical_Architecture_v2.docx'),
+    'rbac-v2': ('generate_rbac_v2', (), 'RBAC_Access_Matrix_v2.docx'),
+    'updated-doc': ('generate_updated_doc', (), 'Technical_Architecture.docx, updated sections'),
+    'full-document': ('create_full_document', (), 'Technical_Architecture.docx, title page and Sections 1-3'),
+    'markdown': ('md_to_docx', ([],), 'every docs/*.md compiled to .docx'),
+}
+
+# `all` skips the alternative Technical_Architecture.docx builders, which
+# would overwrite the single-pass output, and `markdown`, which compiles
+# Technical_Architecture.md, Technical_Architecture_v2.md and
+# RBAC_Access_Matrix_v2.md over the .docx files the generators just wrote
+ALL = ['technical-architecture', 'tech-arch-v2', 'rbac-v2']
+
+
+def warm_up():
+    """Import python-docx and build the base template; return seconds taken"""
+    start = time.perf_counter()
+    import base_template
+    base_template.new_document()
+    return time.perf_counter() - start
+
+
+def run_command(name, profile=None, pack_level=None, validate=True):
+    """Run one subcommand; returns (seconds, True if its documents are valid)"""
+    module_name, args, _ = COMMANDS[name]
+    start = time.perf_counter()
+    module = importlib.import_module(module_name)
+    with profile.installed(name) if profile else contextlib.nullcontext():
+        paths = module.main(*args)
+    paths = paths if isinstance(paths, list) else [paths]
+    valid = all([check(path) for path in paths]) if validate else True
+    if pack_level is not None:
+        for path in paths:
+            print(describe(path, pack(path, compresslevel=pack_level)))
+    return time.perf_counter() - start, valid
+
+
+def check_commands():
+    """Build every subcommand into a temporary directory; returns 1 if any document is invalid"""
+    with tempfile.TemporaryDirectory() as directory:
+        set_output_dir(directory)
+        invalid = [name for name in COMMANDS if not run_command(name)[1]]
+    print(f"\n{len(COMMANDS) - len(invalid)} of {len(COMMANDS)} subcommands build valid documents")
+    for name in invalid:
+        print(f"  INVALID  {name}")
+    return 1 if invalid else 0
+
+
+def expand(names):
+    for name in names:
+        if name == 'all':
+            yield from ALL
+        elif name in COMMANDS:
+            yield name
+        else:
+            raise SystemExit(f"Unknown subcommand {name!r}; choose from: all, {', '.join(COMMANDS)}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('commands', nargs='*', help='subcommands to run, in order')
+    parser.add_argument('--stdin', action='store_true', help='read subcommands from stdin, one per line')
+    parser.add_argument('--list', action='store_true', help='list subcommands and exit')
+    parser.add_argument('--check', action='store_true',
+                        help='build and validate every subcommand in a temporary directory, then exit')
+    parser.add_argument('--output-dir', help='directory for the generated documents')
+    parser.add_argument('--diagrams', choices=('image', 'text'),
+                        help='render ASCII diagrams as SVG pictures (default) or monospace text')
+    parser.add_argument('--profile', metavar='FILE', help='profile the helper calls, writing collapsed stacks to FILE')
+    parser.add_argument('--pack', nargs='?', type=int, const=DEFAULT_LEVEL, choices=range(10), metavar='LEVEL',
+                        help=f'pack the documents, zipped at this deflate level (default {DEFAULT_LEVEL})')
+    parser.add_argument('--no-validate', action='store_true', help='do not check the built documents')
+    args = parser.parse_args(argv)
+    set_output_dir(args.output_dir)
+    set_diagram_mode(args.diagrams)
+    set_profile_path(args.profile)
+    profile = HelperProfile() if args.profile else None
+
+    if args.list:
+        for name, (module_name, _, description) in COMMANDS.items():
+            print(f"{name:<24} {module_name + '.py':<34} {description}")
+        return 0
+
+    if args.check:
+        return check_commands()
+
+    print(f"Startup (python-docx import + base template): {warm_up():.2f}s")
+    timings = []
+    invalid = []
+    for name in expand(args.commands):
+        seconds, valid = run_command(name, profile, args.pack, not args.no_validate)
+        timings.append((name, seconds))
+        if not valid:
+            invalid.append(name)
+    if args.stdin:
+        for line in sys.stdin:
+            # A mistyped line fails on its own; the process stays up for the next one
+            try:
+                names = list(expand(line.split()))
+            except SystemExit as e:
+                print(e, file=sys.stderr, flush=True)
+                invalid.append(line.strip())
+                continue
+            for name in names:
+                seconds, valid = run_command(name, profile, args.pack, not args.no_validate)
+                timings.append((name, seconds))
+                if not valid:
+                    invalid.append(name)
+                print(f"[{name}] done in {seconds:.2f}s{'' if valid else ' (INVALID)'}", flush=True)
+
+    if timings or invalid:
+        print()
+        for name, seconds in timings:
+            print(f"  {name:<24} {seconds:6.2f}s{'  INVALID' if name in invalid else ''}")
+        for line in [name for name in invalid if name not in COMMANDS]:
+            print(f"  {line:<24}  FAILED  (unknown subcommand)")
+    if profile:
+        profile.write_collapsed(args.profile)
+        profile.print_summary()
+        print(f"\nCollapsed stacks written to {args.profile}")
+    return 1 if invalid else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""Search index over the .docx and .md documents in docs/.
+
+Every heading, paragraph, bullet, code block, table cell and diagram (the
+text drawn in its SVG picture) is extracted into an SQLite database under
+.cache/, together with an inverted index
+from lower-cased word tokens to the blocks containing them. A query is
+tokenized the same way, the candidate blocks are the ones whose postings
+cover every query token, and those are checked for the query as a
+case-insensitive substring. So "/datamasking/workflows/execute" only
+matches that exact path, not blocks that contain the three words apart.
+
+The index is updated incrementally: files whose size and mtime are
+unchanged are skipped, files whose content hash is unchanged only get a
+new mtime, and only files that really changed are re-extracted. Bumping
+INDEX_VERSION when the extraction changes re-extracts everything once.
+
+Usage:
+    python docs_index.py update [file ...]
+    python docs_index.py search "/datamasking/workflows/execute" [--documents] [--limit N]
+"""
+import argparse
+import glob
+import hashlib
+import os
+import re
+import sqlite3
+import sys
+import time
+import zipfile
+
+from docx_diff import iter_blocks, section_name
+from md_to_docx import parse_blocks, plain_text
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+INDEX_PATH = os.path.join(DOCS_DIR, '.cache', 'index.sqlite')
+
+TOKEN_RE = re.compile(r'\w+')
+
+# Stored as the database's user_version; an index built by an older
+# extraction is emptied and rebuilt
+INDEX_VERSION = 2
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS documents (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS blocks (
+    id INTEGER PRIMARY KEY,
+    document INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+    kind TEXT NOT NULL,
+    section TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS blocks_document ON blocks(document);
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    block INTEGER NOT NULL REFERENCES blocks(id) ON DELETE CASCADE,
+    PRIMARY KEY (token, block)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_block ON postings(block);
+'''
+
+
+def tokens(text):
+    return set(TOKEN_RE.findall(text.lower()))
+
+
+def default_sources():
+    """Every .docx and .md in docs/, skipping Word lock files"""
+    paths = glob.glob(os.path.join(DOCS_DIR, '*.docx')) + glob.glob(os.path.join(DOCS_DIR, '*.md'))
+    return sorted(path for path in paths if not os.path.basename(path).startswith('~$'))
+
+
+def extract_markdown(path):
+    """(kind, section, text) for every block of a Markdown file"""
+    heading_path = ()
+    with open(path, encoding='utf-8') as f:
+        for block in parse_blocks(f):
+            kind = block[0]
+            if kind == 'heading' and block[1] > 0:
+                level, text = block[1], plain_text(block[2])
+                heading_path = heading_path[:level - 1] + ('',) * (level - 1 - len(heading_path)) + (text,)
+                yield 'heading', section_name(heading_path), text
+            elif kind == 'heading':
+                yield 'paragraph', section_name(heading_path), plain_text(block[2])
+            elif kind == 'table':
+                for cell in [*block[1], *(cell for row in block[2] for cell in row)]:
+                    if cell:
+                        yield 'cell', section_name(heading_path), cell
+            elif kind == 'code':
+                yield kind, section_name(heading_path), block[1]
+            elif kind in ('paragraph', 'bullet', 'number'):
+                yield kind, section_name(heading_path), plain_text(block[-1])
+
+
+def extract_docx(path):
+    """(kind, section, text) for every heading, paragraph, table cell and diagram of a .docx
+
+    Diagrams are indexed as 'diagram' blocks under the heading they sit in;
+    pictures with no text in their SVG are skipped.
+    """
+    for block in iter_blocks(path, cells=True, diagrams=True):
+        if block.kind != 'picture':
+            yield block.kind, section_name(block.path), block.text
+        elif block.text:
+            yield 'diagram', section_name(block.path), block.text
+
+
+def extract(path):
+    return extract_docx(path) if path.endswith('.docx') else extract_markdown(path)
+
+
+def _sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def connect(index_path=INDEX_PATH):
+    os.makedirs(os.path.dirname(index_path), exist_ok=True)
+    db = sqlite3.connect(index_path)
+    db.execute('PRAGMA foreign_keys = ON')
+    db.execute('PRAGMA journal_mode = WAL')
+    db.executescript(SCHEMA)
+    if db.execute('PRAGMA user_version').fetchone()[0] != INDEX_VERSION:
+        with db:
+            db.execute('DELETE FROM documents')
+            db.execute(f'PRAGMA user_version = {INDEX_VERSION}')
+    return db
+
+
+def _index_file(db, path, stat, sha256):
+    db.execute('DELETE FROM documents WHERE path = ?', (path,))
+    document = db.execute('INSERT INTO documents (path, size, mtime, sha256) VALUES (?, ?, ?, ?)',
+                          (path, stat.st_size, stat.st_mtime, sha256)).lastrowid
+    for kind, section, text in extract(path):
+        block = db.execute('INSERT INTO blocks (document, kind, section, text) VALUES (?, ?, ?, ?)',
+                           (document, kind, section, text)).lastrowid
+        db.executemany('INSERT INTO postings (token, block) VALUES (?, ?)',
+                       ((token, block) for token in tokens(text)))
+
+
+def update(db, paths=None):
+    """Bring the index up to date with paths and drop documents deleted from disk
+
+    Returns {'indexed': [...], 'touched': [...], 'removed': [...]} paths.
+    """
+    paths = [os.path.abspath(path) for path in (paths or default_sources())]
+    known = {path: (size, mtime, sha256) for path, size, mtime, sha256
+             in db.execute('SELECT path, size, mtime, sha256 FROM documents')}
+    changes = {'indexed': [], 'touched': [], 'removed': []}
+    with db:
+        for path in paths:
+            stat = os.stat(path)
+            previous = known.get(path)
+            if previous and previous[:2] == (stat.st_size, stat.st_mtime):
+                continue
+            sha256 = _sha256(path)
+            if previous and previous[2] == sha256:
+                db.execute('UPDATE documents SET size = ?, mtime = ? WHERE path = ?',
+                           (stat.st_size, stat.st_mtime, path))
+                changes['touched'].append(path)
+                continue
+            try:
+                _index_file(db, path, stat, sha256)
+            except (zipfile.BadZipFile, KeyError, UnicodeDecodeError) as e:
+                print(f"Skipping {path}: {e}", file=sys.stderr)
+                continue
+            changes['indexed'].append(path)
+        for path in sorted(set(known) - set(paths)):
+            if not os.path.exists(path):
+                db.execute('DELETE FROM documents WHERE path = ?', (path,))
+                changes['removed'].append(path)
+    return changes
+
+
+def search(db, query, limit=None):
+    """(path, kind, section, text) for blocks containing query, case-insensitively"""
+    query_tokens = sorted(tokens(query))
+    if not query_tokens:
+        return []
+    placeholders = ', '.join('?' * len(query_tokens))
+    rows = db.execute(
+        f'''SELECT documents.path, blocks.kind, blocks.section, blocks.text
+            FROM (SELECT block FROM postings WHERE token IN ({placeholders})
+                  GROUP BY block HAVING COUNT(*) = ?) AS hits
+            JOIN blocks ON blocks.id = hits.block
+            JOIN documents ON documents.id = blocks.document
+            ORDER BY documents.path, blocks.id''',
+        (*query_tokens, len(query_tokens)))
+    needle = query.lower()
+    matches = (row for row in rows if needle in row[3].lower())
+    return list(matches) if limit is None else [row for _, row in zip(range(limit), matches)]
+
+
+def snippet(text, query, width=100):
+    """The part of text around the first occurrence of query, on one line"""
+    text = ' '.join(text.split())
+    at = text.lower().find(query.lower())
+    start = max(0, at - (width - len(query)) // 2)
+    return ('...' if start else '') + text[start:start + width] + ('...' if start + width < len(text) else '')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--index', default=INDEX_PATH, help='index database path')
+    commands = parser.add_subparsers(dest='command', required=True)
+    update_parser = commands.add_parser('update', help='index new and changed documents')
+    update_parser.add_argument('files', nargs='*', help='files to index (default: every .docx and .md in docs/)')
+    search_parser = commands.add_parser('search', help='find blocks containing a phrase')
+    search_parser.add_argument('query')
+    search_parser.add_argument('--documents', action='store_true', help='only list the matching documents')
+    search_parser.add_argument('--limit', type=int, help='show at most this many blocks')
+    search_parser.add_argument('--no-update', action='store_true', help='search the index as it is')
+    args = parser.parse_args(argv)
+
+    db = connect(args.index)
+    start = time.perf_counter()
+    if args.command == 'update' or not args.no_update:
+        changes = update(db, args.files if args.command == 'update' else None)
+        if args.command == 'update':
+            for label, paths in changes.items():
+                for path in paths:
+                    print(f"{label:<8} {os.path.relpath(path, DOCS_DIR)}")
+            print(f"Index up to date in {time.perf_counter() - start:.2f}s")
+            return 0
+
+    start = time.perf_counter()
+    matches = search(db, args.query, None if args.documents else args.limit)
+    elapsed = (time.perf_counter() - start) * 1000
+    if args.documents:
+        counts = {}
+        for path, *_ in matches:
+            counts[path] = counts.get(path, 0) + 1
+        for path, count in counts.items():
+            print(f"{os.path.relpath(path, DOCS_DIR)}  ({count} match{'es' if count > 1 else ''})")
+    else:
+        for path, kind, section, text in matches:
+            print(f"{os.path.relpath(path, DOCS_DIR)} | {section} | {kind}\n    {snippet(text, args.query)}")
+    print(f"\n{len(matches)} match(es) in {elapsed:.1f} ms")
+    return 0 if matches else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
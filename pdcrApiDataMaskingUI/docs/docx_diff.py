@@ -0,0 +1,366 @@
+"""Structural diff between two .docx files.
+
+Both documents are streamed from word/document.xml with iterparse, so only
+one body block is in memory at a time. The blocks are heading and
+text paragraphs, one entry per table row, and pictures (as their name).
+They are aligned with Myers' linear-space diff and every edit is
+attributed to the section it falls in, identified by its heading path
+("4. COMPONENT ARCHITECTURE > 4.1 Frontend Component Structure").
+
+Sections are reported as added (heading path only in the new document),
+removed (only in the old one) or changed (blocks inserted or deleted
+under an unchanged heading path).
+
+Usage:
+    python docx_diff.py old.docx new.docx [--verbose]
+
+Exit status is 0 if the documents match, 1 if they differ.
+"""
+import argparse
+import posixpath
+import re
+import sys
+import time
+import zipfile
+from collections import namedtuple
+
+from lxml import etree
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W = f'{{{W_NS}}}'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+WP_DOC_PR = '{http://schemas.openxmlformats.org/drawingml/2006/wordprocessingDrawing}docPr'
+SVG_BLIP = '{http://schemas.microsoft.com/office/drawing/2016/SVG/main}svgBlip'
+R_EMBED = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+SVG_TEXT = '{http://www.w3.org/2000/svg}text'
+
+HEADING_NAME_RE = re.compile(r'^(?:heading (\d)|title)$', re.I)
+
+# kind is 'heading', 'paragraph', 'row', 'cell' or 'picture'; path is the tuple of
+# enclosing heading texts (including the block itself for headings)
+Block = namedtuple('Block', 'kind text path')
+
+
+def heading_levels(package):
+    """Map paragraph style ids to heading levels using word/styles.xml (0 for Title)"""
+    try:
+        styles = etree.fromstring(package.read('word/styles.xml'))
+    except KeyError:
+        return {}
+    levels = {}
+    for style in styles.iter(f'{W}style'):
+        name = style.find(f'{W}name')
+        match = HEADING_NAME_RE.match(name.get(f'{W}val', '')) if name is not None else None
+        if match:
+            levels[style.get(f'{W}styleId')] = int(match.group(1) or 0)
+    return levels
+
+
+def element_text(element):
+    """Visible text of a paragraph or cell: tabs and breaks kept, runs joined
+
+    The text fallback of a diagram picture (mc:Fallback) is not counted; the
+    picture is its own block.
+    """
+    parts = []
+    for node in element.iter(f'{W}t', f'{W}tab', f'{W}br', f'{W}cr'):
+        if any(True for _ in node.iterancestors(MC_FALLBACK)):
+            continue
+        if node.tag == f'{W}t':
+            parts.append(node.text or '')
+        else:
+            parts.append('\t' if node.tag == f'{W}tab' else '\n')
+    return ''.join(parts)
+
+
+def relationship_targets(package, part='word/document.xml'):
+    """Map a part's relationship ids to the package names of their targets"""
+    directory, name = posixpath.split(part)
+    try:
+        rels = etree.fromstring(package.read(posixpath.join(directory, '_rels', name + '.rels')))
+    except KeyError:
+        return {}
+    return {rel.get('Id'): posixpath.normpath(posixpath.join(directory, rel.get('Target'))).lstrip('/')
+            for rel in rels if rel.get('TargetMode') != 'External'}
+
+
+def diagram_text(package, targets, doc_pr):
+    """The <text> runs of the SVG behind a picture, one line per row of the diagram
+
+    Returns '' for pictures without an SVG part.
+    """
+    blip = next(doc_pr.getparent().iter(SVG_BLIP), None)
+    target = targets.get(blip.get(R_EMBED)) if blip is not None else None
+    if target not in package.NameToInfo:
+        return ''
+    rows = {}
+    for text in etree.fromstring(package.read(target)).iter(SVG_TEXT):
+        rows.setdefault(text.get('y'), []).append(text.text or '')
+    return '\n'.join(' '.join(runs) for runs in rows.values())
+
+
+def iter_blocks(path, cells=False, diagrams=False):
+    """Yield the Blocks of a .docx body in document order
+
+    Tables give one 'row' block per row, or with cells=True one 'cell' block
+    per non-empty cell. A picture's text is its name, or with diagrams=True
+    the text drawn in its SVG (see diagram_text).
+    """
+    with zipfile.ZipFile(path) as package:
+        levels = heading_levels(package)
+        targets = relationship_targets(package) if diagrams else {}
+        heading_path = ()
+        with package.open('word/document.xml') as document:
+            for _, element in etree.iterparse(document, events=('end',), tag=(f'{W}p', f'{W}tbl')):
+                parent = element.getparent()
+                if parent is None or parent.tag != f'{W}body':
+                    continue
+                if element.tag == f'{W}tbl':
+                    for row in element.iter(f'{W}tr'):
+                        texts = [element_text(cell) for cell in row.iter(f'{W}tc')]
+                        if cells:
+                            yield from (Block('cell', text, heading_path) for text in texts if text)
+                        else:
+                            yield Block('row', ' | '.join(texts), heading_path)
+                else:
+                    style = element.find(f'{W}pPr/{W}pStyle')
+                    level = levels.get(style.get(f'{W}val')) if style is not None else None
+                    text = element_text(element)
+                    # The title (level 0) is not part of the heading path
+                    if level:
+                        heading_path = heading_path[:level - 1] + ('',) * (level - 1 - len(heading_path)) + (text,)
+                        yield Block('heading', text, heading_path)
+                    elif text:
+                        yield Block('paragraph', text, heading_path)
+                    for doc_pr in element.iter(WP_DOC_PR):
+                        text = diagram_text(package, targets, doc_pr) if diagrams else doc_pr.get('name', '')
+                        yield Block('picture', text, heading_path)
+                # Drop the finished block and anything before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+
+# Largest D searched for in one box. A box whose middle snake is further away
+# than this is given up on and becomes a single replace, so no pair of
+# documents costs more than O((N + M) * MAX_D) however little they share.
+MAX_D = 1000
+
+
+def _middle_snake(a, b, left, top, right, bottom):
+    """Myers' middle snake of the box a[left:right] x b[top:bottom]
+
+    Returns ((x0, y0), (x1, y1)), the start and end of a snake on an optimal
+    edit path through the box, using O(width + height) space; or None when
+    every path through the box needs more than 2 * MAX_D edits.
+    """
+    width, height = right - left, bottom - top
+    size = width + height
+    delta = width - height
+    limit = min((size + 1) // 2, MAX_D)
+    forward = [0] * (2 * limit + 2)
+    backward = [0] * (2 * limit + 2)
+    forward[1] = left
+    backward[1] = bottom
+
+    for d in range(limit + 1):
+        for k in range(d, -d - 1, -2):
+            c = k - delta
+            if k == -d or (k != d and forward[k - 1] < forward[k + 1]):
+                px = x = forward[k + 1]
+            else:
+                px = forward[k - 1]
+                x = px + 1
+            y = top + (x - left) - k
+            py = y if d == 0 or x != px else y - 1
+            while x < right and y < bottom and a[x] == b[y]:
+                x, y = x + 1, y + 1
+            forward[k] = x
+            if delta % 2 and -(d - 1) <= c <= d - 1 and y >= backward[c]:
+                return (px, py), (x, y)
+
+        for c in range(d, -d - 1, -2):
+            k = c + delta
+            if c == -d or (c != d and backward[c - 1] > backward[c + 1]):
+                py = y = backward[c + 1]
+            else:
+                py = backward[c - 1]
+                y = py - 1
+            x = left + (y - top) + k
+            px = x if d == 0 or y != py else x + 1
+            while x > left and y > top and a[x - 1] == b[y - 1]:
+                x, y = x - 1, y - 1
+            backward[c] = y
+            if not delta % 2 and -d <= k <= d and x <= forward[k]:
+                return (x, y), (px, py)
+    return None
+
+
+def _find_path(a, b, left, top, right, bottom):
+    """Points on an edit path from (left, top) to (right, bottom)
+
+    A point (x, y, True) ends a box that was given up on: everything between
+    the previous point and it is replaced.
+    """
+    if right - left + bottom - top == 0:
+        return None
+    snake = _middle_snake(a, b, left, top, right, bottom)
+    if snake is None:
+        return [(right, bottom, True)]
+    start, finish = snake
+    head = _find_path(a, b, left, top, *start) or [start]
+    tail = _find_path(a, b, *finish, right, bottom) or [finish]
+    return head + tail
+
+
+def _matches(a, b):
+    """(i, j) pairs of a[i] == b[j] kept unchanged by the edit path"""
+    pairs = []
+    x = y = 0
+    for px, py, *given_up in (_find_path(a, b, 0, 0, len(a), len(b)) or []) + [(len(a), len(b))]:
+        if given_up:
+            x, y = px, py
+            continue
+        # Between consecutive points there is at most one insert or delete,
+        # with runs of equal items on either side of it
+        x, y = _diagonal(pairs, a, b, x, y, px, py)
+        if px - x > py - y:
+            x += 1
+        elif py - y > px - x:
+            y += 1
+        x, y = _diagonal(pairs, a, b, x, y, px, py)
+    return pairs
+
+
+def _diagonal(pairs, a, b, x, y, px, py):
+    while x < px and y < py and a[x] == b[y]:
+        pairs.append((x, y))
+        x, y = x + 1, y + 1
+    return x, y
+
+
+def diff_opcodes(a, b):
+    """Edit script turning a into b, as difflib-style (tag, i1, i2, j1, j2) tuples
+
+    a and b are sequences of hashable items. The common prefix and suffix are
+    trimmed first, and items that occur on only one side (which can only be
+    deleted or inserted) are left out of the search. The rest is split
+    recursively at Myers' middle snake, so time is O((N + M) D) and space is
+    linear, with D capped at MAX_D per box (see _middle_snake).
+    """
+    n, m = len(a), len(b)
+    prefix = 0
+    while prefix < n and prefix < m and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < n - prefix and suffix < m - prefix and a[n - 1 - suffix] == b[m - 1 - suffix]:
+        suffix += 1
+
+    in_a, in_b = set(a[prefix:n - suffix]), set(b[prefix:m - suffix])
+    a_index = [i for i in range(prefix, n - suffix) if a[i] in in_b]
+    b_index = [j for j in range(prefix, m - suffix) if b[j] in in_a]
+    matches = [(i, i) for i in range(prefix)]
+    matches += [(a_index[x], b_index[y])
+                for x, y in _matches([a[i] for i in a_index], [b[j] for j in b_index])]
+    matches += [(n - suffix + k, m - suffix + k) for k in range(suffix)]
+
+    opcodes = []
+    x = y = 0
+    for i, j in matches + [(n, m)]:
+        if i > x:
+            _append(opcodes, 'delete', x, i, y, y)
+        if j > y:
+            _append(opcodes, 'insert', i, i, y, j)
+        if i < n:
+            _append(opcodes, 'equal', i, i + 1, j, j + 1)
+        x, y = i + 1, j + 1
+    return [tuple(op) for op in opcodes]
+
+
+def _append(opcodes, tag, i1, i2, j1, j2):
+    """Add an edit, merging it into the previous one where they touch"""
+    if opcodes:
+        last = opcodes[-1]
+        if last[0] == tag or (tag != 'equal' and last[0] != 'equal'):
+            if last[0] != tag:
+                last[0] = 'replace'
+            last[2], last[4] = i2, j2
+            return
+    opcodes.append([tag, i1, i2, j1, j2])
+
+
+def section_name(path):
+    return ' > '.join(heading for heading in path if heading) or '(before first heading)'
+
+
+def diff_documents(old_path, new_path):
+    """Compare two .docx files section by section
+
+    Returns (added, removed, changed, edits): added and removed are lists of
+    heading paths, changed maps a heading path to (blocks removed, blocks
+    added), and edits is the list of (tag, old blocks, new blocks) edits.
+    """
+    old = list(iter_blocks(old_path))
+    new = list(iter_blocks(new_path))
+    # Diff small ints instead of strings: one id per distinct (kind, text)
+    ids = {}
+    old_keys = [ids.setdefault(block[:2], len(ids)) for block in old]
+    new_keys = [ids.setdefault(block[:2], len(ids)) for block in new]
+
+    old_paths = dict.fromkeys(block.path for block in old)
+    new_paths = dict.fromkeys(block.path for block in new)
+    changed = {}
+    edits = []
+    for tag, i1, i2, j1, j2 in diff_opcodes(old_keys, new_keys):
+        if tag == 'equal':
+            continue
+        edits.append((tag, old[i1:i2], new[j1:j2]))
+        for block in old[i1:i2]:
+            if block.path in new_paths:
+                changed.setdefault(block.path, [0, 0])[0] += 1
+        for block in new[j1:j2]:
+            if block.path in old_paths:
+                changed.setdefault(block.path, [0, 0])[1] += 1
+
+    added = [path for path in new_paths if path not in old_paths]
+    removed = [path for path in old_paths if path not in new_paths]
+    return added, removed, {path: tuple(counts) for path, counts in changed.items()}, edits
+
+
+def print_report(added, removed, changed, edits, verbose=False):
+    for label, paths in (('Added', added), ('Removed', removed)):
+        if paths:
+            print(f"{label} sections ({len(paths)}):")
+            for path in paths:
+                print(f"  {'+' if label == 'Added' else '-'} {section_name(path)}")
+    if changed:
+        print(f"Changed sections ({len(changed)}):")
+        for path, (deleted, inserted) in changed.items():
+            print(f"  ~ {section_name(path)}  (-{deleted} +{inserted} blocks)")
+    if verbose:
+        for _, old_blocks, new_blocks in edits:
+            print()
+            for sign, blocks in (('-', old_blocks), ('+', new_blocks)):
+                for block in blocks:
+                    print(f"{sign} [{block.kind}] {block.text}".replace('\n', '\n    '))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('old', help='original .docx')
+    parser.add_argument('new', help='changed .docx')
+    parser.add_argument('-v', '--verbose', action='store_true', help='also print every changed block')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    added, removed, changed, edits = diff_documents(args.old, args.new)
+    if not edits:
+        print(f"No differences ({time.perf_counter() - start:.2f}s)")
+        return 0
+    print_report(added, removed, changed, edits, args.verbose)
+    print(f"\n{len(edits)} edit(s) in {time.perf_counter() - start:.2f}s")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
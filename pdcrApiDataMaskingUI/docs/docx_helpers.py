@@ -0,0 +1,184 @@
+"""Shared python-docx helpers for the docs/ generator scripts.
+
+Every generator used to redefine add_heading/add_text/add_bullet/add_diagram
+and re-parse a <w:shd> fragment for each shaded table cell. The helpers here
+build the shading and run-property elements once and clone them instead.
+
+create_table writes the whole <w:tbl> as one XML string and parses it once,
+so large tables (thousands of rows, rows given as lists or generators) do
+not go through python-docx's per-row add_row().cells grid walk.
+
+add_diagram embeds line-art diagrams as SVG pictures (diagram_renderer.py),
+with the monospace run as the fallback for consumers without SVG support,
+and uses only the monospace run for plain text blocks.
+
+Usage inside a generator:
+
+    helpers = DocHelpers(doc)
+    add_heading, add_text, add_bullet, add_diagram = (
+        helpers.add_heading, helpers.add_text, helpers.add_bullet, helpers.add_diagram)
+"""
+from copy import deepcopy
+from functools import lru_cache
+from xml.sax.saxutils import escape
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+from docx.shared import Emu
+from docx.table import Table
+from docx.text.paragraph import Paragraph
+
+import diagram_renderer
+
+DIAGRAM_FONT = 'Courier New'
+DIAGRAM_FONT_SIZE = 8
+HEADER_COLOR = "003366"
+HEADER_FONT_COLOR = "FFFFFF"
+
+
+@lru_cache(maxsize=None)
+def shading_element(color):
+    """Pre-built <w:shd> element for a fill color (clone before inserting)"""
+    return parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}"/>')
+
+
+def run_properties_xml(font=None, size=None, bold=False, color=None):
+    """<w:rPr> markup; size is in points, children follow CT_RPr schema order"""
+    children = ''
+    if font:
+        children += f'<w:rFonts w:ascii="{font}" w:hAnsi="{font}"/>'
+    if bold:
+        children += '<w:b/>'
+    if color:
+        children += f'<w:color w:val="{color}"/>'
+    if size:
+        children += f'<w:sz w:val="{int(size * 2)}"/>'
+    return f'<w:rPr>{children}</w:rPr>'
+
+
+@lru_cache(maxsize=None)
+def run_properties(font=None, size=None, bold=False, color=None):
+    """Pre-built <w:rPr> element (clone before inserting)"""
+    xml = run_properties_xml(font, size, bold, color)
+    return parse_xml(xml.replace('<w:rPr>', f'<w:rPr {nsdecls("w")}>', 1))
+
+
+def apply_run_properties(run, rpr):
+    """Replace the run's <w:rPr> with a clone of the cached element"""
+    r = run._r
+    if r.rPr is not None:
+        r.remove(r.rPr)
+    r.insert(0, deepcopy(rpr))
+    return run
+
+
+def set_cell_shading(cell, color):
+    """Set cell background color; returns the <w:shd> element"""
+    shd = deepcopy(shading_element(color))
+    cell._tc.get_or_add_tcPr().append(shd)
+    return shd
+
+
+def run_xml(text, rpr=''):
+    """<w:r> markup for text, matching python-docx's run.text setter
+
+    Tabs become <w:tab/>, line breaks become <w:br/>.
+    """
+    if not text:
+        return f'<w:r>{rpr}</w:r>'
+    if '\n' not in text and '\r' not in text and '\t' not in text:
+        space = ' xml:space="preserve"' if text != text.strip() else ''
+        return f'<w:r>{rpr}<w:t{space}>{escape(text)}</w:t></w:r>'
+    parts = ['<w:r>', rpr]
+    for i, chunk in enumerate(text.replace('\r\n', '\n').replace('\r', '\n').split('\n')):
+        if i:
+            parts.append('<w:br/>')
+        for j, piece in enumerate(chunk.split('\t')):
+            if j:
+                parts.append('<w:tab/>')
+            if piece:
+                space = ' xml:space="preserve"' if piece != piece.strip() else ''
+                parts.append(f'<w:t{space}>{escape(piece)}</w:t>')
+    parts.append('</w:r>')
+    return ''.join(parts)
+
+
+def table_xml(headers, rows, col_width, style_id, header_color=HEADER_COLOR):
+    """Yield the <w:tbl> markup for a header row plus data rows in one pass
+
+    col_width is in twips. rows may be any iterable (including a generator);
+    short rows are padded with empty cells.
+    """
+    cols = len(headers)
+    tc_pr = f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/></w:tcPr>'
+    header_tc_pr = (f'<w:tcPr><w:tcW w:type="dxa" w:w="{col_width}"/>'
+                    f'<w:shd w:fill="{header_color}"/></w:tcPr>')
+    header_rpr = run_properties_xml(bold=True, color=HEADER_FONT_COLOR)
+    empty_tc = f'<w:tc>{tc_pr}<w:p/></w:tc>'
+
+    yield (f'<w:tbl {nsdecls("w")}><w:tblPr><w:tblStyle w:val="{style_id}"/>'
+           '<w:tblW w:type="auto" w:w="0"/>'
+           '<w:tblLook w:firstColumn="1" w:firstRow="1" w:lastColumn="0" w:lastRow="0"'
+           ' w:noHBand="0" w:noVBand="1" w:val="04A0"/></w:tblPr><w:tblGrid>')
+    yield f'<w:gridCol w:w="{col_width}"/>' * cols
+    yield '</w:tblGrid><w:tr>'
+    for header in headers:
+        yield f'<w:tc>{header_tc_pr}<w:p>{run_xml(str(header), header_rpr)}</w:p></w:tc>'
+    yield '</w:tr>'
+
+    for row_data in rows:
+        cells = [f'<w:tc>{tc_pr}<w:p>{run_xml(str(cell_data))}</w:p></w:tc>' for cell_data in row_data]
+        if len(cells) > cols:
+            raise ValueError(f"Row has {len(cells)} cells but the table has {cols} columns: {row_data!r}")
+        yield '<w:tr>' + ''.join(cells) + empty_tc * (cols - len(cells)) + '</w:tr>'
+    yield '</w:tbl>'
+
+
+class DocHelpers:
+    """The add_* / create_table helpers bound to one Document"""
+
+    def __init__(self, doc, diagram_font_size=DIAGRAM_FONT_SIZE):
+        self.doc = doc
+        self._diagram_font_size = diagram_font_size
+        self._diagram_rpr = run_properties(DIAGRAM_FONT, diagram_font_size)
+        self._diagram_rpr_xml = run_properties_xml(DIAGRAM_FONT, diagram_font_size)
+
+    def add_heading(self, text, level=1):
+        """Add a heading with specified level"""
+        return self.doc.add_heading(text, level)
+
+    def add_text(self, text):
+        """Add a normal paragraph"""
+        return self.doc.add_paragraph(text)
+
+    def add_bullet(self, text, level=1):
+        """Add a bullet point (level 2 and 3 use the nested list styles)"""
+        style = 'List Bullet' if level == 1 else f'List Bullet {level}'
+        return self.doc.add_paragraph(text, style=style)
+
+    def add_diagram(self, text):
+        """Add ASCII diagram as an SVG picture, or in monospace font as the fallback"""
+        if diagram_renderer.diagram_mode() == 'image':
+            picture = diagram_renderer.embed_diagram(self.doc, text, self._diagram_font_size,
+                                                     rpr=self._diagram_rpr_xml)
+            if picture is not None:
+                self.doc.element.body.sectPr.addprevious(picture)
+                return Paragraph(picture, self.doc._body)
+        p = self.doc.add_paragraph()
+        apply_run_properties(p.add_run(text), self._diagram_rpr)
+        return p
+
+    def set_cell_shading(self, cell, color):
+        """Set cell background color"""
+        return set_cell_shading(cell, color)
+
+    def create_table(self, headers, rows, header_color=HEADER_COLOR):
+        """Create a formatted table
+
+        Column widths split the text block evenly, as doc.add_table() does.
+        """
+        col_width = Emu(self.doc._block_width // len(headers)).twips
+        style_id = self.doc.styles['Table Grid'].style_id
+        tbl = parse_xml(''.join(table_xml(headers, rows, col_width, style_id, header_color)))
+        self.doc.element.body._insert_tbl(tbl)
+        return Table(tbl, self.doc._body)
@@ -0,0 +1,215 @@
+"""Shrink generated .docx files after they are built.
+
+The generators set fonts run by run (title pages, table headers, diagram
+text), so document.xml repeats the same <w:rPr> many times, and every
+package carries all ~160 styles of the python-docx default template, most
+of them table styles nobody uses. pack() rewrites a package:
+
+    - run properties that repeat become named character styles
+      ("Packed Run 1", ...); the runs reference the style instead. Toggle
+      properties (bold, italic, caps, ...) stay on the run, because in a
+      style they would flip the paragraph style's value instead of setting it.
+    - styles not referenced from the document, numbering or settings (nor
+      through basedOn/next/link of a referenced style) are dropped from
+      styles.xml and stylesWithEffects.xml. Default styles are always kept.
+    - the package is re-zipped with the given deflate level; images, which
+      are already compressed, are stored.
+
+Only pack finished documents: the add_*.py scripts reopen
+Technical_Architecture.docx and need the styles a later step may use.
+build_all.py and docs_cli.py pack their outputs after every target has
+been built when given --pack.
+
+Usage:
+    python docx_pack.py file.docx [...] [--level 9] [--output-dir DIR]
+"""
+import argparse
+import io
+import os
+import re
+import sys
+import zipfile
+from collections import Counter
+
+from lxml import etree
+
+from output_paths import atomic_write
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W = f'{{{W_NS}}}'
+
+CONTENT_PART_RE = re.compile(r'^word/(document|header\d*|footer\d*|footnotes|endnotes|comments)\.xml$')
+STYLE_PARTS = ('word/styles.xml', 'word/stylesWithEffects.xml')
+# Parts whose w:pStyle/w:rStyle/... references keep a style alive
+REFERENCE_PART_RE = re.compile(r'^word/(document|header\d*|footer\d*|footnotes|endnotes|comments'
+                               r'|numbering|settings)\.xml$')
+REFERENCE_TAGS = {f'{W}{tag}' for tag in ('pStyle', 'rStyle', 'tblStyle', 'styleLink', 'numStyleLink',
+                                         'clickAndTypeStyle', 'defaultTableStyle')}
+STYLE_LINK_TAGS = (f'{W}basedOn', f'{W}next', f'{W}link')
+TOGGLE_PROPERTIES = {f'{W}{tag}' for tag in ('b', 'bCs', 'i', 'iCs', 'caps', 'smallCaps', 'strike',
+                                            'dstrike', 'outline', 'shadow', 'emboss', 'imprint', 'vanish')}
+STORED_EXTENSIONS = ('.png', '.jpeg', '.jpg', '.gif', '.emf', '.wmf')
+
+STYLE_ID_PREFIX = 'PackedRun'
+DEFAULT_LEVEL = 9
+
+
+def _xml(element):
+    return etree.tostring(element, encoding='unicode')
+
+
+def _run_rprs(roots):
+    """The <w:rPr> of every run that has no character style yet"""
+    for root in roots:
+        for rpr in root.iter(f'{W}rPr'):
+            if rpr.getparent().tag == f'{W}r' and rpr.find(f'{W}rStyle') is None \
+                    and rpr.find(f'{W}rPrChange') is None:
+                yield rpr
+
+
+def _shared_properties(rpr):
+    """The non-toggle children of a run's rPr, and their markup as a grouping key"""
+    shared = [child for child in rpr if child.tag not in TOGGLE_PROPERTIES]
+    return shared, ''.join(_xml(child) for child in shared)
+
+
+def character_styles(roots, existing_ids):
+    """{rPr markup: style number} for the run properties worth turning into styles
+
+    A style pays off when the bytes saved on its runs exceed the bytes of
+    its definition.
+    """
+    counts = Counter(_shared_properties(rpr)[1] for rpr in _run_rprs(roots))
+    styles = {}
+    for key, count in counts.most_common():
+        if not key or count < 2:
+            continue
+        number = len(styles) + 1
+        while _style_id(number) in existing_ids:
+            number += 1
+        reference = len(f'<w:rStyle w:val="{_style_id(number)}"/>')
+        if count * (len(key) - reference) > len(_style_xml(number, key)):
+            styles[key] = number
+            existing_ids.add(_style_id(number))
+    return styles
+
+
+def _style_id(number):
+    return f'{STYLE_ID_PREFIX}{number}'
+
+
+def _style_xml(number, rpr_children):
+    return (f'<w:style xmlns:w="{W_NS}" w:type="character" w:customStyle="1" w:styleId="{_style_id(number)}">'
+            f'<w:name w:val="Packed Run {number}"/><w:semiHidden/><w:rPr>{rpr_children}</w:rPr></w:style>')
+
+
+def apply_character_styles(roots, styles):
+    """Point runs at their character style; returns the number of runs changed"""
+    changed = 0
+    for rpr in list(_run_rprs(roots)):
+        shared, key = _shared_properties(rpr)
+        if key in styles:
+            for child in shared:
+                rpr.remove(child)
+            r_style = etree.SubElement(rpr, f'{W}rStyle')
+            r_style.set(f'{W}val', _style_id(styles[key]))
+            rpr.insert(0, r_style)
+            changed += 1
+    return changed
+
+
+def referenced_styles(roots):
+    return {element.get(f'{W}val') for root in roots for element in root.iter(*REFERENCE_TAGS)}
+
+
+def prune_styles(styles_root, used):
+    """Remove styles that neither used nor a default style reaches; returns the count removed"""
+    by_id = {style.get(f'{W}styleId'): style for style in styles_root.iter(f'{W}style')}
+    keep = set()
+    pending = [style_id for style_id in used if style_id in by_id]
+    pending += [style_id for style_id, style in by_id.items() if style.get(f'{W}default') in ('1', 'true')]
+    while pending:
+        style_id = pending.pop()
+        if style_id in keep or style_id not in by_id:
+            continue
+        keep.add(style_id)
+        for link in by_id[style_id].iterchildren(*STYLE_LINK_TAGS):
+            pending.append(link.get(f'{W}val'))
+    removed = 0
+    for style_id, style in by_id.items():
+        if style_id not in keep:
+            style.getparent().remove(style)
+            removed += 1
+    return removed
+
+
+def pack_bytes(data, compresslevel=DEFAULT_LEVEL):
+    """Pack a .docx given as bytes; returns (packed bytes, stats)"""
+    with zipfile.ZipFile(io.BytesIO(data)) as source:
+        items = source.infolist()
+        parts = {item.filename: source.read(item.filename) for item in items}
+
+    trees = {name: etree.fromstring(content) for name, content in parts.items()
+             if CONTENT_PART_RE.match(name) or REFERENCE_PART_RE.match(name) or name in STYLE_PARTS}
+    content_roots = [root for name, root in trees.items() if CONTENT_PART_RE.match(name)]
+    style_roots = [trees[name] for name in STYLE_PARTS if name in trees]
+
+    existing_ids = {style.get(f'{W}styleId') for root in style_roots for style in root.iter(f'{W}style')}
+    styles = character_styles(content_roots, existing_ids)
+    runs = apply_character_styles(content_roots, styles)
+    for root in style_roots:
+        for key, number in styles.items():
+            root.append(etree.fromstring(_style_xml(number, key)))
+
+    used = referenced_styles(root for name, root in trees.items() if REFERENCE_PART_RE.match(name))
+    removed = sum(prune_styles(root, used) for root in style_roots)
+
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as target:
+        for item in items:
+            content = parts[item.filename]
+            if item.filename in trees:
+                content = etree.tostring(trees[item.filename], xml_declaration=True,
+                                         encoding='UTF-8', standalone=True)
+            info = zipfile.ZipInfo(item.filename, item.date_time)
+            info.external_attr = item.external_attr
+            stored = item.filename.lower().endswith(STORED_EXTENSIONS)
+            info.compress_type = zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED
+            target.writestr(info, content, compresslevel=None if stored else compresslevel)
+    packed = output.getvalue()
+    return packed, {'before': len(data), 'after': len(packed), 'runs': runs,
+                    'styles_added': len(styles), 'styles_removed': removed}
+
+
+def pack(path, output_path=None, compresslevel=DEFAULT_LEVEL):
+    """Pack the .docx at path, in place unless output_path is given; returns the stats"""
+    with open(path, 'rb') as f:
+        packed, stats = pack_bytes(f.read(), compresslevel)
+    with atomic_write(output_path or path) as f:
+        f.write(packed)
+    return stats
+
+
+def describe(path, stats):
+    saved = 1 - stats['after'] / stats['before'] if stats['before'] else 0
+    return (f"{os.path.basename(path)}: {stats['before']:,} -> {stats['after']:,} bytes ({saved:.0%} smaller), "
+            f"{stats['runs']} runs into {stats['styles_added']} character styles, "
+            f"{stats['styles_removed']} unused styles removed")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('files', nargs='+', help='.docx files to pack (in place)')
+    parser.add_argument('--level', type=int, default=DEFAULT_LEVEL, choices=range(10), metavar='0-9',
+                        help=f'deflate compression level (default {DEFAULT_LEVEL})')
+    parser.add_argument('--output-dir', help='write the packed files here instead of replacing the inputs')
+    args = parser.parse_args(argv)
+
+    for path in args.files:
+        output_path = os.path.join(args.output_dir, os.path.basename(path)) if args.output_dir else None
+        print(describe(path, pack(path, output_path, args.level)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
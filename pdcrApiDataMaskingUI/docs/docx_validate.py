@@ -0,0 +1,187 @@
+"""Check generated .docx files for structural mistakes before they ship.
+
+The add_*.py scripts append their sections to Technical_Architecture.docx
+without looking at what is already there, so running one twice duplicates
+its sections and nothing complains. validate() streams word/document.xml
+once with iterparse, like docx_diff.py, and reports:
+
+    numbering   a numbered heading that does not follow the previous one:
+                4.1 -> 4.2, 4.2 -> 4.2.1 and 4.2 -> 5 are fine, 4.2 -> 4.4 and
+                5 -> 4 are not. Numbering restarts after an unnumbered heading
+                above the numbered ones ("Module Access Matrix" > "1. ...").
+    duplicate   a heading path ("4. COMPONENT ARCHITECTURE > 4.1 ...") that
+                already appeared earlier in the document
+    toc         a TABLE OF CONTENTS entry with no heading of that name, or a
+                heading missing from the TOC that is numbered like its top
+                entries (every "N." heading when the TOC lists "1. ...")
+    table       a table with no text below its header row
+
+Headings and TOC entries are compared without their numbers,
+case-insensitively and with whitespace collapsed, since a List Number TOC
+paragraph has no number in its text. Time is linear in the document;
+memory is one body block plus the heading paths seen so far.
+
+build_all.py and docs_cli.py validate every document they build and fail
+if one has violations, unless given --no-validate. The add_*.py scripts
+check the document after appending to it, without the TOC check until
+Section 10 is in.
+
+Usage:
+    python docx_validate.py file.docx [...] [--partial]
+
+Exit status is 0 if every document is valid, 1 otherwise.
+"""
+import argparse
+import re
+import sys
+import time
+import zipfile
+from collections import namedtuple
+
+from lxml import etree
+
+from docx_diff import W, element_text, heading_levels, section_name
+
+NUMBER_RE = re.compile(r'^(\d+(?:\.\d+)*)\.?\s')
+TOC_HEADING = 'table of contents'
+CHECKS = ('numbering', 'duplicate', 'toc', 'table')
+# For a document that later scripts still append to: its TOC lists sections not written yet
+PARTIAL_CHECKS = ('numbering', 'duplicate', 'table')
+
+# check is 'numbering', 'duplicate', 'toc' or 'table'; location is the section it is in
+Violation = namedtuple('Violation', 'check location message')
+
+
+def normalize(text):
+    return ' '.join(text.split()).casefold()
+
+
+def title_key(text):
+    """Text without its number: '1. EXECUTIVE SUMMARY' and 'Executive Summary' match"""
+    return normalize(NUMBER_RE.sub('', text.strip(), count=1))
+
+
+def heading_number(text):
+    """(4, 2) for '4.2 Frontend ...', None for an unnumbered heading"""
+    match = NUMBER_RE.match(text.strip())
+    return tuple(int(part) for part in match.group(1).split('.')) if match else None
+
+
+def follows(number, previous):
+    """True if number may come after previous: its first child, next sibling or an ancestor's sibling
+
+    The first numbered heading may be any top-level number, so an excerpt
+    (Deployment_Architecture.md starts at 7.) is valid.
+    """
+    if previous is None:
+        return len(number) == 1
+    return number == previous + (1,) or any(number == previous[:depth] + (previous[depth] + 1,)
+                                            for depth in range(len(previous)))
+
+
+def _has_page_break(paragraph):
+    return any(br.get(f'{W}type') == 'page' for br in paragraph.iter(f'{W}br'))
+
+
+def _empty_table(table):
+    rows = table.findall(f'{W}tr')
+    return not any(element_text(cell).strip() for row in rows[1:] for cell in row.iter(f'{W}tc'))
+
+
+def validate(path, checks=CHECKS):
+    """Return the Violations of the given checks found in the .docx at path"""
+    violations = []
+    heading_path = ()
+    seen_paths = set()
+    number, number_level = None, None   # last numbered heading and its level
+    toc = None                          # TOC entries, once a TABLE OF CONTENTS heading is found
+    in_toc = False
+    titles = {}                         # title_key -> number depth of the first heading (0 if unnumbered)
+    numbered = []                       # (text, number depth) of the numbered headings, for the TOC check
+
+    with zipfile.ZipFile(path) as package:
+        levels = heading_levels(package)
+        with package.open('word/document.xml') as document:
+            for _, element in etree.iterparse(document, events=('end',), tag=(f'{W}p', f'{W}tbl')):
+                parent = element.getparent()
+                if parent is None or parent.tag != f'{W}body':
+                    continue
+                if element.tag == f'{W}tbl':
+                    in_toc = False
+                    if _empty_table(element):
+                        violations.append(Violation('table', section_name(heading_path),
+                                                    'table has no rows below its header'))
+                else:
+                    style = element.find(f'{W}pPr/{W}pStyle')
+                    level = levels.get(style.get(f'{W}val')) if style is not None else None
+                    text = element_text(element).strip()
+                    if level is not None and normalize(text) == TOC_HEADING:
+                        toc, in_toc = [], True
+                    elif level:
+                        in_toc = False
+                        heading_path = heading_path[:level - 1] + ('',) * (level - 1 - len(heading_path)) + (text,)
+                        key = tuple(normalize(heading) for heading in heading_path)
+                        if key in seen_paths:
+                            violations.append(Violation('duplicate', section_name(heading_path),
+                                                        'section appears more than once'))
+                        seen_paths.add(key)
+                        current = heading_number(text)
+                        titles.setdefault(title_key(text), len(current or ()))
+                        if current is None:
+                            if number_level is not None and level < number_level:
+                                number, number_level = None, None
+                        else:
+                            if not follows(current, number):
+                                previous = '.'.join(map(str, number)) if number else 'the start'
+                                violations.append(Violation('numbering', section_name(heading_path),
+                                                            f"follows {previous}"))
+                            number, number_level = current, level
+                            numbered.append((text, len(current)))
+                    elif in_toc and text:
+                        toc.append(text)
+                    if in_toc and _has_page_break(element):
+                        in_toc = False
+                # Drop the finished block and anything before it
+                element.clear()
+                while element.getprevious() is not None:
+                    del parent[0]
+
+    if toc is not None:
+        entries = {title_key(entry) for entry in toc}
+        violations += [Violation('toc', 'TABLE OF CONTENTS', f"entry {entry!r} has no matching heading")
+                       for entry in toc if title_key(entry) not in titles]
+        # Every heading numbered as deep as the TOC's top entries (1. or 7.1) must be in it
+        depth = min((titles[key] for key in entries if titles.get(key)), default=1)
+        violations += [Violation('toc', heading, 'heading is missing from the table of contents')
+                       for heading, heading_depth in numbered
+                       if heading_depth == depth and title_key(heading) not in entries]
+    return [violation for violation in violations if violation.check in checks]
+
+
+def check(path, checks=CHECKS, name=None):
+    """Validate path and print its violations (as name, if given); returns True if there are none"""
+    violations = validate(path, checks)
+    for violation in violations:
+        print(f"{name or path}: [{violation.check}] {violation.location}: {violation.message}")
+    return not violations
+
+
+def check_all(paths, checks=CHECKS):
+    """Validate every path, printing the violations and a summary; returns True if all are valid"""
+    start = time.perf_counter()
+    invalid = [path for path in paths if not check(path, checks)]
+    print(f"{len(paths) - len(invalid)} of {len(paths)} documents valid ({time.perf_counter() - start:.2f}s)")
+    return not invalid
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('files', nargs='+', help='.docx files to validate')
+    parser.add_argument('--partial', action='store_true',
+                        help='skip the TOC check, for a document later scripts still append to')
+    args = parser.parse_args(argv)
+    return 0 if check_all(args.files, PARTIAL_CHECKS if args.partial else CHECKS) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
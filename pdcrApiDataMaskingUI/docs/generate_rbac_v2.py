@@ -1,345 +1,409 @@
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor, Cm
+"""Generate RBAC_Access_Matrix_v2.docx, .md and .html.
+
+Every Yes/No in the document comes from the PERMISSIONS object in
+src/utils/rbac.js, read into a role x action bitmap (rbac_model.py), plus
+any custom roles (created with roleAPI.createRole) listed in rbac_roles.json
+or the file given with --roles; so do the key differences between
+roles (the XOR of two role masks). Only the "Changes from Version 1.0"
+table is fixed history. The document is built once as a list of
+md_to_docx block events and written to every format from that list
+(doc_export.py).
+
+With more than MAX_ROLE_COLUMNS roles, roles with identical permissions
+share a column and the columns are split over several tables.
+
+Usage:
+    python generate_rbac_v2.py [--roles roles.json]
+"""
+import argparse
+import os
+
+from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.enum.table import WD_TABLE_ALIGNMENT
-from docx.oxml.ns import nsdecls
-from docx.oxml import parse_xml
-import datetime
-
-# Create a new document
-doc = Document()
-
-# Set up document margins
-sections = doc.sections
-for section in sections:
-    section.top_margin = Inches(1)
-    section.bottom_margin = Inches(1)
-    section.left_margin = Inches(1)
-    section.right_margin = Inches(1)
-
-def add_heading(text, level=1):
-    """Add a heading with specified level"""
-    heading = doc.add_heading(text, level)
-    return heading
-
-def add_text(text):
-    """Add a normal paragraph"""
-    return doc.add_paragraph(text)
-
-def add_bullet(text):
-    """Add a bullet point"""
-    return doc.add_paragraph(text, style='List Bullet')
-
-def set_cell_shading(cell, color):
-    """Set cell background color"""
-    shading_elm = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}"/>')
-    cell._tc.get_or_add_tcPr().append(shading_elm)
-
-def create_table(headers, rows, header_color="003366"):
-    """Create a formatted table"""
-    table = doc.add_table(rows=1, cols=len(headers))
-    table.style = 'Table Grid'
-
-    # Add header row
-    header_cells = table.rows[0].cells
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        set_cell_shading(header_cells[i], header_color)
-        for paragraph in header_cells[i].paragraphs:
-            for run in paragraph.runs:
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(255, 255, 255)
-
-    # Add data rows
-    for row_data in rows:
-        row_cells = table.add_row().cells
-        for i, cell_data in enumerate(row_data):
-            row_cells[i].text = str(cell_data)
-
-    return table
-
-# ==============================================================================
-# TITLE PAGE
-# ==============================================================================
-print("Creating title page...")
-
-title = doc.add_paragraph()
-title_run = title.add_run('RBAC Access Matrix')
-title_run.font.size = Pt(32)
-title_run.font.bold = True
-title_run.font.color.rgb = RGBColor(0, 51, 102)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-doc.add_paragraph()
-
-subtitle = doc.add_paragraph()
-subtitle_run = subtitle.add_run('PII Masking Tool')
-subtitle_run.font.size = Pt(24)
-subtitle_run.font.color.rgb = RGBColor(0, 102, 204)
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-for _ in range(5):
-    doc.add_paragraph()
-
-info = doc.add_paragraph()
-info.add_run('Document Version: 2.0\n\n').bold = True
-info.add_run('Date: December 2025\n\n').bold = True
-info.add_run('Purpose: Define role-based access control for single database in-place masking\n\n').bold = True
-info.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-doc.add_page_break()
-
-# ==============================================================================
-# ROLE DEFINITIONS
-# ==============================================================================
-print("Adding Role Definitions...")
 
-add_heading('Role Definitions', 1)
-
-role_headers = ['Role', 'Description', 'Typical Users']
-role_rows = [
-    ['Admin', 'Full system administration', 'System admins, Database admins'],
-    ['Privilege', 'Execute workflows and manage executions', 'Data engineers, Operations team'],
-    ['General', 'Read-only monitoring', 'Business analysts, Auditors'],
-    ['Support', 'Technical support (read-only)', 'Help desk, Support team'],
-]
-create_table(role_headers, role_rows)
-
-doc.add_paragraph()
-doc.add_page_break()
-
-# ==============================================================================
-# MODULE ACCESS MATRICES
-# ==============================================================================
-print("Adding Module Access Matrices...")
-
-add_heading('Module Access Matrix', 1)
-
-# 1. Server Connections Module
-add_heading('1. Server Connections Module', 2)
-conn_headers = ['Feature', 'Admin', 'Privilege', 'General', 'Support']
-conn_rows = [
-    ['View connection list', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['Create new connection', 'Yes', 'No', 'No', 'No'],
-    ['Edit connection details', 'Yes', 'No', 'No', 'No'],
-    ['Delete connection', 'Yes', 'No', 'No', 'No'],
-    ['Test connection', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View schemas/tables', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View table columns', 'Yes', 'Yes', 'Yes', 'Yes'],
-]
-create_table(conn_headers, conn_rows)
-doc.add_paragraph()
-
-# 2. Workflows Module
-add_heading('2. Workflows Module', 2)
-wf_headers = ['Feature', 'Admin', 'Privilege', 'General', 'Support']
-wf_rows = [
-    ['View workflow list', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['Create new workflow', 'Yes', 'No', 'No', 'No'],
-    ['Edit workflow', 'Yes', 'No', 'No', 'No'],
-    ['Delete workflow', 'Yes', 'No', 'No', 'No'],
-    ['Execute workflow', 'Yes', 'Yes', 'No', 'No'],
-    ['View column mappings', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['Edit column mappings', 'Yes', 'No', 'No', 'No'],
-    ['View PII attributes', 'Yes', 'Yes', 'Yes', 'Yes'],
-]
-create_table(wf_headers, wf_rows)
-doc.add_paragraph()
-
-# 3. Execution Module
-add_heading('3. Execution Module', 2)
-exec_headers = ['Feature', 'Admin', 'Privilege', 'General', 'Support']
-exec_rows = [
-    ['View execution history', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['Start execution', 'Yes', 'Yes', 'No', 'No'],
-    ['Stop execution', 'Yes', 'Yes', 'No', 'No'],
-    ['Pause execution', 'Yes', 'Yes', 'No', 'No'],
-    ['Resume execution', 'Yes', 'Yes', 'No', 'No'],
-    ['View execution status', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View execution logs', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View execution progress', 'Yes', 'Yes', 'Yes', 'Yes'],
+from base_template import new_document
+from doc_export import export, export_paths
+from md_to_docx import render_blocks
+from output_paths import output_file
+from rbac_model import RoleMatrix
+
+output_filename = 'RBAC_Access_Matrix_v2.docx'
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+CUSTOM_ROLES = os.path.join(DOCS_DIR, 'rbac_roles.json')
+
+MAX_ROLE_COLUMNS = 6
+
+ROLE_NAMES = {'admin': 'Admin', 'privilege': 'Privilege', 'general': 'General', 'support': 'Support'}
+ROLE_DETAILS = {
+    'admin': ('Full system administration', 'System admins, Database admins'),
+    'privilege': ('Execute workflows and manage executions', 'Data engineers, Operations team'),
+    'general': ('Read-only monitoring', 'Business analysts, Auditors'),
+    'support': ('Technical support (read-only)', 'Help desk, Support team'),
+}
+
+# Feature -> what the UI checks: a PERMISSIONS action, ADMIN_ONLY (isAdmin())
+# or None (any signed-in user)
+ADMIN_ONLY = 'role:admin'
+MODULES = [
+    ('Server Connections', [
+        ('View connection list', 'connection.view'),
+        ('Create new connection', 'connection.create'),
+        ('Edit connection details', 'connection.update'),
+        ('Delete connection', 'connection.delete'),
+        ('Test connection', 'connection.test'),
+        ('View schemas/tables', 'connection.view'),
+        ('View table columns', 'connection.view'),
+    ]),
+    ('Workflows', [
+        ('View workflow list', 'workflow.view'),
+        ('Create new workflow', 'workflow.create'),
+        ('Edit workflow', 'workflow.update'),
+        ('Delete workflow', 'workflow.delete'),
+        ('Execute workflow', 'workflow.execute'),
+        ('View column mappings', 'columnMapping.view'),
+        ('Edit column mappings', 'workflow.update'),
+        ('View PII attributes', 'workflow.view'),
+    ]),
+    ('Execution', [
+        ('View execution history', 'execution.view'),
+        ('Start execution', 'execution.start'),
+        ('Stop execution', 'execution.stop'),
+        ('Pause execution', 'execution.pause'),
+        ('Resume execution', 'execution.resume'),
+        ('View execution status', 'execution.view'),
+        ('View execution logs', 'execution.view'),
+        ('View execution progress', 'execution.view'),
+    ]),
+    ('Preview & Validation', [
+        ('View masking preview', 'preview.view'),
+        ('View constraint checks', 'constraint.view'),
+        ('View primary keys', 'constraint.view'),
+        ('View foreign keys', 'constraint.view'),
+        ('View unique constraints', 'constraint.view'),
+        ('View check constraints', 'constraint.view'),
+        ('View triggers', 'constraint.view'),
+        ('View indexes', 'constraint.view'),
+    ]),
+    ('User Management', [
+        ('View users', ADMIN_ONLY),
+        ('Create users', ADMIN_ONLY),
+        ('Assign roles', ADMIN_ONLY),
+        ('View roles', ADMIN_ONLY),
+        ('Create roles', ADMIN_ONLY),
+    ]),
+    ('Dashboard', [
+        ('View dashboard', None),
+        ('View statistics', None),
+        ('View recent activity', None),
+        ('Quick actions', 'workflow.execute'),
+    ]),
 ]
-create_table(exec_headers, exec_rows)
-doc.add_paragraph()
-
-doc.add_page_break()
-
-# 4. Preview & Validation Module
-add_heading('4. Preview & Validation Module', 2)
-prev_headers = ['Feature', 'Admin', 'Privilege', 'General', 'Support']
-prev_rows = [
-    ['View masking preview', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View constraint checks', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View primary keys', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View foreign keys', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View unique constraints', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View check constraints', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View triggers', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View indexes', 'Yes', 'Yes', 'Yes', 'Yes'],
-]
-create_table(prev_headers, prev_rows)
-doc.add_paragraph()
-
-# 5. User Management Module
-add_heading('5. User Management Module', 2)
-user_headers = ['Feature', 'Admin', 'Privilege', 'General', 'Support']
-user_rows = [
-    ['View users', 'Yes', 'No', 'No', 'No'],
-    ['Create users', 'Yes', 'No', 'No', 'No'],
-    ['Assign roles', 'Yes', 'No', 'No', 'No'],
-    ['View roles', 'Yes', 'No', 'No', 'No'],
-    ['Create roles', 'Yes', 'No', 'No', 'No'],
-]
-create_table(user_headers, user_rows)
-doc.add_paragraph()
-
-# 6. Dashboard Module
-add_heading('6. Dashboard Module', 2)
-dash_headers = ['Feature', 'Admin', 'Privilege', 'General', 'Support']
-dash_rows = [
-    ['View dashboard', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View statistics', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['View recent activity', 'Yes', 'Yes', 'Yes', 'Yes'],
-    ['Quick actions', 'Yes', 'Yes', 'No', 'No'],
-]
-create_table(dash_headers, dash_rows)
-doc.add_paragraph()
-
-doc.add_page_break()
-
-# ==============================================================================
-# SUMMARY TABLE
-# ==============================================================================
-print("Adding Summary Table...")
-
-add_heading('Summary Table', 1)
-
-summary_headers = ['Module', 'Admin Access', 'Privilege Access', 'General Access', 'Support Access']
-summary_rows = [
-    ['Server Connections', 'Full (CRUD + Test)', 'Read + Test', 'Read + Test', 'Read + Test'],
-    ['Workflows', 'Full (CRUD + Execute)', 'Read + Execute', 'Read Only', 'Read Only'],
-    ['Executions', 'Full (Start + Stop + Pause + Resume)', 'Start + Stop + Pause + Resume', 'Read Only', 'Read Only'],
-    ['Preview & Validation', 'Full Read', 'Full Read', 'Full Read', 'Full Read'],
-    ['User Management', 'Full (CRUD)', 'No Access', 'No Access', 'No Access'],
-    ['Dashboard', 'Full Access', 'Full Access', 'View Only', 'View Only'],
-]
-create_table(summary_headers, summary_rows)
-
-doc.add_paragraph()
-doc.add_page_break()
-
-# ==============================================================================
-# PERMISSION DEFINITIONS
-# ==============================================================================
-print("Adding Permission Definitions...")
-
-add_heading('Permission Definitions (Code Reference)', 1)
-
-add_text('The following permissions are defined in src/utils/rbac.js:')
-doc.add_paragraph()
-
-add_heading('Admin Permissions', 2)
-admin_perms = doc.add_paragraph()
-admin_perms.add_run('''connection.view, connection.create, connection.update, connection.delete, connection.test
-workflow.view, workflow.create, workflow.update, workflow.delete, workflow.execute
-execution.start, execution.view, execution.stop, execution.pause, execution.resume
-preview.view, masking.view, columnMapping.view, constraint.view''')
-
-add_heading('Privilege Permissions', 2)
-priv_perms = doc.add_paragraph()
-priv_perms.add_run('''connection.view, connection.test
-workflow.view, workflow.execute
-execution.start, execution.view, execution.stop, execution.pause, execution.resume
-preview.view, columnMapping.view, constraint.view''')
-
-add_heading('General Permissions', 2)
-gen_perms = doc.add_paragraph()
-gen_perms.add_run('''connection.view, connection.test
-workflow.view
-execution.view
-preview.view, columnMapping.view, constraint.view''')
-
-add_heading('Support Permissions', 2)
-sup_perms = doc.add_paragraph()
-sup_perms.add_run('''connection.view, connection.test
-workflow.view
-execution.view
-preview.view, columnMapping.view, constraint.view''')
-
-doc.add_page_break()
-
-# ==============================================================================
-# KEY DIFFERENCES
-# ==============================================================================
-print("Adding Key Differences...")
-
-add_heading('Key Differences Between Roles', 1)
-
-add_heading('Admin vs Privilege', 2)
-add_bullet('Admin: Can CREATE, UPDATE, and DELETE workflows and connections')
-add_bullet('Privilege: Can only VIEW and EXECUTE pre-configured workflows')
-
-add_heading('Privilege vs General', 2)
-add_bullet('Privilege: Can EXECUTE workflows and control executions (start/stop/pause/resume)')
-add_bullet('General: Can only VIEW workflows and executions (cannot execute or control)')
-
-add_heading('General vs Support', 2)
-add_bullet('Identical permissions (both are read-only roles)')
-add_bullet('Different organizational purpose (auditing vs troubleshooting)')
-
-doc.add_paragraph()
-
-# ==============================================================================
-# IMPLEMENTATION REFERENCE
-# ==============================================================================
-print("Adding Implementation Reference...")
-
-add_heading('Implementation Reference', 1)
-
-add_heading('Frontend Files:', 2)
-add_bullet('RBAC Logic: src/utils/rbac.js')
-add_bullet('Protected UI Component: src/components/common/ProtectedAction.js')
-add_bullet('Permission Hooks: src/hooks/usePermission.js')
-add_bullet('Route Protection: src/components/ProtectedRoute/ProtectedRoute.js')
-add_bullet('Auth Utilities: src/utils/auth.js')
-
-add_heading('Key Functions:', 2)
-add_bullet('getUserRole() - Get current user\'s role from localStorage')
-add_bullet('canPerformAction(action) - Check if user has specific permission')
-add_bullet('isAdmin() - Check if user is admin')
-add_bullet('getUserPermissions() - Get all permissions for current role')
-add_bullet('usePermission(action) - React hook for permission checks')
-
-doc.add_paragraph()
-doc.add_page_break()
-
-# ==============================================================================
-# CHANGES FROM V1
-# ==============================================================================
-print("Adding Changes from V1...")
-
-add_heading('Changes from Version 1.0', 1)
-
-changes_headers = ['Change', 'v1.0', 'v2.0']
-changes_rows = [
-    ['Test Connection', 'Admin only', 'All roles'],
-    ['Pause Execution', 'Not documented', 'Admin, Privilege'],
-    ['Resume Execution', 'Not documented', 'Admin, Privilege'],
-    ['User Management', 'Not documented', 'Admin only'],
-    ['Backend file references', 'Included (incorrect)', 'Removed'],
-]
-create_table(changes_headers, changes_rows)
-
-doc.add_paragraph()
-doc.add_paragraph()
 
-# Add document end
-end_text = doc.add_paragraph()
-end_text.add_run('Document End').bold = True
-end_text.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-# Save document
-output_path = r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\RBAC_Access_Matrix_v2.docx"
-doc.save(output_path)
+# Resources listed on one line of the permission definitions
+PERMISSION_LINES = {'masking': 'preview', 'columnMapping': 'preview', 'constraint': 'preview'}
+
+
+def role_name(role):
+    return ROLE_NAMES.get(role, role)
+
+
+def ordered_roles(matrix):
+    """The built-in roles from most to least privileged, then the custom roles"""
+    return sorted(matrix.roles, key=lambda role: list(ROLE_NAMES).index(role) if role in ROLE_NAMES else len(ROLE_NAMES))
+
+
+def role_columns(matrix):
+    """[(label, [roles])]: a column per role, or per permission profile for many roles"""
+    if len(matrix.masks) <= MAX_ROLE_COLUMNS:
+        return [(role_name(role), [role]) for role in ordered_roles(matrix)]
+    columns = []
+    for _, roles in matrix.profiles(ordered_roles(matrix), separate=('admin',)):
+        label = role_name(roles[0])
+        columns.append((label + (f' (+{len(roles) - 1})' if len(roles) > 1 else ''), roles))
+    return columns
+
+
+def chunks(columns):
+    return [columns[i:i + MAX_ROLE_COLUMNS] for i in range(0, len(columns), MAX_ROLE_COLUMNS)]
+
+
+def allowed(matrix, role, requirement):
+    if requirement is None:
+        return True
+    if requirement.startswith('role:'):
+        return role == requirement[len('role:'):]
+    return matrix.allows(role, requirement)
+
+
+def access_summary(matrix, role, features):
+    """'Full Access', 'No Access', 'Read Only' or the granted verbs ('Read + Test')"""
+    granted = [requirement for _, requirement in features if allowed(matrix, role, requirement)]
+    if len(granted) == len(features):
+        return 'Full Access'
+    if not granted:
+        return 'No Access'
+    verbs = []
+    for requirement in granted:
+        verb = (requirement or '').rpartition('.')[2]
+        verb = 'Read' if verb in ('', 'view') else verb.capitalize()
+        if verb not in verbs:
+            verbs.append(verb)
+    return 'Read Only' if verbs == ['Read'] else ' + '.join(verbs)
+
+
+def permission_lines(matrix, role):
+    """The role's actions, one line per resource, as in rbac.js"""
+    lines = {}
+    for action in matrix.role_actions(role):
+        resource = action.partition('.')[0]
+        lines.setdefault(PERMISSION_LINES.get(resource, resource), []).append(action)
+    return '\n'.join(', '.join(actions) for actions in lines.values())
+
+
+def role_differences(matrix, first, second):
+    """Bullets listing the actions only one of two roles has (the XOR of their masks)"""
+    differing = matrix.masks[first] ^ matrix.masks[second]
+    role_checks = [(feature, requirement) for _, features in MODULES for feature, requirement in features
+                   if requirement and requirement.startswith('role:')
+                   and allowed(matrix, first, requirement) != allowed(matrix, second, requirement)]
+    if not differing and not role_checks:
+        lines = ['**Identical permissions**']
+        for role in (first, second):
+            description = ROLE_DETAILS.get(role, (matrix.details[role].get('description', ''),))[0]
+            if description:
+                lines.append(f'**{role_name(role)}**: {description}')
+        return lines
+    lines = []
+    for role in (first, second):
+        only = [action for action in matrix.role_actions(role) if differing & matrix.bits[action]]
+        only += [f'{feature} (role check)' for feature, requirement in role_checks
+                 if allowed(matrix, role, requirement)]
+        lines.append(f"**{role_name(role)} only**: {', '.join(only) if only else 'nothing'}")
+    return lines
+
+
+def build_blocks(matrix):
+    """The document body after the title page, as md_to_docx block events"""
+    columns = role_columns(matrix)
+    blocks = []
+
+    def tables(first_header, rows_for):
+        """One table per chunk of role columns; rows_for(chunk) gives the rows"""
+        for chunk in chunks(columns):
+            blocks.append(('table', [first_header, *(label for label, _ in chunk)], rows_for(chunk)))
+            blocks.append(('paragraph', ''))
+
+    # ==============================================================================
+    # ROLE DEFINITIONS
+    # ==============================================================================
+    print("Adding Role Definitions...")
+
+    blocks.append(('heading', 1, 'Role Definitions'))
+    role_rows = []
+    for role in ordered_roles(matrix):
+        details = matrix.details[role]
+        description, typical_users = ROLE_DETAILS.get(
+            role, (details.get('description', ''), details.get('typical_users', '')))
+        role_rows.append([role_name(role), description, typical_users])
+    blocks.append(('table', ['Role', 'Description', 'Typical Users'], role_rows))
+
+    if any(len(roles) > 1 for _, roles in columns):
+        blocks.append(('paragraph', ''))
+        blocks.append(('heading', 2, 'Role Profiles'))
+        blocks.append(('paragraph', 'Roles with identical permissions share a column in the tables below.'))
+        blocks.append(('table', ['Column', 'Roles'], [
+            [label, ', '.join(role_name(role) for role in roles)] for label, roles in columns]))
+
+    blocks.append(('paragraph', ''))
+    blocks.append(('page_break',))
+
+    # ==============================================================================
+    # MODULE ACCESS MATRICES
+    # ==============================================================================
+    print("Adding Module Access Matrices...")
+
+    blocks.append(('heading', 1, 'Module Access Matrix'))
+    for number, (module, features) in enumerate(MODULES, 1):
+        blocks.append(('heading', 2, f'{number}. {module} Module'))
+        tables('Feature', lambda chunk: [
+            [feature, *('Yes' if allowed(matrix, roles[0], requirement) else 'No' for _, roles in chunk)]
+            for feature, requirement in features])
+    blocks.append(('page_break',))
+
+    # ==============================================================================
+    # SUMMARY TABLE
+    # ==============================================================================
+    print("Adding Summary Table...")
+
+    blocks.append(('heading', 1, 'Summary Table'))
+    for chunk in chunks(columns):
+        blocks.append(('table', ['Module', *(f'{label} Access' for label, _ in chunk)], [
+            [module, *(access_summary(matrix, roles[0], features) for _, roles in chunk)]
+            for module, features in MODULES]))
+        blocks.append(('paragraph', ''))
+    blocks.append(('page_break',))
+
+    # ==============================================================================
+    # PERMISSION DEFINITIONS
+    # ==============================================================================
+    print("Adding Permission Definitions...")
+
+    blocks.append(('heading', 1, 'Permission Definitions (Code Reference)'))
+    blocks.append(('paragraph', 'The following permissions are defined in `src/utils/rbac.js`:'))
+
+    blocks.append(('heading', 2, 'Permission Matrix'))
+    tables('Permission', lambda chunk: [
+        [action, *('Yes' if matrix.allows(roles[0], action) else 'No' for _, roles in chunk)]
+        for action in matrix.actions])
+
+    for label, roles in columns:
+        blocks.append(('heading', 2, f'{label} Permissions'))
+        blocks.append(('code', permission_lines(matrix, roles[0])))
+    blocks.append(('page_break',))
+
+    # ==============================================================================
+    # KEY DIFFERENCES
+    # ==============================================================================
+    print("Adding Key Differences...")
+
+    blocks.append(('heading', 1, 'Key Differences Between Roles'))
+    blocks.append(('paragraph', 'Each role compared with the next one in the tables above.'))
+    roles = ordered_roles(matrix)
+    for first, second in zip(roles, roles[1:]):
+        blocks.append(('heading', 2, f'{role_name(first)} vs {role_name(second)}'))
+        blocks += [('bullet', 1, text) for text in role_differences(matrix, first, second)]
+    blocks.append(('paragraph', ''))
+    blocks.append(('page_break',))
+
+    # ==============================================================================
+    # IMPLEMENTATION REFERENCE
+    # ==============================================================================
+    print("Adding Implementation Reference...")
+
+    blocks += [
+        ('heading', 1, 'Implementation Reference'),
+        ('heading', 2, 'Frontend Files:'),
+        ('bullet', 1, '**RBAC Logic**: `src/utils/rbac.js`'),
+        ('bullet', 1, '**Protected UI Component**: `src/components/common/ProtectedAction.js`'),
+        ('bullet', 1, '**Permission Hooks**: `src/hooks/usePermission.js`'),
+        ('bullet', 1, '**Route Protection**: `src/components/ProtectedRoute/ProtectedRoute.js`'),
+        ('bullet', 1, '**Auth Utilities**: `src/utils/auth.js`'),
+        ('heading', 2, 'Key Functions:'),
+        ('bullet', 1, "`getUserRole()` - Get current user's role from localStorage"),
+        ('bullet', 1, '`canPerformAction(action)` - Check if user has specific permission'),
+        ('bullet', 1, '`isAdmin()` - Check if user is admin'),
+        ('bullet', 1, '`getUserPermissions()` - Get all permissions for current role'),
+        ('bullet', 1, '`usePermission(action)` - React hook for permission checks'),
+        ('paragraph', ''),
+        ('page_break',),
+    ]
+
+    # ==============================================================================
+    # CHANGES FROM V1
+    # ==============================================================================
+    print("Adding Changes from V1...")
+
+    blocks.append(('heading', 1, 'Changes from Version 1.0'))
+    # Static history: what changed between the two editions, not read from rbac.js
+    blocks.append(('paragraph', 'Changes made to this document between version 1.0 and version 2.0 '
+                                '(a fixed record; not generated from `src/utils/rbac.js`):'))
+    blocks.append(('table', ['Change', 'v1.0', 'v2.0'], [
+        ['Test Connection', 'Admin only', 'All roles'],
+        ['Pause Execution', 'Not documented', 'Admin, Privilege'],
+        ['Resume Execution', 'Not documented', 'Admin, Privilege'],
+        ['User Management', 'Not documented', 'Admin only'],
+        ['Backend file references', 'Included (incorrect)', 'Removed'],
+    ]))
+    blocks.append(('paragraph', ''))
+    blocks.append(('paragraph', ''))
+    return blocks
+
+
+def add_title_page(doc):
+    print("Creating title page...")
+
+    title = doc.add_paragraph()
+    title_run = title.add_run('RBAC Access Matrix')
+    title_run.font.size = Pt(32)
+    title_run.font.bold = True
+    title_run.font.color.rgb = RGBColor(0, 51, 102)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    doc.add_paragraph()
 
-print(f"\nDocument saved successfully: {output_path}")
-print("RBAC Access Matrix v2 DOCX created!")
+    subtitle = doc.add_paragraph()
+    subtitle_run = subtitle.add_run('PII Masking Tool')
+    subtitle_run.font.size = Pt(24)
+    subtitle_run.font.color.rgb = RGBColor(0, 102, 204)
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    for _ in range(5):
+        doc.add_paragraph()
+
+    info = doc.add_paragraph()
+    info.add_run('Document Version: 2.0\n\n').bold = True
+    info.add_run('Date: December 2025\n\n').bold = True
+    info.add_run('Purpose: Define role-based access control for single database in-place masking\n\n').bold = True
+    info.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    doc.add_page_break()
+
+
+def build_document(blocks=None):
+    """Build the RBAC Access Matrix v2 document from build_blocks() events"""
+    if blocks is None:
+        blocks = build_blocks(load_matrix())
+    # Create a new document (margins and heading styles come from the base template)
+    doc = new_document()
+    add_title_page(doc)
+    render_blocks(doc, blocks)
+
+    # Add document end
+    end_text = doc.add_paragraph()
+    end_text.add_run('Document End').bold = True
+    end_text.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    return doc
+
+
+def markdown_blocks(blocks):
+    """The same document for the .md and .html: a header paragraph instead of the title page"""
+    return [
+        ('heading', 0, 'RBAC Access Matrix - PII Masking Tool'),
+        ('paragraph', '**Document Version:** 2.0\n**Date:** December 2025\n'
+                      '**Purpose:** Define role-based access control for single database in-place masking'),
+        ('page_break',),
+        *blocks,
+        ('page_break',),
+        ('paragraph', '**Document End**'),
+    ]
+
+
+def load_matrix(roles_path=None):
+    """PERMISSIONS from rbac.js plus the custom roles in roles_path (default rbac_roles.json, if present)"""
+    matrix = RoleMatrix.from_rbac_js()
+    if roles_path is None and os.path.exists(CUSTOM_ROLES):
+        roles_path = CUSTOM_ROLES
+    if roles_path:
+        matrix.load_custom_roles(roles_path)
+    return matrix
+
+
+def main(path=None, roles_path=None):
+    path = path or output_file(output_filename)
+    matrix = load_matrix(roles_path)
+    print(f"{len(matrix.roles)} roles, {len(matrix.actions)} actions")
+    blocks = build_blocks(matrix)
+
+    # Save the document in every format
+    paths = export(blocks, export_paths(path), build_docx=build_document, markdown_blocks=markdown_blocks(blocks))
+
+    for fmt, saved in paths.items():
+        print(f"\n{fmt.upper()} saved successfully: {saved}")
+    print("RBAC Access Matrix v2 DOCX created!")
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--roles', help='JSON list of custom roles (default: rbac_roles.json if present)')
+    main(roles_path=parser.parse_args().roles)
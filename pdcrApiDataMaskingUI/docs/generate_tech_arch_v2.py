@@ -1,182 +1,147 @@
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
+from docx.shared import Pt, RGBColor
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import nsdecls
-from docx.oxml import parse_xml
-import datetime
-
-# Create a new document
-doc = Document()
-
-# Set up document margins
-sections = doc.sections
-for section in sections:
-    section.top_margin = Inches(1)
-    section.bottom_margin = Inches(1)
-    section.left_margin = Inches(1)
-    section.right_margin = Inches(1)
-
-def add_heading(text, level=1):
-    """Add a heading with specified level"""
-    return doc.add_heading(text, level)
-
-def add_text(text):
-    """Add a normal paragraph"""
-    return doc.add_paragraph(text)
-
-def add_bullet(text):
-    """Add a bullet point"""
-    return doc.add_paragraph(text, style='List Bullet')
-
-def add_diagram(text):
-    """Add ASCII diagram in monospace font"""
-    p = doc.add_paragraph()
-    run = p.add_run(text)
-    run.font.name = 'Courier New'
-    run.font.size = Pt(8)
-    return p
-
-def set_cell_shading(cell, color):
-    """Set cell background color"""
-    shading_elm = parse_xml(f'<w:shd {nsdecls("w")} w:fill="{color}"/>')
-    cell._tc.get_or_add_tcPr().append(shading_elm)
-
-def create_table(headers, rows, header_color="003366"):
-    """Create a formatted table"""
-    table = doc.add_table(rows=1, cols=len(headers))
-    table.style = 'Table Grid'
-
-    # Add header row
-    header_cells = table.rows[0].cells
-    for i, header in enumerate(headers):
-        header_cells[i].text = header
-        set_cell_shading(header_cells[i], header_color)
-        for paragraph in header_cells[i].paragraphs:
-            for run in paragraph.runs:
-                run.font.bold = True
-                run.font.color.rgb = RGBColor(255, 255, 255)
-
-    # Add data rows
-    for row_data in rows:
-        row_cells = table.add_row().cells
-        for i, cell_data in enumerate(row_data):
-            row_cells[i].text = str(cell_data)
-
-    return table
+
+import api_model
+from api_model import API_JS, endpoint_tables
+from base_template import new_document
+from docx_helpers import DocHelpers
+from output_paths import output_file, save_document
+from section_cache import build_sections, depends_on
+
+output_filename = 'Technical_Architecture_v2.docx'
+
+
+def section_helpers(doc):
+    """add_heading, add_text, add_bullet, add_diagram, create_table bound to doc"""
+    helpers = DocHelpers(doc)
+    return (helpers.add_heading, helpers.add_text, helpers.add_bullet,
+            helpers.add_diagram, helpers.create_table)
+
 
 # ==============================================================================
 # TITLE PAGE
 # ==============================================================================
-print("Creating title page...")
-
-title = doc.add_paragraph()
-title_run = title.add_run('PII MASKING TOOL')
-title_run.font.size = Pt(32)
-title_run.font.bold = True
-title_run.font.color.rgb = RGBColor(0, 51, 102)
-title.alignment = WD_ALIGN_PARAGRAPH.CENTER
-doc.add_paragraph()
-
-subtitle = doc.add_paragraph()
-subtitle_run = subtitle.add_run('ARCHITECTURE & DESIGN DOCUMENT')
-subtitle_run.font.size = Pt(24)
-subtitle_run.font.color.rgb = RGBColor(0, 102, 204)
-subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
-
-for _ in range(5):
+def title_page(doc):
+    print("Creating title page...")
+
+    title = doc.add_paragraph()
+    title_run = title.add_run('PII MASKING TOOL')
+    title_run.font.size = Pt(32)
+    title_run.font.bold = True
+    title_run.font.color.rgb = RGBColor(0, 51, 102)
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
     doc.add_paragraph()
 
-info = doc.add_paragraph()
-info.add_run('Version: 2.0\n\n').bold = True
-info.add_run('Date: December 2025\n\n').bold = True
-info.add_run('Document Type: Technical Architecture\n\n').bold = True
-info.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    subtitle = doc.add_paragraph()
+    subtitle_run = subtitle.add_run('ARCHITECTURE & DESIGN DOCUMENT')
+    subtitle_run.font.size = Pt(24)
+    subtitle_run.font.color.rgb = RGBColor(0, 102, 204)
+    subtitle.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    for _ in range(5):
+        doc.add_paragraph()
+
+    info = doc.add_paragraph()
+    info.add_run('Version: 2.0\n\n').bold = True
+    info.add_run('Date: December 2025\n\n').bold = True
+    info.add_run('Document Type: Technical Architecture\n\n').bold = True
+    info.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # TABLE OF CONTENTS
 # ==============================================================================
-print("Creating table of contents...")
-
-doc.add_heading('TABLE OF CONTENTS', 0)
-doc.add_paragraph()
-
-toc = [
-    '1. Executive Summary',
-    '2. System Overview',
-    '3. High-Level Architecture',
-    '4. Component Architecture',
-    '5. Data Flow Diagrams',
-    '6. Technology Stack',
-    '7. API Reference',
-    '8. Security Architecture',
-    '9. Deployment Architecture',
-    '10. Frontend Routes'
-]
+def table_of_contents(doc):
+    print("Creating table of contents...")
 
-for item in toc:
-    doc.add_paragraph(item, style='List Number')
+    doc.add_heading('TABLE OF CONTENTS', 0)
+    doc.add_paragraph()
+
+    toc = [
+        '1. Executive Summary',
+        '2. System Overview',
+        '3. High-Level Architecture',
+        '4. Component Architecture',
+        '5. Data Flow Diagrams',
+        '6. Technology Stack',
+        '7. API Reference',
+        '8. Security Architecture',
+        '9. Deployment Architecture',
+        '10. Frontend Routes'
+    ]
+
+    for item in toc:
+        doc.add_paragraph(item, style='List Number')
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 1: EXECUTIVE SUMMARY
 # ==============================================================================
-print("Adding Section 1: Executive Summary...")
-
-add_heading('1. EXECUTIVE SUMMARY', 1)
-
-add_heading('1.1 Project Overview', 2)
-add_text('The PII Masking Tool is an enterprise web application designed to protect Personally Identifiable Information (PII) by performing in-place masking of sensitive data within a single database. The tool masks PII columns directly in the same table, schema, and database where the data resides.')
-
-add_heading('1.2 Purpose', 2)
-add_text('This document provides a comprehensive technical architecture overview of the PII Masking Tool, including:')
-add_bullet('System architecture and component relationships')
-add_bullet('Data flow through the application')
-add_bullet('Technology choices and their justification')
-add_bullet('Security measures and deployment strategy')
-
-add_heading('1.3 Key Features', 2)
-add_bullet('Server Connection Management: Configure and test connections to SQL Server databases (Azure SQL, PostgreSQL, Oracle, SQL Server)')
-add_bullet('Schema Discovery: Browse database schemas, tables, and column metadata')
-add_bullet('Intelligent Workflow Creation: Select tables and map columns to appropriate PII masking techniques based on data types')
-add_bullet('In-Place PII Masking: Execute data transformation directly on the same table with constraint validation')
-add_bullet('Preview Masking: Preview how masking will affect sample records before execution')
-add_bullet('Constraint Checking: Validate primary keys, foreign keys, unique constraints, check constraints, triggers, and indexes before masking')
-add_bullet('Execution Control: Start, stop, pause, and resume workflow executions')
-add_bullet('Execution Monitoring: Track workflow execution history with success/failure metrics')
-add_bullet('Role-Based Access Control: Admin, Privilege, General, and Support roles with different permission levels')
-add_bullet('User Management: Admin can create users and roles')
-add_bullet('Audit Trail: Complete history of who executed what and when')
-
-add_heading('1.4 Target Users', 2)
-add_bullet('Database Administrators: Manage database connections and schema exploration')
-add_bullet('Data Privacy Officers: Configure PII masking workflows')
-add_bullet('Data Engineers: Execute workflows to mask sensitive data in-place')
-add_bullet('Compliance Teams: Monitor masking operations and audit trails')
-
-doc.add_page_break()
+def executive_summary(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 1: Executive Summary...")
+
+    add_heading('1. EXECUTIVE SUMMARY', 1)
+
+    add_heading('1.1 Project Overview', 2)
+    add_text('The PII Masking Tool is an enterprise web application designed to protect Personally Identifiable Information (PII) by performing in-place masking of sensitive data within a single database. The tool masks PII columns directly in the same table, schema, and database where the data resides.')
+
+    add_heading('1.2 Purpose', 2)
+    add_text('This document provides a comprehensive technical architecture overview of the PII Masking Tool, including:')
+    add_bullet('System architecture and component relationships')
+    add_bullet('Data flow through the application')
+    add_bullet('Technology choices and their justification')
+    add_bullet('Security measures and deployment strategy')
+
+    add_heading('1.3 Key Features', 2)
+    add_bullet('Server Connection Management: Configure and test connections to SQL Server databases (Azure SQL, PostgreSQL, Oracle, SQL Server)')
+    add_bullet('Schema Discovery: Browse database schemas, tables, and column metadata')
+    add_bullet('Intelligent Workflow Creation: Select tables and map columns to appropriate PII masking techniques based on data types')
+    add_bullet('In-Place PII Masking: Execute data transformation directly on the same table with constraint validation')
+    add_bullet('Preview Masking: Preview how masking will affect sample records before execution')
+    add_bullet('Constraint Checking: Validate primary keys, foreign keys, unique constraints, check constraints, triggers, and indexes before masking')
+    add_bullet('Execution Control: Start, stop, pause, and resume workflow executions')
+    add_bullet('Execution Monitoring: Track workflow execution history with success/failure metrics')
+    add_bullet('Role-Based Access Control: Admin, Privilege, General, and Support roles with different permission levels')
+    add_bullet('User Management: Admin can create users and roles')
+    add_bullet('Audit Trail: Complete history of who executed what and when')
+
+    add_heading('1.4 Target Users', 2)
+    add_bullet('Database Administrators: Manage database connections and schema exploration')
+    add_bullet('Data Privacy Officers: Configure PII masking workflows')
+    add_bullet('Data Engineers: Execute workflows to mask sensitive data in-place')
+    add_bullet('Compliance Teams: Monitor masking operations and audit trails')
+
+    doc.add_page_break()
+
 
 # ==============================================================================
 # SECTION 2: SYSTEM OVERVIEW
 # ==============================================================================
-print("Adding Section 2: System Overview...")
+def system_overview(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 2: System Overview...")
 
-add_heading('2. SYSTEM OVERVIEW', 1)
+    add_heading('2. SYSTEM OVERVIEW', 1)
 
-add_heading('2.1 Business Context', 2)
-add_text('Organizations need to comply with data privacy regulations (GDPR, CCPA, HIPAA) by protecting sensitive PII data within their databases. The PII Masking Tool automates the process of:')
-add_bullet('Connecting to database servers (Azure SQL, PostgreSQL, Oracle, SQL Server)')
-add_bullet('Discovering schemas, tables, and columns containing PII')
-add_bullet('Configuring column-level masking rules based on data types')
-add_bullet('Validating database constraints before masking (PKs, FKs, unique, check, triggers, indexes)')
-add_bullet('Executing in-place masking transformations directly on the same table')
-add_bullet('Maintaining data integrity and referential constraints')
+    add_heading('2.1 Business Context', 2)
+    add_text('Organizations need to comply with data privacy regulations (GDPR, CCPA, HIPAA) by protecting sensitive PII data within their databases. The PII Masking Tool automates the process of:')
+    add_bullet('Connecting to database servers (Azure SQL, PostgreSQL, Oracle, SQL Server)')
+    add_bullet('Discovering schemas, tables, and columns containing PII')
+    add_bullet('Configuring column-level masking rules based on data types')
+    add_bullet('Validating database constraints before masking (PKs, FKs, unique, check, triggers, indexes)')
+    add_bullet('Executing in-place masking transformations directly on the same table')
+    add_bullet('Maintaining data integrity and referential constraints')
 
-add_heading('2.2 System Capabilities', 2)
+    add_heading('2.2 System Capabilities', 2)
 
-capabilities_diagram = """
+    capabilities_diagram = """
 SYSTEM CAPABILITIES
 
 SERVER CONNECTION MANAGEMENT
@@ -234,20 +199,24 @@ SECURITY & COMPLIANCE
 |- Audit trail of all operations
 |- Secure password storage (hashed)
 """
-add_diagram(capabilities_diagram)
+    add_diagram(capabilities_diagram)
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 3: HIGH-LEVEL ARCHITECTURE
 # ==============================================================================
-print("Adding Section 3: High-Level Architecture...")
+def high_level_architecture(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 3: High-Level Architecture...")
 
-add_heading('3. HIGH-LEVEL ARCHITECTURE', 1)
+    add_heading('3. HIGH-LEVEL ARCHITECTURE', 1)
 
-add_heading('3.1 System Architecture Diagram', 2)
+    add_heading('3.1 System Architecture Diagram', 2)
 
-arch_diagram = """
+    arch_diagram = """
 CLIENT TIER (Presentation Layer)
 +-------------------------------------------------------------------+
 |               React Single Page Application                        |
@@ -297,29 +266,33 @@ DATA TIER (Persistence Layer)
 |  +---------------------------+    +---------------------------+    |
 +-------------------------------------------------------------------+
 """
-add_diagram(arch_diagram)
+    add_diagram(arch_diagram)
 
-add_heading('3.2 Architecture Pattern', 2)
-add_text('Pattern Type: 3-Tier Layered Architecture')
-add_text('Why This Pattern:')
-add_bullet('Separation of Concerns: Each tier has a distinct responsibility')
-add_bullet('Independent Scaling: Scale presentation, logic, and data layers independently')
-add_bullet('Technology Flexibility: Replace or upgrade individual tiers without affecting others')
-add_bullet('Security: Multiple security checkpoints at each layer')
-add_bullet('Maintainability: Changes to one layer minimally impact other layers')
+    add_heading('3.2 Architecture Pattern', 2)
+    add_text('Pattern Type: 3-Tier Layered Architecture')
+    add_text('Why This Pattern:')
+    add_bullet('Separation of Concerns: Each tier has a distinct responsibility')
+    add_bullet('Independent Scaling: Scale presentation, logic, and data layers independently')
+    add_bullet('Technology Flexibility: Replace or upgrade individual tiers without affecting others')
+    add_bullet('Security: Multiple security checkpoints at each layer')
+    add_bullet('Maintainability: Changes to one layer minimally impact other layers')
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 4: COMPONENT ARCHITECTURE
 # ==============================================================================
-print("Adding Section 4: Component Architecture...")
+def component_architecture(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 4: Component Architecture...")
 
-add_heading('4. COMPONENT ARCHITECTURE', 1)
+    add_heading('4. COMPONENT ARCHITECTURE', 1)
 
-add_heading('4.1 Frontend Source Structure', 2)
+    add_heading('4.1 Frontend Source Structure', 2)
 
-structure_diagram = """
+    structure_diagram = """
 src/
 +-- components/
 |   +-- common/
@@ -359,20 +332,24 @@ src/
 +-- App.js                        # Router configuration
 +-- index.js                      # Entry point
 """
-add_diagram(structure_diagram)
+    add_diagram(structure_diagram)
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 5: DATA FLOW DIAGRAMS
 # ==============================================================================
-print("Adding Section 5: Data Flow Diagrams...")
+def data_flow_diagrams(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 5: Data Flow Diagrams...")
 
-add_heading('5. DATA FLOW DIAGRAMS', 1)
+    add_heading('5. DATA FLOW DIAGRAMS', 1)
 
-add_heading('5.1 User Authentication Flow', 2)
+    add_heading('5.1 User Authentication Flow', 2)
 
-auth_flow = """
+    auth_flow = """
 USER AUTHENTICATION FLOW
 
 User                Frontend            Backend           Database
@@ -399,11 +376,11 @@ User                Frontend            Backend           Database
  |     Dashboard       |                   |                  |
  |<--------------------|                   |                  |
 """
-add_diagram(auth_flow)
+    add_diagram(auth_flow)
 
-add_heading('5.2 Workflow Execution Flow (In-Place Masking)', 2)
+    add_heading('5.2 Workflow Execution Flow (In-Place Masking)', 2)
 
-execution_flow = """
+    execution_flow = """
 IN-PLACE MASKING EXECUTION FLOW
 
 User   Frontend   Backend     App DB       User DB
@@ -448,219 +425,209 @@ User   Frontend   Backend     App DB       User DB
  | Results|          |            |            |
  |<-------|          |            |            |
 """
-add_diagram(execution_flow)
+    add_diagram(execution_flow)
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 6: TECHNOLOGY STACK
 # ==============================================================================
-print("Adding Section 6: Technology Stack...")
-
-add_heading('6. TECHNOLOGY STACK', 1)
-
-add_heading('6.1 Frontend Stack', 2)
-frontend_headers = ['Technology', 'Version', 'Purpose']
-frontend_rows = [
-    ['React', '18.3.1', 'UI Framework'],
-    ['React Router DOM', '6.30.1', 'Client-side routing'],
-    ['Material-UI (MUI)', '7.3.2', 'UI Component library'],
-    ['MUI Data Grid', '7.x', 'Advanced data tables'],
-    ['Axios', '1.12.2', 'HTTP client'],
-    ['Tailwind CSS', '3.4.17', 'Utility-first CSS'],
-    ['Node.js', '18.16.1', 'Runtime environment'],
-]
-create_table(frontend_headers, frontend_rows)
-
-doc.add_paragraph()
-
-add_heading('6.2 Backend Stack', 2)
-backend_headers = ['Technology', 'Purpose']
-backend_rows = [
-    ['FastAPI', 'Python web framework'],
-    ['Uvicorn', 'ASGI server'],
-    ['PyJWT', 'JWT token handling'],
-    ['bcrypt', 'Password hashing'],
-    ['pyodbc', 'Database connectivity'],
-]
-create_table(backend_headers, backend_rows)
+def technology_stack(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 6: Technology Stack...")
+
+    add_heading('6. TECHNOLOGY STACK', 1)
+
+    add_heading('6.1 Frontend Stack', 2)
+    frontend_headers = ['Technology', 'Version', 'Purpose']
+    frontend_rows = [
+        ['React', '18.3.1', 'UI Framework'],
+        ['React Router DOM', '6.30.1', 'Client-side routing'],
+        ['Material-UI (MUI)', '7.3.2', 'UI Component library'],
+        ['MUI Data Grid', '7.x', 'Advanced data tables'],
+        ['Axios', '1.12.2', 'HTTP client'],
+        ['Tailwind CSS', '3.4.17', 'Utility-first CSS'],
+        ['Node.js', '18.16.1', 'Runtime environment'],
+    ]
+    create_table(frontend_headers, frontend_rows)
 
-doc.add_paragraph()
+    doc.add_paragraph()
 
-add_heading('6.3 Database Support', 2)
-add_bullet('Azure SQL Database')
-add_bullet('PostgreSQL')
-add_bullet('Oracle')
-add_bullet('SQL Server')
+    add_heading('6.2 Backend Stack', 2)
+    backend_headers = ['Technology', 'Purpose']
+    backend_rows = [
+        ['FastAPI', 'Python web framework'],
+        ['Uvicorn', 'ASGI server'],
+        ['PyJWT', 'JWT token handling'],
+        ['bcrypt', 'Password hashing'],
+        ['pyodbc', 'Database connectivity'],
+    ]
+    create_table(backend_headers, backend_rows)
 
-doc.add_page_break()
+    doc.add_paragraph()
 
-# ==============================================================================
-# SECTION 7: API REFERENCE
-# ==============================================================================
-print("Adding Section 7: API Reference...")
+    add_heading('6.3 Database Support', 2)
+    add_bullet('Azure SQL Database')
+    add_bullet('PostgreSQL')
+    add_bullet('Oracle')
+    add_bullet('SQL Server')
 
-add_heading('7. API REFERENCE', 1)
+    doc.add_page_break()
 
-add_heading('7.1 Base Configuration', 2)
-add_text('Frontend Port: 5000')
-add_text('Backend API URL: http://localhost:9000')
-add_text('API Base Path: /api')
 
-doc.add_paragraph()
+# ==============================================================================
+# SECTION 7: API REFERENCE
+# ==============================================================================
+@depends_on(API_JS, api_model.__file__)
+def api_reference(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
 
-add_heading('7.2 Authentication APIs', 2)
-auth_headers = ['Method', 'Endpoint', 'Description']
-auth_rows = [
-    ['POST', '/api/auth/login', 'User login'],
-]
-create_table(auth_headers, auth_rows)
+    print("Adding Section 7: API Reference...")
 
-doc.add_paragraph()
+    add_heading('7. API REFERENCE', 1)
 
-add_heading('7.3 User Management APIs (Admin Only)', 2)
-user_headers = ['Method', 'Endpoint', 'Description']
-user_rows = [
-    ['POST', '/api/users', 'Create user'],
-    ['GET', '/api/users', 'Get all users'],
-    ['POST', '/api/roles', 'Create role'],
-    ['GET', '/api/roles', 'Get all roles'],
-]
-create_table(user_headers, user_rows)
-
-doc.add_paragraph()
-
-add_heading('7.4 Server Connections APIs', 2)
-conn_headers = ['Method', 'Endpoint', 'Description']
-conn_rows = [
-    ['GET', '/api/datamasking/connections', 'List all connections'],
-    ['POST', '/api/datamasking/connections', 'Create connection'],
-    ['POST', '/api/datamasking/connections/getById', 'Get connection details'],
-    ['DELETE', '/api/datamasking/connections/delete', 'Delete connection'],
-    ['POST', '/api/datamasking/connections/test', 'Test connection'],
-]
-create_table(conn_headers, conn_rows)
+    add_heading('7.1 Base Configuration', 2)
+    add_text('Frontend Port: 5000')
+    add_text('Backend API URL: http://localhost:9000')
+    add_text('API Base Path: /api')
 
-doc.add_paragraph()
+    doc.add_paragraph()
 
-add_heading('7.5 Schema Discovery APIs', 2)
-schema_headers = ['Method', 'Endpoint', 'Description']
-schema_rows = [
-    ['POST', '/api/datamasking/connections/schemas', 'List schemas'],
-    ['POST', '/api/datamasking/connections/tables', 'List tables'],
-    ['POST', '/api/datamasking/connections/columns', 'List columns'],
-]
-create_table(schema_headers, schema_rows)
-
-doc.add_page_break()
-
-add_heading('7.6 Server Workflows APIs', 2)
-wf_headers = ['Method', 'Endpoint', 'Description']
-wf_rows = [
-    ['GET', '/api/datamasking/workflows', 'List all workflows'],
-    ['POST', '/api/datamasking/workflows', 'Create workflow'],
-    ['POST', '/api/datamasking/workflows/getById', 'Get workflow details'],
-    ['PUT', '/api/datamasking/workflows/update', 'Update workflow'],
-    ['DELETE', '/api/datamasking/workflows/delete', 'Delete workflow'],
-    ['POST', '/api/datamasking/workflows/executions', 'Get execution history'],
-    ['GET', '/api/datamasking/workflows/pii-attributes', 'Get PII attribute types'],
-]
-create_table(wf_headers, wf_rows)
-
-doc.add_paragraph()
-
-add_heading('7.7 Execution & Masking APIs', 2)
-exec_headers = ['Method', 'Endpoint', 'Description']
-exec_rows = [
-    ['POST', '/api/datamasking/workflows/execute', 'Execute workflow'],
-    ['POST', '/api/datamasking/workflows/executions/status', 'Get execution status'],
-    ['POST', '/api/datamasking/workflows/executions/stop', 'Stop execution'],
-    ['POST', '/api/datamasking/workflows/executions/pause', 'Pause execution'],
-    ['POST', '/api/datamasking/workflows/executions/resume', 'Resume execution'],
-    ['POST', '/api/datamasking/workflows/preview', 'Preview masked data'],
-    ['POST', '/api/masking/sample-data', 'Generate sample data'],
-]
-create_table(exec_headers, exec_rows)
-
-doc.add_paragraph()
-
-add_heading('7.8 Constraint Checking APIs', 2)
-const_headers = ['Method', 'Endpoint', 'Description']
-const_rows = [
-    ['POST', '/api/datamasking/constraints/all', 'Check all constraints'],
-    ['POST', '/api/datamasking/constraints/primaryKeys', 'Check primary keys'],
-    ['POST', '/api/datamasking/constraints/foreignKeys', 'Check foreign keys'],
-    ['POST', '/api/datamasking/constraints/unique', 'Check unique constraints'],
-    ['POST', '/api/datamasking/constraints/check', 'Check check constraints'],
-    ['POST', '/api/datamasking/constraints/triggers', 'Check triggers'],
-    ['POST', '/api/datamasking/constraints/indexes', 'Check indexes'],
-]
-create_table(const_headers, const_rows)
+    # Tables are generated from src/services/api.js (api_model.py)
+    # (heading, api.js groups or single members), see api_model.endpoint_tables
+    api_tables = [
+        ('Authentication APIs', ['authAPI']),
+        ('User Management APIs (Admin Only)', ['userAPI', 'roleAPI']),
+        ('Server Connections APIs', ['serverConnectionsAPI']),
+        ('Schema Discovery APIs', ['serverConnectionsAPI.getSchemas', 'serverConnectionsAPI.getTablesBySchema',
+                                   'serverConnectionsAPI.getTableColumns']),
+        ('Server Workflows APIs', ['serverWorkflowsAPI']),
+        ('Execution & Masking APIs', ['serverMaskingAPI']),
+        ('Constraint Checking APIs', ['serverConstraintsAPI']),
+    ]
+    page_breaks = {'Schema Discovery APIs'}
+
+    # Endpoint descriptions; endpoints not listed get one from their api.js name
+    descriptions = {
+        'authAPI.login': 'User login',
+        'userAPI.createUser': 'Create user',
+        'userAPI.getUsers': 'Get all users',
+        'roleAPI.createRole': 'Create role',
+        'roleAPI.getRoles': 'Get all roles',
+        'serverConnectionsAPI.getAll': 'List all connections',
+        'serverConnectionsAPI.create': 'Create connection',
+        'serverConnectionsAPI.getById': 'Get connection details',
+        'serverConnectionsAPI.delete': 'Delete connection',
+        'serverConnectionsAPI.test': 'Test connection',
+        'serverConnectionsAPI.getSchemas': 'List schemas',
+        'serverConnectionsAPI.getTablesBySchema': 'List tables',
+        'serverConnectionsAPI.getTableColumns': 'List columns',
+        'serverWorkflowsAPI.getAll': 'List all workflows',
+        'serverWorkflowsAPI.create': 'Create workflow',
+        'serverWorkflowsAPI.getById': 'Get workflow details',
+        'serverWorkflowsAPI.update': 'Update workflow',
+        'serverWorkflowsAPI.delete': 'Delete workflow',
+        'serverWorkflowsAPI.getExecutions': 'Get execution history (paged)',
+        'serverWorkflowsAPI.getPiiAttributes': 'Get PII attribute types',
+        'serverMaskingAPI.executeWorkflow': 'Execute workflow',
+        'serverMaskingAPI.getExecutionStatus': 'Get execution status',
+        'serverMaskingAPI.getExecutionLogs': 'Get execution log lines (paged)',
+        'serverMaskingAPI.getExecutionStreamUrl': 'Execution progress stream (Server-Sent Events)',
+        'serverMaskingAPI.stopExecution': 'Stop execution',
+        'serverMaskingAPI.pauseExecution': 'Pause execution',
+        'serverMaskingAPI.resumeExecution': 'Resume execution',
+        'serverMaskingAPI.getPreviewMasking': 'Preview masked data',
+        'serverMaskingAPI.generateSampleData': 'Generate sample data',
+        'serverConstraintsAPI.checkAll': 'Check all constraints',
+        'serverConstraintsAPI.checkPrimaryKeys': 'Check primary keys',
+        'serverConstraintsAPI.checkForeignKeys': 'Check foreign keys',
+        'serverConstraintsAPI.checkUniqueConstraints': 'Check unique constraints',
+        'serverConstraintsAPI.checkCheckConstraints': 'Check check constraints',
+        'serverConstraintsAPI.checkTriggers': 'Check triggers',
+        'serverConstraintsAPI.checkIndexes': 'Check indexes',
+    }
+
+    tables = endpoint_tables(api_tables, descriptions)
+    for number, (heading, rows) in enumerate(tables, start=2):
+        add_heading(f'7.{number} {heading}', 2)
+        create_table(['Method', 'Endpoint', 'Description'], rows)
+        if heading in page_breaks or number == len(tables) + 1:
+            doc.add_page_break()
+        else:
+            doc.add_paragraph()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 8: SECURITY ARCHITECTURE
 # ==============================================================================
-print("Adding Section 8: Security Architecture...")
+def security_architecture(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
 
-add_heading('8. SECURITY ARCHITECTURE', 1)
+    print("Adding Section 8: Security Architecture...")
 
-add_heading('8.1 Authentication', 2)
+    add_heading('8. SECURITY ARCHITECTURE', 1)
 
-add_text('Password Security:')
-add_bullet('Passwords hashed using bcrypt with salt (cost factor: 12 rounds)')
-add_bullet('Never stored in plaintext')
-add_bullet('Never transmitted except during initial login (over HTTPS)')
+    add_heading('8.1 Authentication', 2)
 
-add_text('JWT Token Security:')
-add_bullet('JWT signed with HMAC-SHA256 algorithm')
-add_bullet('Secret key stored in environment variables')
-add_bullet('Token expiration enforced (24-hour default)')
-add_bullet('Automatic logout on token expiration')
-add_bullet('Token includes user role for authorization')
+    add_text('Password Security:')
+    add_bullet('Passwords hashed using bcrypt with salt (cost factor: 12 rounds)')
+    add_bullet('Never stored in plaintext')
+    add_bullet('Never transmitted except during initial login (over HTTPS)')
 
-add_text('Token Storage:')
-add_bullet('JWT token stored in localStorage as authToken')
-add_bullet('User object stored in localStorage as user')
+    add_text('JWT Token Security:')
+    add_bullet('JWT signed with HMAC-SHA256 algorithm')
+    add_bullet('Secret key stored in environment variables')
+    add_bullet('Token expiration enforced (24-hour default)')
+    add_bullet('Automatic logout on token expiration')
+    add_bullet('Token includes user role for authorization')
 
-add_heading('8.2 Authorization (RBAC)', 2)
+    add_text('Token Storage:')
+    add_bullet('JWT token stored in localStorage as authToken')
+    add_bullet('User object stored in localStorage as user')
 
-add_text('Four roles with different permission levels:')
+    add_heading('8.2 Authorization (RBAC)', 2)
 
-rbac_headers = ['Role', 'Capabilities']
-rbac_rows = [
-    ['Admin', 'Full CRUD on connections, workflows, users, roles. Execute workflows.'],
-    ['Privilege', 'View connections, execute workflows, control executions'],
-    ['General', 'Read-only access to all features'],
-    ['Support', 'Read-only access (same as General)'],
-]
-create_table(rbac_headers, rbac_rows)
+    add_text('Four roles with different permission levels:')
+
+    rbac_headers = ['Role', 'Capabilities']
+    rbac_rows = [
+        ['Admin', 'Full CRUD on connections, workflows, users, roles. Execute workflows.'],
+        ['Privilege', 'View connections, execute workflows, control executions'],
+        ['General', 'Read-only access to all features'],
+        ['Support', 'Read-only access (same as General)'],
+    ]
+    create_table(rbac_headers, rbac_rows)
 
-add_text('See RBAC_Access_Matrix_v2.md for detailed permission matrix.')
+    add_text('See RBAC_Access_Matrix_v2.md for detailed permission matrix.')
 
-add_heading('8.3 Data Encryption', 2)
+    add_heading('8.3 Data Encryption', 2)
 
-add_text('At Rest:')
-add_bullet('Database connection passwords encrypted with AES-256-CBC')
-add_bullet('User passwords hashed with bcrypt')
+    add_text('At Rest:')
+    add_bullet('Database connection passwords encrypted with AES-256-CBC')
+    add_bullet('User passwords hashed with bcrypt')
 
-add_text('In Transit:')
-add_bullet('All communication over HTTPS/TLS 1.3')
-add_bullet('JWT tokens encrypted in transit')
+    add_text('In Transit:')
+    add_bullet('All communication over HTTPS/TLS 1.3')
+    add_bullet('JWT tokens encrypted in transit')
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 9: DEPLOYMENT ARCHITECTURE
 # ==============================================================================
-print("Adding Section 9: Deployment Architecture...")
+def deployment_architecture(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 9: Deployment Architecture...")
 
-add_heading('9. DEPLOYMENT ARCHITECTURE', 1)
+    add_heading('9. DEPLOYMENT ARCHITECTURE', 1)
 
-add_heading('9.1 Development Environment', 2)
+    add_heading('9.1 Development Environment', 2)
 
-dev_env = """
+    dev_env = """
 DEVELOPMENT ENVIRONMENT
 
 Developer Workstation
@@ -695,87 +662,138 @@ Developer Workstation
 |  - PORT=5000                                       |
 +----------------------------------------------------+
 """
-add_diagram(dev_env)
+    add_diagram(dev_env)
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # SECTION 10: FRONTEND ROUTES
 # ==============================================================================
-print("Adding Section 10: Frontend Routes...")
-
-add_heading('10. FRONTEND ROUTES', 1)
-
-add_heading('10.1 Route Configuration', 2)
-
-routes_headers = ['Route', 'Component', 'Access']
-routes_rows = [
-    ['/login', 'Login', 'Public'],
-    ['/datamasking/dashboard', 'ServerDashboard', 'Protected'],
-    ['/datamasking/connections', 'ServerConnectionsPage', 'Protected'],
-    ['/datamasking/workflows', 'ServerWorkflowsPage', 'Protected'],
-    ['/datamasking/workflows/create', 'CreateWorkflowPage', 'Protected'],
-    ['/datamasking/workflows/:id/edit', 'CreateWorkflowPage', 'Protected'],
-    ['/datamasking/workflows/:id', 'WorkflowDetailPage', 'Protected'],
-    ['/register-user', 'UserRegistration', 'Protected (Admin)'],
-    ['/register-role', 'RoleRegistration', 'Protected (Admin)'],
-    ['/', 'Redirect to /login', '-'],
-    ['*', 'Redirect to /login', '-'],
-]
-create_table(routes_headers, routes_rows)
+def frontend_routes(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Section 10: Frontend Routes...")
+
+    add_heading('10. FRONTEND ROUTES', 1)
+
+    add_heading('10.1 Route Configuration', 2)
+
+    routes_headers = ['Route', 'Component', 'Access']
+    routes_rows = [
+        ['/login', 'Login', 'Public'],
+        ['/datamasking/dashboard', 'ServerDashboard', 'Protected'],
+        ['/datamasking/connections', 'ServerConnectionsPage', 'Protected'],
+        ['/datamasking/workflows', 'ServerWorkflowsPage', 'Protected'],
+        ['/datamasking/workflows/create', 'CreateWorkflowPage', 'Protected'],
+        ['/datamasking/workflows/:id/edit', 'CreateWorkflowPage', 'Protected'],
+        ['/datamasking/workflows/:id', 'WorkflowDetailPage', 'Protected'],
+        ['/register-user', 'UserRegistration', 'Protected (Admin)'],
+        ['/register-role', 'RoleRegistration', 'Protected (Admin)'],
+        ['/', 'Redirect to /login', '-'],
+        ['*', 'Redirect to /login', '-'],
+    ]
+    create_table(routes_headers, routes_rows)
 
-doc.add_paragraph()
+    doc.add_paragraph()
 
-add_heading('10.2 Navigation Structure', 2)
-add_text('Sidebar Menu Items:')
-add_bullet('Dashboard')
-add_bullet('Connections')
-add_bullet('Workflows')
-add_bullet('Register User (Admin only)')
-add_bullet('Register Role (Admin only)')
+    add_heading('10.2 Navigation Structure', 2)
+    add_text('Sidebar Menu Items:')
+    add_bullet('Dashboard')
+    add_bullet('Connections')
+    add_bullet('Workflows')
+    add_bullet('Register User (Admin only)')
+    add_bullet('Register Role (Admin only)')
+
+    doc.add_page_break()
 
-doc.add_page_break()
 
 # ==============================================================================
 # CHANGES FROM V1
 # ==============================================================================
-print("Adding Changes from V1...")
-
-add_heading('Changes from Version 1.0', 1)
-
-changes_headers = ['Area', 'v1.0', 'v2.0']
-changes_rows = [
-    ['API Base Path', '/api/server/...', '/api/datamasking/...'],
-    ['API Pattern', 'Path parameters', 'POST with request body'],
-    ['Frontend Port', '3000', '5000'],
-    ['Backend Port', '8000', '9000'],
-    ['Execution Control', 'Not documented', 'Stop/Pause/Resume'],
-    ['User Management', 'Not documented', 'Create users/roles'],
-    ['RBAC Roles', 'Admin/User', 'Admin/Privilege/General/Support'],
-]
-create_table(changes_headers, changes_rows)
+def changes_from_v1(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Changes from V1...")
+
+    add_heading('Changes from Version 1.0', 1)
+
+    changes_headers = ['Area', 'v1.0', 'v2.0']
+    changes_rows = [
+        ['API Base Path', '/api/server/...', '/api/datamasking/...'],
+        ['API Pattern', 'Path parameters', 'POST with request body'],
+        ['Frontend Port', '3000', '5000'],
+        ['Backend Port', '8000', '9000'],
+        ['Execution Control', 'Not documented', 'Stop/Pause/Resume'],
+        ['User Management', 'Not documented', 'Create users/roles'],
+        ['RBAC Roles', 'Admin/User', 'Admin/Privilege/General/Support'],
+    ]
+    create_table(changes_headers, changes_rows)
+
+    doc.add_paragraph()
+    doc.add_paragraph()
 
-doc.add_paragraph()
-doc.add_paragraph()
 
 # ==============================================================================
 # DOCUMENT END
 # ==============================================================================
-print("Adding Document End...")
+def document_end(doc):
+    add_heading, add_text, add_bullet, add_diagram, create_table = section_helpers(doc)
+
+    print("Adding Document End...")
+
+    add_heading('DOCUMENT END', 1)
+
+    add_text('This technical architecture document provides a comprehensive overview of the PII Masking Tool system design for Version 2.0, including:')
+    add_bullet('JWT-based authentication for stateless security')
+    add_bullet('4-role RBAC system (Admin, Privilege, General, Support)')
+    add_bullet('Smart PII filtering based on SQL data types')
+    add_bullet('In-place masking execution with transaction safety')
+    add_bullet('Execution control (start/stop/pause/resume)')
+    add_bullet('User management for admins')
+
+
+# (section name, render function) in document order
+SECTIONS = [
+    ('Title Page', title_page),
+    ('Table of Contents', table_of_contents),
+    ('Executive Summary', executive_summary),
+    ('System Overview', system_overview),
+    ('High-Level Architecture', high_level_architecture),
+    ('Component Architecture', component_architecture),
+    ('Data Flow Diagrams', data_flow_diagrams),
+    ('Technology Stack', technology_stack),
+    ('API Reference', api_reference),
+    ('Security Architecture', security_architecture),
+    ('Deployment Architecture', deployment_architecture),
+    ('Frontend Routes', frontend_routes),
+    ('Changes from V1', changes_from_v1),
+    ('Document End', document_end),
+]
+
+
+def build_document(use_cache=True):
+    """Build the document, re-rendering only sections whose source changed"""
+    doc = new_document()
+    results = build_sections(doc, SECTIONS, new_document, use_cache=use_cache, shared=(section_helpers,))
+    return doc, results
+
+
+def main(path=None, use_cache=True):
+    path = path or output_file(output_filename)
+    doc, results = build_document(use_cache=use_cache)
+    rendered = [name for name, status, _ in results if status == 'rendered']
+    print(f"\n{len(rendered)} of {len(results)} sections rendered, {len(results) - len(rendered)} from cache")
+
+    # Save document
+    save_document(doc, path)
 
-add_heading('DOCUMENT END', 1)
+    print(f"\nDocument saved successfully: {path}")
+    print("Technical Architecture v2 DOCX created!")
+    return path
 
-add_text('This technical architecture document provides a comprehensive overview of the PII Masking Tool system design for Version 2.0, including:')
-add_bullet('JWT-based authentication for stateless security')
-add_bullet('4-role RBAC system (Admin, Privilege, General, Support)')
-add_bullet('Smart PII filtering based on SQL data types')
-add_bullet('In-place masking execution with transaction safety')
-add_bullet('Execution control (start/stop/pause/resume)')
-add_bullet('User management for admins')
 
-# Save document
-output_path = r"c:\Users\rahul.ramagiri\Documents\poc_pii_ui\pii-masking-tool\docs\Technical_Architecture_v2.docx"
-doc.save(output_path)
+if __name__ == "__main__":
+    import sys
 
-print(f"\nDocument saved successfully: {output_path}")
-print("Technical Architecture v2 DOCX created!")
+    main(use_cache='--no-cache' not in sys.argv[1:])
@@ -0,0 +1,215 @@
+"""Compile the Markdown documents in docs/ to .docx.
+
+The .md files are the single source of truth: this compiler reads them line
+by line, turns each block into an event and renders it with the shared
+docx_helpers styling, so no per-document Python has to be kept in sync.
+
+Supported Markdown:
+    # .. ####       headings (# is the document title, ## is Heading 1, ...)
+    - / * item      bullets, indented two or more spaces for a nested level
+    1. item         numbered items
+    | a | b |       pipe tables (the row after the header is the |---| rule)
+    ```             fenced blocks, rendered like add_diagram() ASCII diagrams
+    ---             page break
+    **bold**, `code` and [text](link) inside paragraphs, bullets and items
+
+Consecutive text lines are kept on separate lines of one paragraph.
+
+doc_export.py writes the same events as .md and .html too, so a generator
+can build one list of events and write every format from it.
+
+Usage:
+    python md_to_docx.py [--output-dir DIR] [file.md ...]
+        (default: every .md in docs/, written as .docx to the output directory)
+"""
+import argparse
+import glob
+import os
+import re
+import time
+
+from base_template import new_document
+from docx_helpers import DIAGRAM_FONT, DocHelpers, apply_run_properties, run_properties
+from output_paths import output_file, save_document, set_output_dir
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+BULLET_RE = re.compile(r'^(\s*)[-*+]\s+(.*)$')
+NUMBER_RE = re.compile(r'^(\s*)\d+[.)]\s+(.*)$')
+TABLE_RULE_RE = re.compile(r'^\s*\|?\s*:?-+:?\s*(\|\s*:?-+:?\s*)*\|?\s*$')
+RULE_RE = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+INLINE_RE = re.compile(r'(\*\*.+?\*\*|`[^`]+`)')
+
+
+def parse_blocks(lines):
+    """Yield block events from an iterable of Markdown lines
+
+    Events: ('heading', level, text), ('paragraph', text), ('bullet', level, text),
+    ('number', text), ('table', headers, rows), ('code', text), ('page_break',).
+    """
+    paragraph = []
+    fence = None        # indentation of the open ``` fence, or None
+    code = []
+    table = []          # raw rows of the table being read
+
+    def flush_paragraph():
+        if paragraph:
+            yield ('paragraph', '\n'.join(paragraph))
+            paragraph.clear()
+
+    def flush_table():
+        if table:
+            header, rows = table[0], table[1:]
+            if rows and TABLE_RULE_RE.match(rows[0]):
+                headers = split_row(header)
+                yield ('table', headers, [split_row(row)[:len(headers)] for row in rows[1:]])
+            else:
+                # Not a real table; keep the lines as text
+                yield ('paragraph', '\n'.join(table))
+            table.clear()
+
+    for raw in lines:
+        line = raw.rstrip('\n').rstrip('\r')
+        stripped = line.strip()
+
+        if fence is not None:
+            if stripped.startswith('```'):
+                yield ('code', '\n'.join(code))
+                fence, code = None, []
+            else:
+                code.append(line[fence:] if line[:fence].strip() == '' else line)
+            continue
+
+        if stripped.startswith('|'):
+            yield from flush_paragraph()
+            table.append(stripped)
+            continue
+        yield from flush_table()
+
+        if stripped.startswith('```'):
+            yield from flush_paragraph()
+            fence = len(line) - len(line.lstrip())
+            continue
+
+        if not stripped:
+            yield from flush_paragraph()
+            continue
+
+        heading = HEADING_RE.match(line)
+        if heading:
+            yield from flush_paragraph()
+            yield ('heading', len(heading.group(1)) - 1, heading.group(2))
+            continue
+
+        if RULE_RE.match(line):
+            yield from flush_paragraph()
+            yield ('page_break',)
+            continue
+
+        bullet = BULLET_RE.match(line)
+        if bullet:
+            yield from flush_paragraph()
+            yield ('bullet', min(len(bullet.group(1)) // 2 + 1, 3), bullet.group(2))
+            continue
+
+        number = NUMBER_RE.match(line)
+        if number:
+            yield from flush_paragraph()
+            yield ('number', number.group(2))
+            continue
+
+        paragraph.append(stripped)
+
+    if fence is not None:
+        yield ('code', '\n'.join(code))
+    yield from flush_table()
+    yield from flush_paragraph()
+
+
+def split_row(row):
+    """Split a pipe table row into plain-text cells"""
+    row = row.strip()
+    if row.startswith('|'):
+        row = row[1:]
+    if row.endswith('|') and not row.endswith('\\|'):
+        row = row[:-1]
+    cells = re.split(r'(?<!\\)\|', row)
+    return [plain_text(cell.strip().replace('\\|', '|')) for cell in cells]
+
+
+def link_text(text):
+    """Replace [text](#anchor) with text and [text](url) with 'text (url)'"""
+    return LINK_RE.sub(lambda m: m.group(1) if m.group(2).startswith('#') else f'{m.group(1)} ({m.group(2)})', text)
+
+
+def plain_text(text):
+    """Inline Markdown with the ** and ` markers removed"""
+    return INLINE_RE.sub(lambda m: m.group(0).strip('*`'), link_text(text))
+
+
+def add_inline(paragraph, text):
+    """Add runs for text with **bold** and `code` spans"""
+    for part in INLINE_RE.split(link_text(text)):
+        if not part:
+            continue
+        if part.startswith('**') and part.endswith('**') and len(part) > 4:
+            paragraph.add_run(part[2:-2]).bold = True
+        elif part.startswith('`') and part.endswith('`') and len(part) > 2:
+            apply_run_properties(paragraph.add_run(part[1:-1]), run_properties(DIAGRAM_FONT))
+        else:
+            paragraph.add_run(part)
+    return paragraph
+
+
+def render_blocks(doc, blocks):
+    """Render parse_blocks() events into doc"""
+    helpers = DocHelpers(doc)
+    for block in blocks:
+        kind = block[0]
+        if kind == 'heading':
+            helpers.add_heading(plain_text(block[2]), min(block[1], 9))
+        elif kind == 'paragraph':
+            add_inline(doc.add_paragraph(), block[1])
+        elif kind == 'bullet':
+            add_inline(helpers.add_bullet('', block[1]), block[2])
+        elif kind == 'number':
+            add_inline(doc.add_paragraph(style='List Number'), block[1])
+        elif kind == 'table':
+            helpers.create_table(block[1], block[2])
+        elif kind == 'code':
+            helpers.add_diagram(block[1])
+        elif kind == 'page_break':
+            doc.add_page_break()
+    return doc
+
+
+def compile_markdown(md_path, output_path=None):
+    """Compile one .md file; the .docx goes to the output directory by default"""
+    output_path = output_path or output_file(os.path.splitext(os.path.basename(md_path))[0] + '.docx')
+    doc = new_document()
+    with open(md_path, encoding='utf-8') as f:
+        render_blocks(doc, parse_blocks(f))
+    save_document(doc, output_path)
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('sources', nargs='*', help='Markdown files (default: every .md in docs/)')
+    parser.add_argument('--output-dir', help='directory for the generated documents')
+    args = parser.parse_args(argv)
+    set_output_dir(args.output_dir)
+
+    sources = args.sources or sorted(glob.glob(os.path.join(DOCS_DIR, '*.md')))
+    output_paths = []
+    for md_path in sources:
+        start = time.perf_counter()
+        output_paths.append(compile_markdown(md_path))
+        print(f"{os.path.basename(md_path)} -> {output_paths[-1]} ({time.perf_counter() - start:.2f}s)")
+    return output_paths
+
+
+if __name__ == "__main__":
+    main()
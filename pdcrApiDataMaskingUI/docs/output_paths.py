@@ -0,0 +1,80 @@
+"""Output locations and atomic writes for the docs/ generators.
+
+Generated documents go to the directory named by the DOCS_OUTPUT_DIR
+environment variable, or next to these scripts when it is unset. build_all.py,
+docs_cli.py and md_to_docx.py set it from their --output-dir option, so worker
+processes inherit it and parallel CI jobs can each write to their own
+directory.
+
+Every file is written to a temporary file in the target directory and then
+renamed over the destination, so a crash mid-save never leaves a truncated
+.docx behind and readers only ever see complete files. A check can be run
+on the temporary file first, so output that fails validation never
+replaces the previous file either.
+"""
+import contextlib
+import os
+import tempfile
+
+OUTPUT_DIR_ENV = 'DOCS_OUTPUT_DIR'
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def output_dir():
+    """The directory generated documents are written to"""
+    return os.environ.get(OUTPUT_DIR_ENV) or DOCS_DIR
+
+
+def set_output_dir(path):
+    """Use path as the output directory for this process and its children"""
+    if path:
+        os.environ[OUTPUT_DIR_ENV] = os.path.abspath(path)
+
+
+def output_file(filename):
+    """Full path for a generated file in the output directory"""
+    return os.path.join(output_dir(), filename)
+
+
+class RejectedOutput(Exception):
+    """The written file failed the check passed to atomic_write()"""
+
+
+@contextlib.contextmanager
+def atomic_write(path, mode='wb', encoding=None, check=None):
+    """Open a temporary file next to path and rename it over path on success
+
+    check(temporary path) runs once the file is written; if it returns
+    False the file is dropped, path is left untouched and RejectedOutput
+    is raised.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=f'.{os.path.basename(path)}.', suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if check is not None and not check(tmp_path):
+            raise RejectedOutput(path)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp_path)
+        raise
+
+
+def save_document(doc, path, check=None):
+    """doc.save(path), atomically
+
+    With check, the document is only saved if check(temporary path) returns
+    True; returns path, or None if it was rejected (see atomic_write).
+    """
+    try:
+        with atomic_write(path, check=check) as f:
+            doc.save(f)
+    except RejectedOutput:
+        return None
+    return path
@@ -0,0 +1,112 @@
+"""Role x action permission model read from the frontend (src/utils/rbac.js).
+
+rbac.js grants permissions with a PERMISSIONS object mapping each role to
+its list of actions ('connection.view', 'workflow.execute', ...). This
+module parses that object and stores it as a bitmap: every action gets a
+bit, every role an int mask, so a permission check is one AND and roles
+with identical permissions share a mask.
+
+Roles created at runtime through roleAPI.createRole are not in rbac.js.
+They can be added from a JSON file:
+
+    [
+      {"rolename": "auditor", "inherits": "general", "permissions": ["masking.view"],
+       "description": "External audit", "typical_users": "Auditors"},
+      {"rolename": "operator", "permissions": ["workflow.view", "workflow.execute"]}
+    ]
+
+"inherits" copies another role's mask; "permissions" adds actions.
+"""
+import json
+import os
+import re
+
+from api_model import COMMENT_RE, STRING
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+RBAC_JS = os.path.join(DOCS_DIR, '..', 'src', 'utils', 'rbac.js')
+
+PERMISSIONS_RE = re.compile(r'^const PERMISSIONS = \{(.*?)^\};', re.M | re.S)
+ROLE_RE = re.compile(r'(\w+)\s*:\s*\[(.*?)\]', re.S)
+STRING_RE = re.compile(STRING)
+
+
+def parse_permissions(source):
+    """{role: [action, ...]} from the PERMISSIONS object in rbac.js source, in file order"""
+    source = COMMENT_RE.sub(lambda m: m.group(1) or '', source)
+    body = PERMISSIONS_RE.search(source)
+    if body is None:
+        raise ValueError('PERMISSIONS object not found in rbac.js')
+    return {role: [literal[1:-1] for literal in STRING_RE.findall(actions)]
+            for role, actions in ROLE_RE.findall(body.group(1))}
+
+
+class RoleMatrix:
+    """Roles and actions with one permission bitmask per role"""
+
+    def __init__(self):
+        self.actions = []       # bit i is actions[i]
+        self.bits = {}          # action -> bit
+        self.masks = {}         # role -> int, in insertion order
+        self.details = {}       # role -> {'description': ..., 'typical_users': ...}
+
+    @property
+    def roles(self):
+        return list(self.masks)
+
+    def bit(self, action):
+        """The bit for action, assigning the next free one to new actions"""
+        if action not in self.bits:
+            self.bits[action] = 1 << len(self.actions)
+            self.actions.append(action)
+        return self.bits[action]
+
+    def add_role(self, role, actions, base_mask=0, **details):
+        mask = base_mask
+        for action in actions:
+            mask |= self.bit(action)
+        self.masks[role] = mask
+        self.details[role] = details
+
+    def allows(self, role, action):
+        return bool(self.masks[role] & self.bits.get(action, 0))
+
+    def role_actions(self, role):
+        """The role's actions, in action order"""
+        mask = self.masks[role]
+        return [action for action in self.actions if mask & self.bits[action]]
+
+    def profiles(self, roles=None, separate=()):
+        """[(mask, [roles])] for each distinct permission set, in the order of roles
+
+        Roles in separate get a profile of their own even if another role
+        has the same mask (e.g. admin, which the UI also checks by name).
+        """
+        groups = {}
+        for role in roles or self.masks:
+            mask = self.masks[role]
+            groups.setdefault((mask, role if role in separate else None), []).append(role)
+        return [(mask, members) for (mask, _), members in groups.items()]
+
+    @classmethod
+    def from_rbac_js(cls, path=RBAC_JS):
+        with open(path, encoding='utf-8') as f:
+            permissions = parse_permissions(f.read())
+        matrix = cls()
+        for role, actions in permissions.items():
+            matrix.add_role(role, actions)
+        return matrix
+
+    def load_custom_roles(self, path):
+        """Add the roles listed in a JSON file (see the module docstring)"""
+        with open(path, encoding='utf-8') as f:
+            roles = json.load(f)
+        for entry in roles:
+            inherits = entry.get('inherits')
+            if inherits is not None and inherits not in self.masks:
+                raise ValueError(f"Role {entry['rolename']!r} inherits unknown role {inherits!r}")
+            self.add_role(entry['rolename'], entry.get('permissions', []),
+                          self.masks[inherits] if inherits else 0,
+                          description=entry.get('description', 'Custom role'),
+                          typical_users=entry.get('typical_users', ''))
+        return self
@@ -0,0 +1,136 @@
+"""On-disk cache of rendered document sections.
+
+A generator describes its document as a list of (name, render) pairs, where
+render(doc) appends that section's paragraphs and tables to doc. Each section
+is rendered into its own scratch document and the resulting body XML is
+cached under .cache/sections/, keyed by a hash of the section's source code,
+the page setup function and the helper modules. On the next build unchanged
+sections are spliced back from the cache and only edited sections re-render.
+
+Sections that render from files other than their own source (api.js and
+its extractor for the API reference) declare them with @depends_on(path,
+...); the files' contents are part of the key. Functions can be named too,
+and their source is hashed. Inputs every section reads (the generator's
+own helper functions) are passed to build_sections() as shared.
+
+Only body XML is cached, so sections must not add parts that need package
+relationships (images, hyperlinks, footnotes). The one exception is
+add_diagram() pictures, which diagram_renderer re-links to the target
+document by cache key when a fragment is spliced.
+"""
+import hashlib
+import inspect
+import os
+import time
+
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls
+
+import base_template
+import diagram_renderer
+import docx_helpers
+from output_paths import atomic_write
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'sections')
+
+
+def _file_hash(path):
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+# Changes whenever the shared helpers, the base template or this module change
+HELPERS_VERSION = hashlib.sha256(
+    ''.join(_file_hash(path) for path in (docx_helpers.__file__, diagram_renderer.__file__,
+                                          base_template.__file__, __file__)).encode()
+).hexdigest()
+
+
+def _input_hash(item):
+    """Hash of an input file's contents, or of a function's source"""
+    if callable(item):
+        return hashlib.sha256(inspect.getsource(item).encode('utf-8')).hexdigest()
+    return _file_hash(item)
+
+
+def depends_on(*inputs):
+    """Mark a section render function as reading the given input files or functions"""
+    def decorate(render):
+        render.cache_inputs = inputs
+        return render
+    return decorate
+
+
+def section_key(name, render, new_document, shared=()):
+    """Cache key for a section: its name, source text, input files, shared
+    inputs, page setup, helper version and diagram mode"""
+    digest = hashlib.sha256()
+    inputs = [_input_hash(item) for item in (*getattr(render, 'cache_inputs', ()), *shared)]
+    for part in (name, inspect.getsource(render), *inputs, inspect.getsource(new_document), HELPERS_VERSION,
+                 diagram_renderer.diagram_mode()):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def render_fragment(render, new_document):
+    """Render one section into a scratch document and return its body XML"""
+    scratch = new_document()
+    body = scratch.element.body
+    existing = len(body) - 1  # everything before the trailing sectPr
+    render(scratch)
+    children = [child for child in body[existing:] if child is not body.sectPr]
+    inner = ''.join(child.xml for child in children)
+    return f'<w:body {nsdecls("w")}>{inner}</w:body>'
+
+
+def splice_fragment(doc, fragment):
+    """Append the children of a cached <w:body> fragment to doc
+
+    Raises FileNotFoundError, before changing doc, if a diagram it embeds
+    has left the diagram cache.
+    """
+    body = parse_xml(fragment)
+    diagram_renderer.relink_diagrams(doc, body)
+    sect_pr = doc.element.body.sectPr
+    for child in list(body):
+        sect_pr.addprevious(child)
+
+
+def _read(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _write(path, fragment):
+    with atomic_write(path, 'w', encoding='utf-8') as f:
+        f.write(fragment)
+
+
+def build_sections(doc, sections, new_document, cache_dir=CACHE_DIR, use_cache=True, shared=()):
+    """Append every section to doc, reusing cached fragments where possible
+
+    shared lists files or functions that every section's key depends on.
+    Returns a list of (name, 'cached' | 'rendered', seconds).
+    """
+    results = []
+    for name, render in sections:
+        start = time.perf_counter()
+        path = os.path.join(cache_dir, section_key(name, render, new_document, shared) + '.xml')
+        fragment = _read(path) if use_cache else None
+        status = 'cached'
+        if fragment is not None:
+            try:
+                splice_fragment(doc, fragment)
+            except FileNotFoundError:
+                fragment = None
+        if fragment is None:
+            fragment = render_fragment(render, new_document)
+            _write(path, fragment)
+            status = 'rendered'
+            splice_fragment(doc, fragment)
+        results.append((name, status, time.perf_counter() - start))
+    return results
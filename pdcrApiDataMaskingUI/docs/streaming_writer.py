@@ -0,0 +1,155 @@
+"""Streaming .docx writer for very large generated documents.
+
+python-docx keeps the whole document tree in memory, so appendices with
+hundreds of thousands of table rows grow memory linearly. StreamingDocument
+copies every part of a template package (by default the cached styled base
+package from base_template.py) into the output zip except
+word/document.xml, which it writes incrementally as blocks are added, so
+memory stays bounded by the largest single block. The package is written to
+a temporary file and only renamed to path once close() succeeds.
+
+It supports the primitives the generators use through docx_helpers:
+add_heading, add_text, add_bullet, add_diagram, add_page_break and
+create_table (rows may be a generator). Anything needing python-docx
+objects (run-level formatting, pictures) is not available in this mode, so
+add_diagram always uses the monospace-text rendering.
+
+No generator in docs/ builds through it today, and none should: their
+largest table has 20 rows (the RBAC matrix), so python-docx's tree never
+gets large, and all of them need pictures or bold/code runs. This writer is
+for appendix-scale output (execution history or audit exports with
+thousands of rows); bench_docs.py measures it against DocHelpers at 10x and
+100x the generators' table sizes to show where the crossover is.
+
+Usage:
+
+    with StreamingDocument('Audit_Appendix.docx') as doc:
+        doc.add_heading('Execution History', 1)
+        doc.create_table(['Execution', 'Status', 'Rows'], iter_rows())
+"""
+import contextlib
+import io
+import re
+import zipfile
+
+from docx.oxml import parse_xml
+from docx.shared import Inches
+
+import base_template
+from docx_helpers import (DIAGRAM_FONT, DIAGRAM_FONT_SIZE, HEADER_COLOR, run_properties_xml,
+                          run_xml, table_xml)
+from output_paths import atomic_write
+
+DOCUMENT_PART = 'word/document.xml'
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+
+# Text is encoded and handed to the zip stream in chunks of this size
+BUFFER_SIZE = 1 << 16
+
+
+def _style_ids(styles_xml):
+    """Map style names ('Heading 1') to style ids ('Heading1')"""
+    styles = parse_xml(styles_xml)
+    ids = {}
+    for style in styles.iter(f'{{{W_NS}}}style'):
+        name = style.find(f'{{{W_NS}}}name')
+        if name is not None:
+            ids[name.get(f'{{{W_NS}}}val')] = style.get(f'{{{W_NS}}}styleId')
+    return ids
+
+
+class StreamingDocument:
+    """A write-only .docx whose body is streamed straight into the zip"""
+
+    def __init__(self, path, template=None, margin=Inches(1),
+                 diagram_font_size=DIAGRAM_FONT_SIZE, compresslevel=None):
+        self.path = path
+        self._output = contextlib.ExitStack()
+        output = self._output.enter_context(atomic_write(path))
+        self._zip = zipfile.ZipFile(output, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel)
+        with zipfile.ZipFile(template or base_template.template_path()) as source:
+            document_xml = source.read(DOCUMENT_PART).decode('utf-8')
+            self._styles = _style_ids(source.read('word/styles.xml'))
+            for item in source.infolist():
+                if item.filename != DOCUMENT_PART:
+                    info = zipfile.ZipInfo(item.filename, item.date_time)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    self._zip.writestr(info, source.read(item.filename), compresslevel=compresslevel)
+
+        # Everything up to <w:body> is written as-is, the template's body
+        # content is dropped and its final sectPr closes the document.
+        body_open = re.search(r'<w:body>', document_xml).end()
+        sect_pr = parse_xml(re.search(r'<w:sectPr\b.*?</w:sectPr>', document_xml, re.S).group(0)
+                            .replace('<w:sectPr', f'<w:sectPr xmlns:w="{W_NS}"', 1))
+        self._block_width = self._set_margins(sect_pr, margin)
+        self._tail = (sect_pr.xml.replace(f' xmlns:w="{W_NS}"', '', 1) + '</w:body></w:document>')
+
+        self._stream = io.TextIOWrapper(
+            io.BufferedWriter(self._zip.open(DOCUMENT_PART, 'w', force_zip64=True), BUFFER_SIZE),
+            encoding='utf-8')
+        self._stream.write(document_xml[:body_open])
+        self._diagram_rpr = run_properties_xml(DIAGRAM_FONT, diagram_font_size)
+
+    @staticmethod
+    def _set_margins(sect_pr, margin):
+        """Apply margin to all four sides; return the text block width in twips"""
+        pg_mar = sect_pr.find(f'{{{W_NS}}}pgMar')
+        if margin is not None:
+            for side in ('top', 'right', 'bottom', 'left'):
+                pg_mar.set(f'{{{W_NS}}}{side}', str(margin.twips))
+        page_width = int(sect_pr.find(f'{{{W_NS}}}pgSz').get(f'{{{W_NS}}}w'))
+        return page_width - int(pg_mar.get(f'{{{W_NS}}}left')) - int(pg_mar.get(f'{{{W_NS}}}right'))
+
+    def _style_id(self, name):
+        return self._styles.get(name, name.replace(' ', ''))
+
+    def _paragraph(self, text, style=None, rpr=''):
+        ppr = f'<w:pPr><w:pStyle w:val="{self._style_id(style)}"/></w:pPr>' if style else ''
+        self._stream.write(f'<w:p>{ppr}{run_xml(text, rpr) if text else ""}</w:p>')
+
+    def add_heading(self, text, level=1):
+        """Add a heading with specified level (0 is the Title style)"""
+        self._paragraph(text, 'Title' if level == 0 else f'Heading {level}')
+
+    def add_text(self, text):
+        """Add a normal paragraph"""
+        self._paragraph(text)
+
+    def add_bullet(self, text, level=1):
+        """Add a bullet point"""
+        self._paragraph(text, 'List Bullet' if level == 1 else f'List Bullet {level}')
+
+    def add_diagram(self, text):
+        """Add ASCII diagram in monospace font"""
+        self._paragraph(text, rpr=self._diagram_rpr)
+
+    def add_page_break(self):
+        self._stream.write('<w:p><w:r><w:br w:type="page"/></w:r></w:p>')
+
+    def create_table(self, headers, rows, header_color=HEADER_COLOR):
+        """Stream a formatted table; rows are consumed one at a time"""
+        col_width = self._block_width // len(headers)
+        for chunk in table_xml(headers, rows, col_width, self._style_id('Table Grid'), header_color):
+            self._stream.write(chunk)
+
+    def close(self):
+        if self._stream is None:
+            return
+        self._stream.write(self._tail)
+        self._stream.close()
+        self._stream = None
+        self._zip.close()
+        self._output.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._stream is not None:
+            # Drop the temporary file and leave any existing path untouched
+            self._stream = None
+            with contextlib.suppress(Exception):
+                self._zip.close()
+            self._output.__exit__(exc_type, exc, tb)
@@ -0,0 +1,338 @@
+/**
+ * Local mock of the masking API's workflow execution endpoints, for working
+ * on WorkflowDetailPage (and testing the execution progress stream) without
+ * the backend. Node built-ins only.
+ *
+ *   npm run mock-server
+ *
+ * Listens on MOCK_PORT (default 9000, the REACT_APP_API_URL in .env). Any
+ * username and password log in as admin. Workflow 1 exists with
+ * MOCK_HISTORY (default 120) nightly finished runs; executing it starts a simulated run that masks one batch
+ * per second (MOCK_TICK_MS), logs a line per batch and can be paused,
+ * resumed and stopped. MOCK_STREAM=off answers the progress stream with 404,
+ * as a backend without it would, so the page falls back to status polling.
+ */
+const http = require('http');
+const { URL } = require('url');
+
+const PORT = Number(process.env.MOCK_PORT) || 9000;
+const TICK_MS = Number(process.env.MOCK_TICK_MS) || 1000;
+const BATCH_SIZE = 500;
+const TOTAL_RECORDS = 25000;
+const HEARTBEAT_MS = 15000;
+const REPLAY_EVENTS = 1000;
+const STREAM_ENABLED = process.env.MOCK_STREAM !== 'off';
+const HISTORY_RUNS = Number(process.env.MOCK_HISTORY ?? 120);
+const EXECUTIONS_DEFAULT_LIMIT = 50;
+const EXECUTIONS_MAX_LIMIT = 200;
+const LOGS_DEFAULT_LIMIT = 1000;
+const LOGS_MAX_LIMIT = 5000;
+
+const ACTIVE_STATUSES = ['queued', 'running', 'paused'];
+
+// =====================================================
+// In-memory data
+// =====================================================
+
+const workflows = {
+  1: {
+    id: 1,
+    name: 'Customer PII (mock)',
+    description: 'Simulated workflow served by mock-server/server.js',
+    status: 'ready',
+    connection_id: 1,
+    connection: { id: 1, name: 'Mock SQL Server', server: 'localhost', database: 'mockdb', connection_type: 'sqlserver' },
+    table_mappings: [{
+      schema_name: 'dbo',
+      table_name: 'customers',
+      column_mappings: [
+        { column_name: 'email', is_pii: true, pii_attribute: 'email' },
+        { column_name: 'phone', is_pii: true, pii_attribute: 'phone_number' },
+        { column_name: 'created_at', is_pii: false },
+      ],
+    }],
+    created_at: '2025-01-06T09:00:00Z',
+    updated_at: '2025-01-06T09:00:00Z',
+  },
+};
+
+const executions = []; // every workflow's executions, oldest first
+let nextExecutionId = 1;
+
+const createExecution = (workflowId, fields = {}) => {
+  const execution = {
+    id: nextExecutionId++,
+    workflow_id: workflowId,
+    status: 'queued',
+    started_at: new Date().toISOString(),
+    completed_at: null,
+    records_total: TOTAL_RECORDS,
+    records_processed: 0,
+    total_batches: Math.ceil(TOTAL_RECORDS / BATCH_SIZE),
+    last_completed_batch: 0,
+    execution_logs: ['Execution queued'],
+    ...fields,
+  };
+  executions.push(execution);
+  return execution;
+};
+
+// Nightly finished runs, enough history to page through
+for (let day = HISTORY_RUNS; day >= 1; day--) {
+  const started = new Date(Date.now() - day * 86400000);
+  createExecution(1, {
+    status: 'completed',
+    started_at: started.toISOString(),
+    completed_at: new Date(started.getTime() + 50 * TICK_MS).toISOString(),
+    records_processed: TOTAL_RECORDS,
+    last_completed_batch: Math.ceil(TOTAL_RECORDS / BATCH_SIZE),
+    execution_logs: ['Execution queued', 'Masked 25000 records', 'Execution completed successfully'],
+  });
+}
+
+const findExecution = (workflowId, executionId) =>
+  executions.find(e => String(e.id) === String(executionId) && String(e.workflow_id) === String(workflowId));
+
+// An execution as history rows, status responses and stream events send it:
+// log lines are fetched separately, only their count is sent
+const summary = ({ execution_logs: logs, ...fields }) => ({ ...fields, log_count: logs.length });
+
+// =====================================================
+// Execution progress stream (see src/services/executionStream.js)
+// =====================================================
+
+const subscribers = new Set(); // { workflowId, res }
+const recentEvents = [];       // { id, workflowId, text } for Last-Event-ID replay
+let nextEventId = 1;
+
+const publish = (workflowId, event, data) => {
+  const id = nextEventId++;
+  const text = `id: ${id}\nevent: ${event}\ndata: ${JSON.stringify(data)}\n\n`;
+  recentEvents.push({ id, workflowId: String(workflowId), text });
+  if (recentEvents.length > REPLAY_EVENTS) recentEvents.shift();
+  subscribers.forEach(subscriber => {
+    if (subscriber.workflowId === String(workflowId)) subscriber.res.write(text);
+  });
+};
+
+const publishExecution = (execution) => publish(execution.workflow_id, 'execution', summary(execution));
+
+const appendLog = (execution, message) => {
+  execution.execution_logs.push(message);
+  publish(execution.workflow_id, 'log', {
+    execution_id: execution.id,
+    seq: execution.execution_logs.length,
+    message,
+  });
+};
+
+const openStream = (req, res, url) => {
+  const workflowId = url.searchParams.get('workflow_id');
+  if (!workflows[workflowId]) {
+    return sendJson(res, 404, { success: false, error: 'Workflow not found' });
+  }
+  res.writeHead(200, {
+    ...CORS_HEADERS,
+    'Content-Type': 'text/event-stream',
+    'Cache-Control': 'no-cache',
+    Connection: 'keep-alive',
+  });
+
+  const lastEventId = Number(req.headers['last-event-id']);
+  if (lastEventId) {
+    // Reconnect: replay what the client missed
+    recentEvents
+      .filter(event => event.id > lastEventId && event.workflowId === String(workflowId))
+      .forEach(event => res.write(event.text));
+  } else {
+    // First connect: the current state of every active execution
+    executions
+      .filter(e => String(e.workflow_id) === String(workflowId) && ACTIVE_STATUSES.includes(e.status))
+      .forEach(e => res.write(`event: execution\ndata: ${JSON.stringify(summary(e))}\n\n`));
+  }
+
+  const subscriber = { workflowId: String(workflowId), res };
+  subscribers.add(subscriber);
+  const heartbeat = setInterval(() => res.write(': ping\n\n'), HEARTBEAT_MS);
+  req.on('close', () => {
+    clearInterval(heartbeat);
+    subscribers.delete(subscriber);
+  });
+  return undefined;
+};
+
+// One batch per tick for every running execution
+setInterval(() => {
+  executions.filter(e => e.status === 'queued' || e.status === 'running').forEach(execution => {
+    if (execution.status === 'queued') {
+      execution.status = 'running';
+      appendLog(execution, `Execution started: ${execution.total_batches} batches of ${BATCH_SIZE} records`);
+    } else {
+      execution.last_completed_batch += 1;
+      execution.records_processed = Math.min(execution.records_processed + BATCH_SIZE, execution.records_total);
+      appendLog(execution, `Batch ${execution.last_completed_batch}/${execution.total_batches}: ` +
+        `masked ${execution.records_processed} of ${execution.records_total} records`);
+      if (execution.records_processed >= execution.records_total) {
+        execution.status = 'completed';
+        execution.completed_at = new Date().toISOString();
+        appendLog(execution, 'Execution completed successfully');
+      }
+    }
+    publishExecution(execution);
+  });
+}, TICK_MS);
+
+// =====================================================
+// HTTP
+// =====================================================
+
+const CORS_HEADERS = {
+  'Access-Control-Allow-Origin': '*',
+  'Access-Control-Allow-Headers': 'Authorization, Content-Type, Last-Event-ID',
+  'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+};
+
+const sendJson = (res, status, body) => {
+  res.writeHead(status, { ...CORS_HEADERS, 'Content-Type': 'application/json' });
+  res.end(JSON.stringify(body));
+};
+
+const readBody = (req) => new Promise((resolve) => {
+  let text = '';
+  req.on('data', chunk => { text += chunk; });
+  req.on('end', () => {
+    try {
+      resolve(text ? JSON.parse(text) : {});
+    } catch (err) {
+      resolve({});
+    }
+  });
+});
+
+// Pause, resume and stop: (execution) => error detail or null after changing it
+const TRANSITIONS = {
+  pause: (execution) => {
+    if (execution.status === 'paused') return 'Execution is already paused';
+    if (execution.status !== 'running') return `Cannot pause a ${execution.status} execution`;
+    execution.status = 'paused';
+    appendLog(execution, `Execution paused after batch ${execution.last_completed_batch}`);
+    return null;
+  },
+  resume: (execution) => {
+    if (execution.status === 'running') return 'Execution is already running';
+    if (execution.status !== 'paused') return `Cannot resume a ${execution.status} execution`;
+    execution.status = 'running';
+    appendLog(execution, `Execution resumed from batch ${execution.last_completed_batch + 1}`);
+    return null;
+  },
+  stop: (execution) => {
+    if (!ACTIVE_STATUSES.includes(execution.status)) return `Execution has already ${execution.status}`;
+    execution.status = 'stopped';
+    execution.completed_at = new Date().toISOString();
+    appendLog(execution, 'Execution stopped by user');
+    return null;
+  },
+};
+
+const routes = {
+  'POST /api/auth/login': (body) => [200, {
+    token: 'mock-token',
+    user: { username: body.username || 'mock', role: 'admin' },
+  }],
+  'GET /api/datamasking/workflows': () => [200, { success: true, data: Object.values(workflows) }],
+  'POST /api/datamasking/workflows/getById': (body) => (workflows[body.id]
+    ? [200, { success: true, data: workflows[body.id] }]
+    : [404, { success: false, error: 'Workflow not found' }]),
+  'POST /api/datamasking/connections/getById': (body) => [200, { success: true, data: workflows[1].connection, id: body.id }],
+  // Keyset pages, newest first: ids below before_id (all when absent), at most limit
+  'POST /api/datamasking/workflows/executions': (body) => {
+    const limit = Math.min(Number(body.limit) || EXECUTIONS_DEFAULT_LIMIT, EXECUTIONS_MAX_LIMIT);
+    const beforeId = body.before_id == null ? Infinity : Number(body.before_id);
+    const matching = executions
+      .filter(e => String(e.workflow_id) === String(body.workflow_id) && e.id < beforeId)
+      .reverse();
+    const page = matching.slice(0, limit);
+    const hasMore = matching.length > limit;
+    return [200, {
+      success: true,
+      data: page.map(summary),
+      has_more: hasMore,
+      next_before_id: hasMore ? page[page.length - 1].id : null,
+    }];
+  },
+  'POST /api/datamasking/workflows/execute': (body) => {
+    if (!workflows[body.workflow_id]) return [404, { success: false, error: 'Workflow not found' }];
+    const execution = createExecution(Number(body.workflow_id));
+    publishExecution(execution);
+    return [200, {
+      success: true,
+      data: { execution_id: execution.id, task_id: `mock-task-${execution.id}`, status: 'queued',
+        message: 'Workflow execution queued successfully' },
+    }];
+  },
+  // Log lines with seq > after_seq, oldest first, at most limit
+  'POST /api/datamasking/workflows/executions/logs': (body) => {
+    const execution = findExecution(body.workflow_id, body.execution_id);
+    if (!execution) return [404, { success: false, error: 'Execution not found' }];
+    const limit = Math.min(Number(body.limit) || LOGS_DEFAULT_LIMIT, LOGS_MAX_LIMIT);
+    const afterSeq = Math.max(Number(body.after_seq) || 0, 0);
+    const lines = execution.execution_logs
+      .slice(afterSeq, afterSeq + limit)
+      .map((message, index) => ({ seq: afterSeq + index + 1, message }));
+    const nextAfterSeq = afterSeq + lines.length;
+    return [200, {
+      success: true,
+      data: lines,
+      has_more: nextAfterSeq < execution.execution_logs.length,
+      next_after_seq: nextAfterSeq,
+    }];
+  },
+  'POST /api/datamasking/workflows/executions/status': (body) => {
+    const execution = findExecution(body.workflow_id, body.execution_id);
+    return execution
+      ? [200, { success: true, data: summary(execution) }]
+      : [404, { success: false, error: 'Execution not found' }];
+  },
+};
+
+Object.entries(TRANSITIONS).forEach(([action, transition]) => {
+  routes[`POST /api/datamasking/workflows/executions/${action}`] = (body) => {
+    const execution = findExecution(body.workflow_id, body.execution_id);
+    if (!execution) return [404, { success: false, error: 'Execution not found' }];
+    const detail = transition(execution);
+    if (detail) return [400, { success: false, detail }];
+    publishExecution(execution);
+    return [200, {
+      success: true,
+      last_completed_batch: execution.last_completed_batch,
+      resume_from_batch: execution.last_completed_batch + 1,
+    }];
+  };
+});
+
+const server = http.createServer(async (req, res) => {
+  const url = new URL(req.url, `http://${req.headers.host}`);
+  if (req.method === 'OPTIONS') {
+    res.writeHead(204, CORS_HEADERS);
+    res.end();
+    return;
+  }
+  if (STREAM_ENABLED && req.method === 'GET' && url.pathname === '/api/datamasking/workflows/executions/stream') {
+    openStream(req, res, url);
+    return;
+  }
+
+  const route = routes[`${req.method} ${url.pathname}`];
+  if (!route) {
+    sendJson(res, 404, { success: false, error: `No mock for ${req.method} ${url.pathname}` });
+    return;
+  }
+  const [status, body] = route(await readBody(req), url);
+  console.log(`${req.method} ${url.pathname} -> ${status}`);
+  sendJson(res, status, body);
+});
+
+server.listen(PORT, () => {
+  console.log(`Mock masking API on http://localhost:${PORT} (batch every ${TICK_MS} ms` +
+    `${STREAM_ENABLED ? '' : ', no progress stream'})`);
+});
@@ -0,0 +1,167 @@
+import React, { useState, useEffect, useMemo, useRef } from 'react';
+import {
+  Box,
+  Typography,
+  TextField,
+  InputAdornment,
+  ToggleButton,
+  ToggleButtonGroup,
+  FormControlLabel,
+  Switch,
+} from '@mui/material';
+import { Search as SearchIcon } from '@mui/icons-material';
+import { LOG_LEVEL_NAMES } from '../../utils/executionLogs';
+
+// Rows are a fixed height so the visible slice can be computed from scrollTop alone
+const ROW_HEIGHT = 24;
+const VIEWPORT_HEIGHT = 500;
+const OVERSCAN_ROWS = 10;
+
+const LOG_LEVELS = [
+  { value: 'error', label: 'Errors', color: 'error.main' },
+  { value: 'warning', label: 'Warnings', color: 'warning.main' },
+  { value: 'success', label: 'Success', color: 'success.main' },
+  { value: 'info', label: 'Info', color: 'text.primary' },
+];
+const LEVEL_COLORS = Object.fromEntries(LOG_LEVELS.map(level => [level.value, level.color]));
+
+/**
+ * ExecutionLogsViewer Component
+ * Windowed view of an execution's log lines: only the rows in view (plus a
+ * few either side) are in the DOM, however many lines there are. Lines can
+ * be filtered by level and searched. The store (utils/executionLogs.js)
+ * indexes each line by level and word once, when it arrives, and does the
+ * filtering (store.filter), so the viewer only renders its results.
+ *
+ * @param {Object} props
+ * @param {Object} props.store - Log store of the execution (createLogStore)
+ * @param {number} props.version - store.version, so the viewer re-renders when lines arrive
+ * @param {boolean} props.live - Whether the execution is still running; enables tail-follow
+ *
+ * @example
+ * <ExecutionLogsViewer store={store} version={store.version} live={execution.status === 'running'} />
+ */
+const ExecutionLogsViewer = ({ store, version, live = false }) => {
+  const [levels, setLevels] = useState(LOG_LEVELS.map(level => level.value));
+  const [query, setQuery] = useState('');
+  const [scrollTop, setScrollTop] = useState(0);
+  const [follow, setFollow] = useState(live);
+  const viewportRef = useRef(null);
+
+  const needle = query.trim().toLowerCase();
+  const totalLines = store.entries.length;
+
+  // Lines passing the filter. The store looks the words of the query up in
+  // its index and extends the results of a filter with the lines written
+  // since, so a keystroke or a streamed line does not scan the whole log.
+  const matches = useMemo(
+    () => store.filter(levels, needle),
+    // version changes whenever the store does
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [store, version, levels, needle],
+  );
+  const matchCount = matches.length;
+
+  // Tail-follow: keep the newest line in view while lines arrive
+  useEffect(() => {
+    if (live && follow && viewportRef.current) {
+      viewportRef.current.scrollTop = viewportRef.current.scrollHeight;
+    }
+  }, [live, follow, matchCount, version]);
+
+  const handleScroll = (event) => {
+    const { scrollTop: top, scrollHeight, clientHeight } = event.currentTarget;
+    setScrollTop(top);
+    if (live) {
+      // Scrolling up stops following; scrolling back to the end resumes it
+      setFollow(scrollHeight - top - clientHeight < ROW_HEIGHT);
+    }
+  };
+
+  const first = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN_ROWS);
+  const last = Math.min(matchCount, Math.ceil((scrollTop + VIEWPORT_HEIGHT) / ROW_HEIGHT) + OVERSCAN_ROWS);
+
+  return (
+    <Box>
+      <Box display="flex" alignItems="center" gap={2} mb={1.5} flexWrap="wrap">
+        <TextField
+          size="small"
+          placeholder="Search logs"
+          value={query}
+          onChange={(e) => setQuery(e.target.value)}
+          sx={{ minWidth: 220, flex: 1 }}
+          InputProps={{
+            startAdornment: (
+              <InputAdornment position="start">
+                <SearchIcon fontSize="small" />
+              </InputAdornment>
+            ),
+          }}
+        />
+        <ToggleButtonGroup
+          size="small"
+          value={levels}
+          onChange={(e, newLevels) => setLevels(newLevels)}
+        >
+          {LOG_LEVELS.map(level => (
+            <ToggleButton key={level.value} value={level.value} sx={{ px: 1.5, textTransform: 'none' }}>
+              {level.label} ({store.byLevel[level.value].length})
+            </ToggleButton>
+          ))}
+        </ToggleButtonGroup>
+        {live && (
+          <FormControlLabel
+            control={<Switch size="small" checked={follow} onChange={(e) => setFollow(e.target.checked)} />}
+            label="Follow"
+          />
+        )}
+      </Box>
+
+      <Typography variant="caption" color="text.secondary" sx={{ display: 'block', mb: 0.5 }}>
+        {matchCount === totalLines
+          ? `${totalLines} lines`
+          : `${matchCount} of ${totalLines} lines`}
+      </Typography>
+
+      <Box
+        ref={viewportRef}
+        onScroll={handleScroll}
+        sx={{
+          backgroundColor: '#f5f5f5',
+          borderRadius: 1,
+          height: Math.min(VIEWPORT_HEIGHT, Math.max(matchCount, 1) * ROW_HEIGHT + 16),
+          overflowY: 'auto',
+          position: 'relative',
+        }}
+      >
+        <Box sx={{ height: matchCount * ROW_HEIGHT + 16, position: 'relative' }}>
+          {matches.slice(first, last).map((entry, offset) => (
+            <Typography
+              key={entry.seq}
+              component="div"
+              title={entry.text}
+              sx={{
+                position: 'absolute',
+                top: 8 + (first + offset) * ROW_HEIGHT,
+                left: 16,
+                right: 16,
+                height: ROW_HEIGHT,
+                lineHeight: `${ROW_HEIGHT}px`,
+                whiteSpace: 'pre',
+                overflow: 'hidden',
+                textOverflow: 'ellipsis',
+                color: LEVEL_COLORS[entry.level],
+                fontFamily: 'monospace',
+                fontSize: '0.875rem',
+              }}
+            >
+              {entry.seq}. {entry.text}
+            </Typography>
+          ))}
+        </Box>
+      </Box>
+    </Box>
+  );
+};
+
+export default ExecutionLogsViewer;
@@ -1,4 +1,4 @@
-import React, { useState, useEffect } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import {
   Box,
   Typography,
@@ -57,7 +57,13 @@ import { getCurrentUser } from '../../utils/auth';
 import { isAdmin } from '../../utils/rbac';
 import PageHeader from '../common/PageHeader';
 import ProtectedAction from '../common/ProtectedAction';
+import ExecutionLogsViewer from './ExecutionLogsViewer';
 import { usePermission } from '../../hooks/usePermission';
+import { useExecutionStream } from '../../hooks/useExecutionStream';
+import { useExecutionPolling } from '../../hooks/useExecutionPolling';
+import { ACTIVE_STATUSES } from '../../services/executionPoller';
+import { createLogStore } from '../../utils/executionLogs';
+import { appendExecutionsPage, readExecutionsPage, sameId } from '../../utils/executionHistory';
 import { ThemeProvider, createTheme } from '@mui/material/styles';
 import CssBaseline from '@mui/material/CssBaseline';
 
@@ -73,6 +79,15 @@ const theme = createTheme({
   },
 });
 
+// Execution history is fetched newest first, this many rows at a time
+const EXECUTIONS_PAGE_SIZE = 25;
+
+// Load the next page when the table is scrolled to within this many pixels of its end
+const LOAD_MORE_THRESHOLD_PX = 200;
+
+// Log lines fetched per request when the logs dialog opens
+const LOGS_PAGE_SIZE = 1000;
+
 // Helper function to format date as MM/DD/YYYY HH:MM:SS AM/PM with leading zeros
 const formatDateTime = (dateString) => {
   if (!dateString) return 'N/A';
@@ -125,6 +140,7 @@ const WorkflowDetailPage = () => {
   const [executions, setExecutions] = useState([]);
   const [loading, setLoading] = useState(true);
   const [executionsLoading, setExecutionsLoading] = useState(false);
+  const [executionsPaging, setExecutionsPaging] = useState({ hasMore: false, nextBeforeId: null, loading: false });
   const [error, setError] = useState(null);
   const [successMessage, setSuccessMessage] = useState(null);
   const [infoMessage, setInfoMessage] = useState(null);
@@ -134,9 +150,23 @@ const WorkflowDetailPage = () => {
   const [currentExecution, setCurrentExecution] = useState(null);
   const [logsDialog, setLogsDialog] = useState({
     open: false,
-    logs: [],
-    executionId: null
+    store: null,
+    version: 0,
+    executionId: null,
+    loading: false,
+    error: null
   });
+  const logsRequest = useRef(0); // bumped on every open and close, so pages of an earlier request are dropped
+  const logsStore = useRef(null); // the dialog's log store, for stream callbacks
+
+  // Add fetched or streamed lines to the open dialog's store; the dialog
+  // re-renders only if one of them was new
+  const writeLogLines = (executionId, lines) => {
+    const store = logsStore.current;
+    if (store && sameId(store.executionId, executionId) && store.write(lines)) {
+      setLogsDialog(prev => (prev.store === store ? { ...prev, version: store.version } : prev));
+    }
+  };
 
   // Constraint checking state
   const [mappingTabValue, setMappingTabValue] = useState({});
@@ -158,8 +188,54 @@ const WorkflowDetailPage = () => {
     // eslint-disable-next-line react-hooks/exhaustive-deps
   }, [workflowId]);
 
-  // Manual refresh only - no automatic polling
-  // Users can refresh execution status using the refresh icon button
+  // Live progress: while an execution is queued, running or paused the page
+  // follows the workflow's progress stream and patches only the affected row.
+  // Where the stream is down or not offered, the shared status poller does
+  // the same for the active rows.
+  // The refresh icon button still reloads the full history on demand.
+  const hasActiveExecution = Boolean(currentExecution) ||
+    executions.some(execution => ACTIVE_STATUSES.includes(execution.status));
+
+  const handleExecutionUpdate = (update) => {
+    setExecutions(prev => {
+      const index = prev.findIndex(execution => sameId(execution.id, update.id));
+      if (index === -1) {
+        // Started elsewhere (another user or tab): newest first, so it goes on top
+        return [update, ...prev];
+      }
+      const next = [...prev];
+      next[index] = { ...prev[index], ...update };
+      return next;
+    });
+    setCurrentExecution(prev => {
+      if (!prev || !sameId(prev.execution_id || prev.id, update.id)) return prev;
+      return ACTIVE_STATUSES.includes(update.status) ? { ...prev, ...update } : null;
+    });
+  };
+
+  const handleExecutionLog = ({ execution_id: executionId, seq, message }) => {
+    setExecutions(prev => prev.map(execution =>
+      sameId(execution.id, executionId) && (execution.log_count || 0) < seq
+        ? { ...execution, log_count: seq }
+        : execution
+    ));
+    writeLogLines(executionId, [{ seq, message }]);
+  };
+
+  const streamState = useExecutionStream(workflowId, hasActiveExecution, {
+    onExecution: handleExecutionUpdate,
+    onLog: handleExecutionLog,
+  });
+
+  const pollingFallback = streamState === 'retrying' || streamState === 'unavailable';
+  const activeExecutionIds = executions
+    .filter(execution => ACTIVE_STATUSES.includes(execution.status))
+    .map(execution => execution.id);
+  const currentExecutionId = currentExecution?.execution_id || currentExecution?.id;
+  if (currentExecutionId && !activeExecutionIds.some(id => sameId(id, currentExecutionId))) {
+    activeExecutionIds.push(currentExecutionId);
+  }
+  useExecutionPolling(workflowId, activeExecutionIds, pollingFallback, handleExecutionUpdate);
 
   const loadWorkflowData = async () => {
     try {
@@ -169,14 +245,14 @@ const WorkflowDetailPage = () => {
       console.log('[DEBUG] Making API calls...');
       const [workflowRes, executionsRes] = await Promise.all([
         serverWorkflowsAPI.getById(workflowId),
-        serverWorkflowsAPI.getExecutions(workflowId)
+        serverWorkflowsAPI.getExecutions(workflowId, { limit: EXECUTIONS_PAGE_SIZE })
       ]);
 
       console.log('[DEBUG] API responses:', { workflowRes, executionsRes });
 
       // Handle different response structures safely
       const workflowData = workflowRes.data?.data || workflowRes.data;
-      const executionsData = executionsRes.data?.data || executionsRes.data || [];
+      const { items: executionsData, hasMore, nextBeforeId } = readExecutionsPage(executionsRes);
 
       console.log('[DEBUG] Processed data:', { workflowData, executionsData });
 
@@ -205,10 +281,8 @@ const WorkflowDetailPage = () => {
       console.log('[DEBUG] Normalized workflow:', normalizedWorkflow);
 
       setWorkflow(normalizedWorkflow);
-      const sortedExecutions = Array.isArray(executionsData)
-        ? executionsData.sort((a, b) => b.id - a.id)  // Sort by ID descending (newest first)
-        : [];
-      setExecutions(sortedExecutions);
+      setExecutions(executionsData);
+      setExecutionsPaging({ hasMore, nextBeforeId, loading: false });
 
       // Fetch connection details separately if connection_id exists but connection object is missing
       if (workflowData && workflowData.connection_id && !workflowData.connection) {
@@ -242,7 +316,7 @@ const WorkflowDetailPage = () => {
       // Call both APIs like POC implementation
       const [workflowRes, executionsRes] = await Promise.all([
         serverWorkflowsAPI.getById(workflowId),
-        serverWorkflowsAPI.getExecutions(workflowId)
+        serverWorkflowsAPI.getExecutions(workflowId, { limit: EXECUTIONS_PAGE_SIZE })
       ]);
 
       // Update workflow data to refresh status
@@ -251,12 +325,10 @@ const WorkflowDetailPage = () => {
         setWorkflow(prevWorkflow => ({ ...prevWorkflow, ...workflowData }));
       }
 
-      // Update executions with sorting
-      const executionsData = executionsRes.data?.data || executionsRes.data || [];
-      const sortedExecutions = Array.isArray(executionsData)
-        ? executionsData.sort((a, b) => b.id - a.id)  // Sort by ID descending (newest first)
-        : [];
-      setExecutions(sortedExecutions);
+      // Back to the first page of executions (newest first)
+      const { items, hasMore, nextBeforeId } = readExecutionsPage(executionsRes);
+      setExecutions(items);
+      setExecutionsPaging({ hasMore, nextBeforeId, loading: false });
     } catch (err) {
       console.error('Failed to load executions:', err);
       setError(err.message || 'Failed to load execution history');
@@ -265,29 +337,33 @@ const WorkflowDetailPage = () => {
     }
   };
 
-  // Polling function disabled - manual refresh only via refresh icon button
-  // const checkExecutionStatus = async () => {
-  //   if (!currentExecution) return;
-  //
-  //   try {
-  //     const response = await maskingAPI.getExecutionStatus(
-  //       workflowId,
-  //       currentExecution.execution_id || currentExecution.id
-  //     );
-  //     const updatedExecution = response.data?.data || response.data;
-  //
-  //     setCurrentExecution(updatedExecution);
-  //
-  //     // Stop polling when execution completes or fails
-  //     if (updatedExecution.status === 'completed' || updatedExecution.status === 'failed') {
-  //       setCurrentExecution(null);
-  //       setExecuting(false);
-  //       loadWorkflowData(); // Reload the full execution list
-  //     }
-  //   } catch (err) {
-  //     console.error('Failed to check execution status:', err);
-  //   }
-  // };
+  // Next (older) page of executions, appended below the loaded ones
+  const loadMoreExecutions = async () => {
+    const { hasMore, nextBeforeId, loading: pageLoading } = executionsPaging;
+    if (!hasMore || pageLoading || nextBeforeId == null) return;
+
+    try {
+      setExecutionsPaging(prev => ({ ...prev, loading: true }));
+      const response = await serverWorkflowsAPI.getExecutions(workflowId, {
+        beforeId: nextBeforeId,
+        limit: EXECUTIONS_PAGE_SIZE,
+      });
+      const page = readExecutionsPage(response);
+      setExecutions(prev => appendExecutionsPage(prev, page.items));
+      setExecutionsPaging({ hasMore: page.hasMore, nextBeforeId: page.nextBeforeId, loading: false });
+    } catch (err) {
+      console.error('Failed to load more executions:', err);
+      setError(err.message || 'Failed to load more execution history');
+      setExecutionsPaging(prev => ({ ...prev, loading: false }));
+    }
+  };
+
+  const handleExecutionsScroll = (event) => {
+    const { scrollTop, clientHeight, scrollHeight } = event.currentTarget;
+    if (scrollHeight - scrollTop - clientHeight < LOAD_MORE_THRESHOLD_PX) {
+      loadMoreExecutions();
+    }
+  };
 
   const handleExecuteWorkflow = async () => {
     // Check permission
@@ -315,11 +391,10 @@ const WorkflowDetailPage = () => {
       };
 
       setCurrentExecution(execution);
-      // setTaskId(result.task_id); // Commented out - polling disabled
       setExecuteDialog(false);
       setTabValue(1);
 
-      // Execution queued - no automatic polling, manual refresh only
+      // Execution queued - progress arrives over the stream (or the status poller)
       setError(null);
       setExecuting(false);
     } catch (err) {
@@ -345,19 +420,56 @@ const WorkflowDetailPage = () => {
     }
   };
 
-  const handleViewLogs = (execution) => {
-    setLogsDialog({
-      open: true,
-      logs: execution.execution_logs || [],
-      executionId: execution.id
-    });
+  // History rows carry only log_count; the lines are fetched page by page
+  // when the dialog opens (lines streamed meanwhile are merged in by seq)
+  const handleViewLogs = async (execution) => {
+    const request = ++logsRequest.current;
+    const store = createLogStore(execution.id);
+    logsStore.current = store;
+
+    // Backends that still embed the logs in history rows need no request
+    if (execution.execution_logs) {
+      store.write(execution.execution_logs.map((message, position) => ({ seq: position + 1, message })));
+      setLogsDialog({ open: true, store, version: store.version, executionId: execution.id, loading: false, error: null });
+      return;
+    }
+
+    setLogsDialog({ open: true, store, version: store.version, executionId: execution.id, loading: true, error: null });
+    try {
+      let afterSeq = 0;
+      let hasMore = true;
+      while (hasMore) {
+        const response = await serverMaskingAPI.getExecutionLogs(workflowId, execution.id, {
+          afterSeq,
+          limit: LOGS_PAGE_SIZE,
+        });
+        if (request !== logsRequest.current) return; // closed or another execution opened
+
+        const body = response.data || {};
+        const lines = Array.isArray(body.data) ? body.data : [];
+        writeLogLines(execution.id, lines);
+        hasMore = Boolean(body.has_more) && lines.length > 0;
+        afterSeq = body.next_after_seq ?? lines[lines.length - 1]?.seq ?? afterSeq;
+      }
+      setLogsDialog(prev => ({ ...prev, loading: false }));
+    } catch (err) {
+      console.error('Failed to load execution logs:', err);
+      if (request === logsRequest.current) {
+        setLogsDialog(prev => ({ ...prev, loading: false, error: err.message || 'Failed to load logs' }));
+      }
+    }
   };
 
   const handleCloseLogsDialog = () => {
+    logsRequest.current += 1;
+    logsStore.current = null;
     setLogsDialog({
       open: false,
-      logs: [],
-      executionId: null
+      store: null,
+      version: 0,
+      executionId: null,
+      loading: false,
+      error: null
     });
   };
 
@@ -389,7 +501,9 @@ const WorkflowDetailPage = () => {
       setSuccessMessage('Execution stopped successfully');
       setTimeout(() => setSuccessMessage(null), 5000);
 
-      await loadWorkflowData(); // Reload to show updated status
+      if (streamState !== 'open') {
+        await loadWorkflowData(); // Reload to show updated status; the stream pushes it otherwise
+      }
     } catch (err) {
       if (err.response?.status === 400) {
         const detail = err.response.data?.detail || '';
@@ -440,7 +554,9 @@ const WorkflowDetailPage = () => {
       setSuccessMessage(`Execution paused successfully${batchInfo}`);
       setTimeout(() => setSuccessMessage(null), 5000);
 
-      await loadWorkflowData(); // Reload to show updated status
+      if (streamState !== 'open') {
+        await loadWorkflowData(); // Reload to show updated status; the stream pushes it otherwise
+      }
     } catch (err) {
       // Handle different error types
       if (err.response?.status === 400) {
@@ -509,7 +625,9 @@ const WorkflowDetailPage = () => {
       setSuccessMessage(`Execution resumed successfully${batchInfo}`);
       setTimeout(() => setSuccessMessage(null), 5000);
 
-      await loadWorkflowData(); // Reload to show updated status
+      if (streamState !== 'open') {
+        await loadWorkflowData(); // Reload to show updated status; the stream pushes it otherwise
+      }
     } catch (err) {
       // Handle different error types
       if (err.response?.status === 400) {
@@ -1417,9 +1535,17 @@ const WorkflowDetailPage = () => {
           )}
 
           <Box display="flex" justifyContent="space-between" alignItems="center" mb={2}>
-            <Typography variant="h6">
-              Execution History ({executions.length})
-            </Typography>
+            <Box display="flex" alignItems="center" gap={1}>
+              <Typography variant="h6">
+                Execution History ({executions.length}{executionsPaging.hasMore ? '+' : ''})
+              </Typography>
+              {streamState === 'open' && (
+                <Chip label="Live" color="success" size="small" variant="outlined" title="Progress updates are pushed from the server" />
+              )}
+              {pollingFallback && activeExecutionIds.length > 0 && (
+                <Chip label="Auto-refresh" size="small" variant="outlined" title="Live updates unavailable; checking execution status periodically" />
+              )}
+            </Box>
             <IconButton onClick={loadExecutions}>
               <RefreshIcon />
             </IconButton>
@@ -1430,8 +1556,9 @@ const WorkflowDetailPage = () => {
             No executions yet. Click "Execute Workflow" to run this workflow.
           </Typography>
         ) : (
-          <TableContainer component={Paper} sx={{
+          <TableContainer component={Paper} onScroll={handleExecutionsScroll} sx={{
               overflow: 'auto',
+              maxHeight: 640,
               '&::-webkit-scrollbar': { display: 'none' },
               msOverflowStyle: 'none',
               scrollbarWidth: 'none',
@@ -1515,7 +1642,7 @@ const WorkflowDetailPage = () => {
                           <IconButton
                             size="small"
                             onClick={() => handleViewLogs(execution)}
-                            disabled={!execution.execution_logs || execution.execution_logs.length === 0}
+                            disabled={!execution.execution_logs?.length && !execution.log_count}
                             title="View Logs"
                             color="primary"
                           >
@@ -1577,6 +1704,19 @@ const WorkflowDetailPage = () => {
                     </TableRow>
                   );
                 })}
+                {executionsPaging.hasMore && (
+                  <TableRow>
+                    <TableCell colSpan={8} align="center">
+                      {executionsPaging.loading ? (
+                        <CircularProgress size={24} />
+                      ) : (
+                        <Button size="small" onClick={loadMoreExecutions}>
+                          Load older executions
+                        </Button>
+                      )}
+                    </TableCell>
+                  </TableRow>
+                )}
               </TableBody>
             </Table>
           </TableContainer>
@@ -2175,46 +2315,27 @@ const WorkflowDetailPage = () => {
         Execution Logs - ID: {logsDialog.executionId}
       </DialogTitle>
       <DialogContent>
-        {logsDialog.logs.length === 0 ? (
-          <Typography color="text.secondary">
-            No logs available for this execution.
-          </Typography>
+        {logsDialog.loading && <LinearProgress sx={{ mb: 2 }} />}
+        {logsDialog.error && (
+          <Alert severity="error" sx={{ mb: 2 }}>
+            {logsDialog.error}
+          </Alert>
+        )}
+        {!logsDialog.store || logsDialog.store.entries.length === 0 ? (
+          !logsDialog.loading && !logsDialog.error && (
+            <Typography color="text.secondary">
+              No logs available for this execution.
+            </Typography>
+          )
         ) : (
-          <Box
-            component="pre"
-            sx={{
-              backgroundColor: '#f5f5f5',
-              padding: 2,
-              borderRadius: 1,
-              overflow: 'auto',
-              maxHeight: '500px',
-              fontFamily: 'monospace',
-              fontSize: '0.875rem',
-              lineHeight: 1.6,
-              whiteSpace: 'pre-wrap',
-              wordBreak: 'break-word',
-              '&::-webkit-scrollbar': { display: 'none' },
-              msOverflowStyle: 'none',
-              scrollbarWidth: 'none',
-            }}
-          >
-            {logsDialog.logs.map((log, index) => (
-              <Box key={index} sx={{ mb: 0.5 }}>
-                <Typography
-                  component="span"
-                  sx={{
-                    color: log.toLowerCase().includes('error') || log.toLowerCase().includes('failed') ? 'error.main' :
-                           log.toLowerCase().includes('success') || log.toLowerCase().includes('completed') ? 'success.main' :
-                           'text.primary',
-                    fontFamily: 'monospace',
-                    fontSize: '0.875rem'
-                  }}
-                >
-                  {index + 1}. {log}
-                </Typography>
-              </Box>
-            ))}
-          </Box>
+          <ExecutionLogsViewer
+            key={logsDialog.executionId}
+            store={logsDialog.store}
+            version={logsDialog.version}
+            live={executions.some(execution =>
+              sameId(execution.id, logsDialog.executionId) && ACTIVE_STATUSES.includes(execution.status)
+            )}
+          />
         )}
       </DialogContent>
       <DialogActions>
@@ -0,0 +1,27 @@
+import { useEffect, useRef } from 'react';
+import { watchExecution } from '../services/executionPoller';
+
+/**
+ * Hook to receive status updates for executions from the shared poller
+ * @param {string|number} workflowId - Workflow the executions belong to
+ * @param {Array<string|number>} executionIds - Executions to watch (the active ones)
+ * @param {boolean} enabled - Whether to poll at all (e.g. only while the progress stream is down)
+ * @param {Function} onUpdate - Called with an execution's status data each time it changes
+ *
+ * @example
+ * useExecutionPolling(workflowId, runningIds, streamState === 'unavailable', (update) => patchRow(update));
+ */
+export const useExecutionPolling = (workflowId, executionIds, enabled, onUpdate) => {
+  const onUpdateRef = useRef(onUpdate);
+  onUpdateRef.current = onUpdate;
+  // Re-subscribe only when the set of ids changes, not on every render
+  const idsKey = executionIds.join(',');
+
+  useEffect(() => {
+    if (!workflowId || !enabled || !idsKey) return undefined;
+    const unwatchers = idsKey.split(',').map(executionId =>
+      watchExecution(workflowId, executionId, (update) => onUpdateRef.current?.(update))
+    );
+    return () => unwatchers.forEach(unwatch => unwatch());
+  }, [workflowId, idsKey, enabled]);
+};
@@ -0,0 +1,46 @@
+import { useState, useEffect, useRef } from 'react';
+import { openExecutionStream } from '../services/executionStream';
+
+/**
+ * Hook to follow a workflow's executions over the progress stream
+ * @param {string|number} workflowId - Workflow to follow
+ * @param {boolean} active - Whether the stream should be open (e.g. an execution is running)
+ * @param {Object} handlers - onExecution(update) and onLog(line), called for every event
+ * @returns {string} 'idle', 'connecting', 'open', 'retrying' or 'unavailable'
+ *
+ * The stream is only open while active is true, so pages with nothing
+ * running hold no connection. 'unavailable' means the server has no
+ * stream endpoint (or refused it); the page keeps working with manual refresh.
+ *
+ * @example
+ * const streamState = useExecutionStream(workflowId, hasActiveExecution, {
+ *   onExecution: (update) => patchExecution(update),
+ *   onLog: (line) => appendLog(line),
+ * });
+ */
+export const useExecutionStream = (workflowId, active, handlers) => {
+  const [state, setState] = useState('idle');
+  const handlersRef = useRef(handlers);
+  handlersRef.current = handlers;
+
+  useEffect(() => {
+    if (!workflowId || !active) {
+      setState('idle');
+      return undefined;
+    }
+
+    setState('connecting');
+    const close = openExecutionStream(workflowId, {
+      onOpen: () => setState('open'),
+      onExecution: (update) => handlersRef.current.onExecution?.(update),
+      onLog: (line) => handlersRef.current.onLog?.(line),
+      onError: (err, willRetry) => {
+        console.error('Execution stream error:', err.message);
+        setState(willRetry ? 'retrying' : 'unavailable');
+      },
+    });
+    return close;
+  }, [workflowId, active]);
+
+  return state;
+};
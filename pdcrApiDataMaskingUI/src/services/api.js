@@ -236,21 +236,48 @@ export const serverWorkflowsAPI = {
   update: (id, workflowData) => piiApi.put('/datamasking/workflows/update', { id, ...workflowData }),
   delete: (id) => piiApi.delete('/datamasking/workflows/delete', { data: { id } }),
 
-  // Execution history
-  getExecutions: (workflowId) => piiApi.post('/datamasking/workflows/executions', { workflow_id: workflowId }),
+  // Execution history, newest first, one page at a time: pass the response's
+  // next_before_id as beforeId for the next page while has_more is true
+  getExecutions: (workflowId, { beforeId, limit } = {}) =>
+    piiApi.post('/datamasking/workflows/executions', { workflow_id: workflowId, before_id: beforeId, limit }),
 
   // PII attributes (reuses same endpoint as two-server system)
   getPiiAttributes: () => piiApi.get('/datamasking/workflows/pii-attributes'),
 };
 
+// Status requests in flight, by workflow and execution: callers asking for
+// the same execution's status at the same time share one request
+const inFlightStatusRequests = new Map();
+
 // Server Execution/Masking API
 export const serverMaskingAPI = {
   // Execute workflow (in-place UPDATE)
   executeWorkflow: (workflowId) => piiApi.post('/datamasking/workflows/execute', { workflow_id: workflowId }),
 
-  // Get execution status
-  getExecutionStatus: (workflowId, executionId) =>
-    piiApi.post('/datamasking/workflows/executions/status', { workflow_id: workflowId, execution_id: executionId }),
+  // Get execution status (identical concurrent calls share one request)
+  getExecutionStatus: (workflowId, executionId) => {
+    const key = `${workflowId}:${executionId}`;
+    if (!inFlightStatusRequests.has(key)) {
+      const request = piiApi.post('/datamasking/workflows/executions/status', { workflow_id: workflowId, execution_id: executionId });
+      inFlightStatusRequests.set(key, request.finally(() => inFlightStatusRequests.delete(key)));
+    }
+    return inFlightStatusRequests.get(key);
+  },
+
+  // Execution log lines ({ seq, message }) after afterSeq, oldest first, at
+  // most limit per page; pass next_after_seq back while has_more is true
+  getExecutionLogs: (workflowId, executionId, { afterSeq = 0, limit } = {}) =>
+    piiApi.post('/datamasking/workflows/executions/logs', {
+      workflow_id: workflowId,
+      execution_id: executionId,
+      after_seq: afterSeq,
+      limit,
+    }),
+
+  // URL of the execution progress stream (Server-Sent Events); it is read
+  // with fetch() by services/executionStream.js, not through axios
+  getExecutionStreamUrl: (workflowId) =>
+    `${POC_API_BASE_URL}/datamasking/workflows/executions/stream?workflow_id=${encodeURIComponent(workflowId)}`,
 
   // Stop running execution
   stopExecution: (workflowId, executionId) =>
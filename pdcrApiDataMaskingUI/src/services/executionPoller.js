@@ -0,0 +1,128 @@
+import { serverMaskingAPI } from './api';
+
+// =====================================================
+// Shared execution status poller
+//
+// Fallback for when the execution progress stream (executionStream.js) is
+// not available. Every component that wants status updates watches an
+// execution here instead of running its own timer, so N open pages
+// watching the same run cost one request per interval:
+//
+// - only queued, running and paused executions are polled; an execution
+//   is dropped once it reports any other status
+// - each execution's interval starts at POLL_MIN_MS and doubles (up to
+//   POLL_MAX_MS) every time a poll returns nothing new
+// - nothing is polled while the tab is hidden; when it becomes visible
+//   again every watched execution is polled at once
+// - one timer serves all watched executions
+//
+// serverMaskingAPI.getExecutionStatus itself shares identical requests that
+// are in flight at the same time.
+// =====================================================
+
+export const ACTIVE_STATUSES = ['queued', 'running', 'paused'];
+
+const POLL_MIN_MS = 2000;
+const POLL_MAX_MS = 60000;
+
+// `${workflowId}:${executionId}` -> { workflowId, executionId, listeners, delay, dueAt, latest, snapshot }
+const watched = new Map();
+let timer = null;
+
+const isHidden = () => typeof document !== 'undefined' && document.hidden;
+
+const schedule = () => {
+  clearTimeout(timer);
+  timer = null;
+  if (watched.size === 0 || isHidden()) return;
+  const dueAt = Math.min(...Array.from(watched.values(), entry => entry.dueAt));
+  if (dueAt !== Infinity) {
+    timer = setTimeout(tick, Math.max(0, dueAt - Date.now()));
+  }
+};
+
+const poll = async (key, entry) => {
+  entry.dueAt = Infinity; // not due again until this poll is done
+  try {
+    const response = await serverMaskingAPI.getExecutionStatus(entry.workflowId, entry.executionId);
+    const data = response.data?.data || response.data || {};
+    const update = { ...data, id: data.id ?? data.execution_id ?? entry.executionId };
+    const snapshot = JSON.stringify(update);
+    if (snapshot !== entry.snapshot) {
+      entry.snapshot = snapshot;
+      entry.latest = update;
+      entry.delay = POLL_MIN_MS;
+      entry.listeners.forEach(listener => listener(update));
+    } else {
+      entry.delay = Math.min(entry.delay * 2, POLL_MAX_MS);
+    }
+    if (!ACTIVE_STATUSES.includes(update.status) && watched.get(key) === entry) {
+      watched.delete(key); // finished: nothing more to poll
+    }
+  } catch (err) {
+    console.error('Failed to check execution status:', err.message);
+    entry.delay = Math.min(entry.delay * 2, POLL_MAX_MS);
+  } finally {
+    entry.dueAt = Date.now() + entry.delay;
+    schedule();
+  }
+};
+
+const tick = () => {
+  const now = Date.now();
+  watched.forEach((entry, key) => {
+    if (entry.dueAt <= now) poll(key, entry);
+  });
+  schedule();
+};
+
+if (typeof document !== 'undefined') {
+  document.addEventListener('visibilitychange', () => {
+    if (!isHidden()) {
+      watched.forEach(entry => {
+        entry.delay = POLL_MIN_MS;
+        if (entry.dueAt !== Infinity) entry.dueAt = Date.now();
+      });
+    }
+    schedule();
+  });
+}
+
+/**
+ * Get status updates for an execution until it finishes
+ * @param {string|number} workflowId - Workflow the execution belongs to
+ * @param {string|number} executionId - Execution to watch
+ * @param {Function} listener - Called with the execution's status data each time it changes
+ * @returns {Function} unwatch - Stops this listener; polling stops when no listener is left
+ *
+ * @example
+ * const unwatch = watchExecution(workflowId, executionId, (update) => patchRow(update));
+ */
+export const watchExecution = (workflowId, executionId, listener) => {
+  const key = `${workflowId}:${executionId}`;
+  let entry = watched.get(key);
+  if (!entry) {
+    entry = {
+      workflowId,
+      executionId,
+      listeners: new Set(),
+      delay: POLL_MIN_MS,
+      dueAt: Date.now(),
+      latest: null,
+      snapshot: null,
+    };
+    watched.set(key, entry);
+  } else if (entry.latest) {
+    listener(entry.latest);
+  }
+  entry.listeners.add(listener);
+  schedule();
+
+  return () => {
+    entry.listeners.delete(listener);
+    if (entry.listeners.size === 0 && watched.get(key) === entry) {
+      watched.delete(key);
+    }
+    schedule();
+  };
+};
@@ -0,0 +1,120 @@
+jest.mock('./api', () => ({
+  serverMaskingAPI: { getExecutionStatus: jest.fn() },
+}));
+
+let serverMaskingAPI;
+let watchExecution;
+
+// Let the awaited status request and its finally block run
+const flushPromises = async () => {
+  for (let i = 0; i < 5; i += 1) {
+    await Promise.resolve();
+  }
+};
+
+// Run the timers due in ms, then the polls they started
+const advance = async (ms) => {
+  jest.advanceTimersByTime(ms);
+  await flushPromises();
+};
+
+const respond = (data) => serverMaskingAPI.getExecutionStatus.mockResolvedValue({ data: { data } });
+
+beforeEach(() => {
+  jest.useFakeTimers();
+  jest.resetModules();
+  // Fresh module state (watched executions, timer) for every test
+  serverMaskingAPI = require('./api').serverMaskingAPI;
+  watchExecution = require('./executionPoller').watchExecution;
+});
+
+afterEach(() => {
+  jest.useRealTimers();
+});
+
+test('watchers of the same execution share one request per poll', async () => {
+  respond({ id: 3, status: 'running', records_processed: 10 });
+  const first = jest.fn();
+  const second = jest.fn();
+  const unwatchFirst = watchExecution(1, 3, first);
+  const unwatchSecond = watchExecution(1, 3, second);
+
+  await advance(0);
+  expect(serverMaskingAPI.getExecutionStatus).toHaveBeenCalledTimes(1);
+  expect(first).toHaveBeenCalledWith({ id: 3, status: 'running', records_processed: 10 });
+  expect(second).toHaveBeenCalledWith({ id: 3, status: 'running', records_processed: 10 });
+
+  // A late watcher gets the latest status at once, without a request
+  const third = jest.fn();
+  const unwatchThird = watchExecution(1, 3, third);
+  expect(third).toHaveBeenCalledWith({ id: 3, status: 'running', records_processed: 10 });
+  expect(serverMaskingAPI.getExecutionStatus).toHaveBeenCalledTimes(1);
+
+  unwatchFirst();
+  unwatchSecond();
+  unwatchThird();
+});
+
+test('backs off while nothing changes and resets when it does', async () => {
+  respond({ id: 3, status: 'running', records_processed: 10 });
+  const listener = jest.fn();
+  const unwatch = watchExecution(1, 3, listener);
+  const calls = () => serverMaskingAPI.getExecutionStatus.mock.calls.length;
+
+  await advance(0);
+  expect(calls()).toBe(1);
+
+  // Unchanged: the interval doubles from 2s (2s, 4s, 8s)
+  await advance(2000);
+  expect(calls()).toBe(2);
+  await advance(3999);
+  expect(calls()).toBe(2);
+  await advance(1);
+  expect(calls()).toBe(3);
+  await advance(8000);
+  expect(calls()).toBe(4);
+  expect(listener).toHaveBeenCalledTimes(1);
+
+  // Progress: back to 2s
+  respond({ id: 3, status: 'running', records_processed: 20 });
+  await advance(16000);
+  expect(calls()).toBe(5);
+  expect(listener).toHaveBeenCalledTimes(2);
+  await advance(2000);
+  expect(calls()).toBe(6);
+
+  unwatch();
+});
+
+test('never waits longer than a minute between polls', async () => {
+  respond({ id: 3, status: 'paused' });
+  const unwatch = watchExecution(1, 3, jest.fn());
+  await advance(0);
+  for (let ms = 2000; ms < 60000; ms *= 2) {
+    await advance(ms);
+  }
+  const calls = serverMaskingAPI.getExecutionStatus.mock.calls.length;
+  await advance(60000);
+  expect(serverMaskingAPI.getExecutionStatus).toHaveBeenCalledTimes(calls + 1);
+  unwatch();
+});
+
+test('stops polling once the execution finishes or nobody watches it', async () => {
+  respond({ id: 3, status: 'running' });
+  const listener = jest.fn();
+  watchExecution(1, 3, listener);
+  await advance(0);
+
+  respond({ id: 3, status: 'completed' });
+  await advance(2000);
+  expect(listener).toHaveBeenLastCalledWith({ id: 3, status: 'completed' });
+  await advance(120000);
+  expect(serverMaskingAPI.getExecutionStatus).toHaveBeenCalledTimes(2);
+
+  respond({ id: 4, status: 'running' });
+  const unwatch = watchExecution(1, 4, jest.fn());
+  await advance(0);
+  unwatch();
+  await advance(120000);
+  expect(serverMaskingAPI.getExecutionStatus).toHaveBeenCalledTimes(3);
+});
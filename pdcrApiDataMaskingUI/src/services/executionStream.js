@@ -0,0 +1,155 @@
+import { getAuthToken } from '../utils/auth';
+import { serverMaskingAPI } from './api';
+
+// =====================================================
+// Execution progress stream (Server-Sent Events)
+//
+// GET /datamasking/workflows/executions/stream?workflow_id=<id> keeps one
+// response open and pushes, for the workflow's queued, running and paused
+// executions only:
+//
+//   event: execution   data: { id, status, records_processed, records_total,
+//                              last_completed_batch, total_batches,
+//                              started_at, completed_at }
+//   event: log         data: { execution_id, seq, message }
+//
+// plus one last execution event when a run completes, fails or is stopped.
+// seq is the 1-based position of the line in the execution's log. Comment
+// lines (": ping") keep idle connections open through proxies.
+//
+// EventSource cannot send the Authorization header, so the stream is read
+// with fetch() and parsed here. A dropped connection is reopened with
+// backoff, sending Last-Event-ID so the server can replay what was missed.
+// =====================================================
+
+const RETRY_MIN_MS = 1000;
+const RETRY_MAX_MS = 30000;
+
+// Statuses that get no retry: the endpoint is missing or the user may not use it
+const FATAL_STATUSES = [401, 403, 404, 405, 501];
+
+/**
+ * Split buffered stream text into complete events
+ * A trailing \r is left in rest: it may be the first half of a \r\n that
+ * the next chunk completes, and read alone it would end the line twice.
+ * @param {string} buffer - Text received so far that has not been parsed yet
+ * @returns {{events: Array<{event: string, data: string, id: string|null}>, rest: string}}
+ */
+export const parseEvents = (buffer) => {
+  const events = [];
+  const held = buffer.endsWith('\r') ? '\r' : '';
+  const blocks = buffer.slice(0, buffer.length - held.length).replace(/\r\n?/g, '\n').split('\n\n');
+  const rest = blocks.pop() + held;
+
+  blocks.forEach((block) => {
+    let event = 'message';
+    let id = null;
+    const data = [];
+    block.split('\n').forEach((line) => {
+      if (!line || line.startsWith(':')) return;
+      const colon = line.indexOf(':');
+      const field = colon === -1 ? line : line.slice(0, colon);
+      const value = colon === -1 ? '' : line.slice(colon + 1).replace(/^ /, '');
+      if (field === 'event') event = value;
+      else if (field === 'data') data.push(value);
+      else if (field === 'id') id = value;
+    });
+    if (data.length > 0) {
+      events.push({ event, data: data.join('\n'), id });
+    }
+  });
+
+  return { events, rest };
+};
+
+/**
+ * Open the execution progress stream of a workflow
+ * @param {string|number} workflowId - Workflow whose executions to follow
+ * @param {Object} handlers - onExecution(update), onLog(line), onOpen(), onError(error, willRetry)
+ * @returns {Function} close - Stops the stream and any pending reconnect
+ *
+ * @example
+ * const close = openExecutionStream(workflowId, {
+ *   onExecution: (update) => patchRow(update),
+ *   onLog: (line) => appendLog(line),
+ * });
+ */
+export const openExecutionStream = (workflowId, handlers = {}) => {
+  const { onExecution, onLog, onOpen, onError } = handlers;
+  let controller = null;
+  let retryTimer = null;
+  let retryDelay = RETRY_MIN_MS;
+  let lastEventId = null;
+  let closed = false;
+
+  const dispatch = ({ event, data, id }) => {
+    if (id) lastEventId = id;
+    let payload;
+    try {
+      payload = JSON.parse(data);
+    } catch (err) {
+      console.error('Ignoring malformed stream event:', data);
+      return;
+    }
+    if (event === 'execution') onExecution?.(payload);
+    else if (event === 'log') onLog?.(payload);
+  };
+
+  const scheduleRetry = (error) => {
+    if (closed) return;
+    onError?.(error, true);
+    retryTimer = setTimeout(connect, retryDelay);
+    retryDelay = Math.min(retryDelay * 2, RETRY_MAX_MS);
+  };
+
+  const connect = async () => {
+    controller = new AbortController();
+    const headers = { Accept: 'text/event-stream' };
+    const token = getAuthToken();
+    if (token) headers.Authorization = `Bearer ${token}`;
+    if (lastEventId) headers['Last-Event-ID'] = lastEventId;
+
+    try {
+      const response = await fetch(serverMaskingAPI.getExecutionStreamUrl(workflowId), {
+        headers,
+        signal: controller.signal,
+        cache: 'no-store',
+      });
+      if (!response.ok || !response.body) {
+        const error = new Error(`Execution stream unavailable (HTTP ${response.status})`);
+        error.status = response.status;
+        if (FATAL_STATUSES.includes(response.status)) {
+          onError?.(error, false);
+        } else {
+          scheduleRetry(error);
+        }
+        return;
+      }
+
+      retryDelay = RETRY_MIN_MS;
+      onOpen?.();
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      for (;;) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const parsed = parseEvents(buffer);
+        buffer = parsed.rest;
+        parsed.events.forEach(dispatch);
+      }
+      scheduleRetry(new Error('Execution stream closed by the server'));
+    } catch (err) {
+      scheduleRetry(err);
+    }
+  };
+
+  connect();
+
+  return () => {
+    closed = true;
+    clearTimeout(retryTimer);
+    controller?.abort();
+  };
+};
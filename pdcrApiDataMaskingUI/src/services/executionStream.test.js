@@ -0,0 +1,50 @@
+import { parseEvents } from './executionStream';
+
+const STREAM =
+  ': ping\r\n\r\n' +
+  'event: execution\r\nid: 7\r\ndata: {"id":3,"status":"running"}\r\n\r\n' +
+  'event: log\r\ndata: {"execution_id":3,"seq":1,"message":"Started"}\r\n\r\n' +
+  'data: first\r\ndata: second\r\n\r\n';
+
+const EXPECTED = [
+  { event: 'execution', data: '{"id":3,"status":"running"}', id: '7' },
+  { event: 'log', data: '{"execution_id":3,"seq":1,"message":"Started"}', id: null },
+  { event: 'message', data: 'first\nsecond', id: null },
+];
+
+// Feed the stream in chunks the way the reader loop does
+const parseChunks = (chunks) => {
+  const events = [];
+  let buffer = '';
+  chunks.forEach((chunk) => {
+    const parsed = parseEvents(buffer + chunk);
+    buffer = parsed.rest;
+    events.push(...parsed.events);
+  });
+  return { events, rest: buffer };
+};
+
+test('parses a complete stream', () => {
+  expect(parseEvents(STREAM)).toEqual({ events: EXPECTED, rest: '' });
+});
+
+test('gives the same events wherever a chunk boundary falls', () => {
+  for (let split = 0; split <= STREAM.length; split += 1) {
+    expect(parseChunks([STREAM.slice(0, split), STREAM.slice(split)])).toEqual({ events: EXPECTED, rest: '' });
+  }
+});
+
+test('gives the same events when the stream arrives one character at a time', () => {
+  expect(parseChunks(STREAM.split(''))).toEqual({ events: EXPECTED, rest: '' });
+});
+
+test('does not end an event at a \\r\\n split between chunks', () => {
+  const first = parseEvents('data: one\r');
+  expect(first.events).toEqual([]);
+  const second = parseEvents(first.rest + '\ndata: two\r\n\r\n');
+  expect(second.events).toEqual([{ event: 'message', data: 'one\ntwo', id: null }]);
+});
+
+test('accepts bare \\n and \\r line endings', () => {
+  expect(parseEvents('data: a\n\ndata: b\r\rdata: c').events.map(event => event.data)).toEqual(['a', 'b']);
+});
@@ -0,0 +1,42 @@
+// Execution history pages (keyset pagination, newest first)
+
+// Execution ids arrive as numbers from some endpoints and strings from others
+export const sameId = (a, b) => a != null && b != null && String(a) === String(b);
+
+/**
+ * Read one page of the executions endpoint
+ * Backends without paging return a bare array (or { data: [...] } without
+ * has_more), which reads as a single last page.
+ * @param {Object} response - axios response of serverWorkflowsAPI.getExecutions
+ * @returns {{items: Array<Object>, hasMore: boolean, nextBeforeId: (string|number|null)}}
+ *
+ * @example
+ * const { items, hasMore, nextBeforeId } = readExecutionsPage(response);
+ */
+export const readExecutionsPage = (response) => {
+  const body = response.data || {};
+  const items = Array.isArray(body.data) ? body.data : (Array.isArray(body) ? body : []);
+  return {
+    items,
+    hasMore: Boolean(body.has_more),
+    nextBeforeId: body.next_before_id ?? items[items.length - 1]?.id ?? null,
+  };
+};
+
+/**
+ * Append an older page to the executions already shown
+ * Rows already present are skipped: an execution started since the first
+ * page was fetched (and streamed in on top) shifts older rows by one, so
+ * the next page can repeat the last row shown.
+ * @param {Array<Object>} executions - Rows shown so far, newest first
+ * @param {Array<Object>} items - Rows of the next page
+ * @returns {Array<Object>} executions followed by the new rows of items
+ *
+ * @example
+ * setExecutions(prev => appendExecutionsPage(prev, page.items));
+ */
+export const appendExecutionsPage = (executions, items) => {
+  const shown = new Set(executions.map(execution => String(execution.id)));
+  const added = items.filter(item => !shown.has(String(item.id)));
+  return added.length > 0 ? [...executions, ...added] : executions;
+};
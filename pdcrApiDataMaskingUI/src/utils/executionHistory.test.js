@@ -0,0 +1,35 @@
+import { appendExecutionsPage, readExecutionsPage, sameId } from './executionHistory';
+
+const rows = (...ids) => ids.map(id => ({ id, status: 'completed' }));
+
+test('reads the keyset cursor of a page', () => {
+  const page = readExecutionsPage({ data: { data: rows(50, 49), has_more: true, next_before_id: 49 } });
+  expect(page).toEqual({ items: rows(50, 49), hasMore: true, nextBeforeId: 49 });
+});
+
+test('falls back to the last row when the cursor is missing', () => {
+  expect(readExecutionsPage({ data: { data: rows(50, 49), has_more: true } }).nextBeforeId).toBe(49);
+});
+
+test('reads an unpaged response as a single last page', () => {
+  expect(readExecutionsPage({ data: rows(2, 1) })).toEqual({ items: rows(2, 1), hasMore: false, nextBeforeId: 1 });
+  expect(readExecutionsPage({ data: {} })).toEqual({ items: [], hasMore: false, nextBeforeId: null });
+});
+
+test('appends an older page after the rows shown', () => {
+  expect(appendExecutionsPage(rows(5, 4), rows(3, 2)).map(row => row.id)).toEqual([5, 4, 3, 2]);
+});
+
+test('skips rows a newer execution pushed onto the next page', () => {
+  // 6 started (and was streamed in on top) after the first page, so the
+  // next page starts with 4 again; ids may come back as strings
+  const shown = rows(6, 5, 4);
+  expect(appendExecutionsPage(shown, rows('4', 3)).map(row => row.id)).toEqual([6, 5, 4, 3]);
+  expect(appendExecutionsPage(shown, rows(4))).toBe(shown);
+});
+
+test('compares ids of either type', () => {
+  expect(sameId(4, '4')).toBe(true);
+  expect(sameId(4, 5)).toBe(false);
+  expect(sameId(null, null)).toBe(false);
+});
@@ -0,0 +1,163 @@
+// Execution log lines, indexed by level and word as they arrive
+
+export const LOG_LEVEL_NAMES = ['error', 'warning', 'success', 'info'];
+
+// Level of a lowercased line. error/success keywords are the ones the logs
+// dialog has always colored by; 'warn' is new with the level filter
+export const logLevel = (lower) => {
+  if (lower.includes('error') || lower.includes('failed')) return 'error';
+  if (lower.includes('warn')) return 'warning';
+  if (lower.includes('success') || lower.includes('completed')) return 'success';
+  return 'info';
+};
+
+// Put entry in list (sorted by seq); returns false if it had to go before the end
+const insertBySeq = (list, entry) => {
+  if (list.length === 0 || list[list.length - 1].seq < entry.seq) {
+    list.push(entry);
+    return true;
+  }
+  let low = 0;
+  let high = list.length;
+  while (low < high) {
+    const middle = (low + high) >> 1;
+    if (list[middle].seq < entry.seq) low = middle + 1;
+    else high = middle;
+  }
+  list.splice(low, 0, entry);
+  return false;
+};
+
+const removeEntry = (list, entry) => {
+  const position = list.indexOf(entry);
+  if (position !== -1) list.splice(position, 1);
+};
+
+// Words of a lowercased line or query, as in docs/docs_index.py
+const TOKEN_RE = /\w+/g;
+const lineTokens = (lower) => new Set(lower.match(TOKEN_RE) || []);
+
+// Filter results kept for extending (the last few filters typed)
+const MAX_CACHED_FILTERS = 10;
+
+/**
+ * Create the log store of one execution
+ * Lines ({ seq, message }) may arrive in any order and more than once, e.g.
+ * a fetched page overlapping lines already streamed. Each line is lowercased,
+ * classified and split into words once, when it arrives, and appended to
+ * `entries` (all lines by seq), to its level's list in `byLevel` and to the
+ * posting list of each of its words, so a streamed line costs O(words)
+ * however long the log is. A line that arrives before an earlier seq, or
+ * replaces a line, is put in place and bumps `reorders`.
+ *
+ * filter(levels, needle) gives the lines of the levels containing needle.
+ * The candidates are the lines in the posting lists of every word of the
+ * needle, which are then checked for the needle as a substring. The first
+ * and last word of the needle may be cut off ('time' while typing
+ * 'timeout'), so they match every indexed word ending/starting with them;
+ * a needle without words (e.g. '::') checks every line of the levels.
+ * Results are cached per filter and extended with the lines appended since,
+ * so a streamed line does not re-filter the whole log; they are rebuilt
+ * when `reorders` changes.
+ *
+ * @param {string|number} executionId - Execution the lines belong to
+ * @returns {Object} store - { executionId, entries, byLevel, reorders, version, write(lines), filter(levels, needle) }
+ *
+ * @example
+ * const store = createLogStore(execution.id);
+ * store.write(response.data.data);           // [{ seq, message }, ...]
+ * store.byLevel.error.length;                // number of error lines
+ * store.filter(['error', 'warning'], 'timeout');
+ */
+export const createLogStore = (executionId) => {
+  const bySeq = new Map();
+  const postings = new Map();  // word -> entries containing it, by seq
+  const filters = new Map();   // 'levels|needle' -> { reorders, seen, matches }
+
+  // Lines that can contain needle: the intersection of its words' postings,
+  // or null if the needle has no words
+  const candidates = (needle) => {
+    const words = [...needle.matchAll(TOKEN_RE)];
+    if (words.length === 0) return null;
+    const sets = words.map(({ 0: word, index }) => {
+      const partialStart = index === 0;
+      const partialEnd = index + word.length === needle.length;
+      if (!partialStart && !partialEnd) return new Set(postings.get(word));
+      const lines = new Set();
+      postings.forEach((list, indexed) => {
+        const fits = partialStart && partialEnd ? indexed.includes(word)
+          : partialStart ? indexed.endsWith(word) : indexed.startsWith(word);
+        if (fits) list.forEach(entry => lines.add(entry));
+      });
+      return lines;
+    });
+    sets.sort((a, b) => a.size - b.size);
+    const [smallest, ...rest] = sets;
+    return [...smallest]
+      .filter(entry => rest.every(set => set.has(entry)))
+      .sort((a, b) => a.seq - b.seq);
+  };
+
+  const store = {
+    executionId,
+    entries: [],
+    byLevel: Object.fromEntries(LOG_LEVEL_NAMES.map(level => [level, []])),
+    reorders: 0,
+    version: 0,
+    // Add lines; returns true if any was new or changed
+    write: (lines) => {
+      let changed = false;
+      lines.forEach(({ seq, message }) => {
+        const text = message == null ? '' : String(message);
+        const previous = bySeq.get(seq);
+        if (previous && previous.text === text) return;
+
+        const lower = text.toLowerCase();
+        const entry = { seq, text, lower, level: logLevel(lower) };
+        if (previous) {
+          removeEntry(store.entries, previous);
+          removeEntry(store.byLevel[previous.level], previous);
+          lineTokens(previous.lower).forEach(word => removeEntry(postings.get(word), previous));
+          store.reorders += 1;
+        }
+        bySeq.set(seq, entry);
+        if (!insertBySeq(store.entries, entry) && !previous) store.reorders += 1;
+        insertBySeq(store.byLevel[entry.level], entry);
+        lineTokens(lower).forEach((word) => {
+          if (!postings.has(word)) postings.set(word, []);
+          insertBySeq(postings.get(word), entry);
+        });
+        changed = true;
+      });
+      if (changed) store.version += 1;
+      return changed;
+    },
+    // Lines of the given levels containing needle (lowercased), by seq
+    filter: (levels, needle = '') => {
+      if (!needle && levels.length === LOG_LEVEL_NAMES.length) return store.entries;
+      if (!needle && levels.length === 1) return store.byLevel[levels[0]];
+
+      const accepts = entry => levels.includes(entry.level) && entry.lower.includes(needle);
+      const key = `${levels.join(',')}|${needle}`;
+      const cached = filters.get(key);
+      if (cached && cached.reorders === store.reorders) {
+        for (let i = cached.seen; i < store.entries.length; i += 1) {
+          if (accepts(store.entries[i])) cached.matches.push(store.entries[i]);
+        }
+        cached.seen = store.entries.length;
+        filters.delete(key);
+        filters.set(key, cached);
+        return cached.matches;
+      }
+
+      const lines = (needle && candidates(needle)) ||
+        (levels.length === 1 ? store.byLevel[levels[0]] : store.entries);
+      const filtered = { reorders: store.reorders, seen: store.entries.length, matches: lines.filter(accepts) };
+      filters.delete(key);
+      filters.set(key, filtered);
+      if (filters.size > MAX_CACHED_FILTERS) filters.delete(filters.keys().next().value);
+      return filtered.matches;
+    },
+  };
+  return store;
+};
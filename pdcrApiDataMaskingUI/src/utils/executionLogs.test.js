@@ -0,0 +1,77 @@
+import { createLogStore, LOG_LEVEL_NAMES, logLevel } from './executionLogs';
+
+const seqs = (entries) => entries.map(entry => entry.seq);
+
+test('classifies lines by keyword', () => {
+  expect(logLevel('batch 3 failed')).toBe('error');
+  expect(logLevel('warning: 2 rows skipped')).toBe('warning');
+  expect(logLevel('execution completed')).toBe('success');
+  expect(logLevel('processing batch 4')).toBe('info');
+});
+
+test('appends lines in order to the full and per-level lists', () => {
+  const store = createLogStore(3);
+  store.write([{ seq: 1, message: 'Started' }, { seq: 2, message: 'ERROR: timeout' }]);
+  store.write([{ seq: 3, message: 'Batch 1 completed' }]);
+  expect(seqs(store.entries)).toEqual([1, 2, 3]);
+  expect(seqs(store.byLevel.error)).toEqual([2]);
+  expect(seqs(store.byLevel.success)).toEqual([3]);
+  expect(store.reorders).toBe(0);
+  expect(store.version).toBe(2);
+});
+
+test('merges a fetched page with lines streamed meanwhile', () => {
+  const store = createLogStore(3);
+  // Lines 3-4 are streamed before the page with lines 1-3 arrives
+  store.write([{ seq: 3, message: 'c' }, { seq: 4, message: 'd' }]);
+  store.write([{ seq: 1, message: 'a' }, { seq: 2, message: 'b' }, { seq: 3, message: 'c' }]);
+  expect(store.entries.map(entry => entry.text)).toEqual(['a', 'b', 'c', 'd']);
+  expect(seqs(store.byLevel.info)).toEqual([1, 2, 3, 4]);
+  expect(store.reorders).toBeGreaterThan(0);
+});
+
+test('ignores lines it already has and replaces changed ones', () => {
+  const store = createLogStore(3);
+  store.write([{ seq: 1, message: 'a' }, { seq: 2, message: 'failed' }]);
+  expect(store.write([{ seq: 2, message: 'failed' }])).toBe(false);
+  expect(store.version).toBe(1);
+
+  expect(store.write([{ seq: 2, message: 'retried' }])).toBe(true);
+  expect(store.entries.map(entry => entry.text)).toEqual(['a', 'retried']);
+  expect(store.byLevel.error).toEqual([]);
+  expect(seqs(store.byLevel.info)).toEqual([1, 2]);
+});
+
+test('filters by level and substring, including cut-off words', () => {
+  const store = createLogStore(3);
+  store.write([
+    { seq: 1, message: 'Batch 1 timeout on orders' },
+    { seq: 2, message: 'ERROR: timeout on customers' },
+    { seq: 3, message: 'Batch 2 completed' },
+    { seq: 4, message: 'ERROR: orders::customers mismatch' },
+  ]);
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, 'timeout'))).toEqual([1, 2]);
+  expect(seqs(store.filter(['error'], 'timeout'))).toEqual([2]);
+  // 'time' and 'eout on' are parts of words; 'meou' is inside one
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, 'time'))).toEqual([1, 2]);
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, 'eout on cust'))).toEqual([2]);
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, 'meou'))).toEqual([1, 2]);
+  // Both words present but not as one substring
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, 'batch completed'))).toEqual([]);
+  // No words: every line is checked
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, '::'))).toEqual([4]);
+  expect(store.filter(LOG_LEVEL_NAMES, '')).toBe(store.entries);
+});
+
+test('extends a filter with new lines and rebuilds it after a reorder', () => {
+  const store = createLogStore(3);
+  store.write([{ seq: 2, message: 'timeout' }]);
+  const matches = store.filter(LOG_LEVEL_NAMES, 'timeout');
+  store.write([{ seq: 3, message: 'timeout again' }, { seq: 4, message: 'done' }]);
+  expect(store.filter(LOG_LEVEL_NAMES, 'timeout')).toBe(matches);
+  expect(seqs(matches)).toEqual([2, 3]);
+
+  store.write([{ seq: 1, message: 'first timeout' }, { seq: 3, message: 'recovered' }]);
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, 'timeout'))).toEqual([1, 2]);
+  expect(seqs(store.filter(LOG_LEVEL_NAMES, 'recover'))).toEqual([3]);
+});